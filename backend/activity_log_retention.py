@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Enforce the activity_logs retention window.
+
+Expired months are exported to gzip'd JSON-lines archives and then removed
+(by dropping the month's partition on MySQL). Empty partitions for the coming
+months are created ahead of time. Run once, or with --interval-hours to keep
+running as a scheduled worker.
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.db import engine
+from app.services.activity_log_retention import (
+    ActivityLogRetention, ACTIVITY_LOG_RETENTION_MONTHS, ACTIVITY_LOG_ARCHIVE_DIR
+)
+
+def enforce_retention(months, archive_dir):
+    with engine.connect() as conn:
+        retention = ActivityLogRetention(conn, archive_dir)
+        created = retention.ensure_future_partitions()
+        if created:
+            print(f"Created partitions: {', '.join(created)}")
+        removed = retention.enforce(months=months)
+        conn.commit()
+    for entry in removed:
+        where = f"partition {entry['partition']}" if entry['partition'] else "expired rows"
+        print(f"Archived {entry['rows']} rows from {where} to {entry['archive']}")
+    if not removed:
+        print(f"Nothing older than {months} months to archive")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--months", type=int, default=ACTIVITY_LOG_RETENTION_MONTHS,
+                        help=f"months of activity logs to keep (default: {ACTIVITY_LOG_RETENTION_MONTHS})")
+    parser.add_argument("--archive-dir", default=ACTIVITY_LOG_ARCHIVE_DIR, help="directory for archive files")
+    parser.add_argument("--interval-hours", type=float, default=0,
+                        help="keep running and enforce retention every N hours")
+    args = parser.parse_args()
+
+    while True:
+        try:
+            enforce_retention(args.months, args.archive_dir)
+        except Exception as e:
+            print(f"Error enforcing activity log retention: {e}")
+            if not args.interval_hours:
+                raise
+        if not args.interval_hours:
+            break
+        time.sleep(args.interval_hours * 3600)
@@ -17,7 +17,8 @@ fileConfig(config.config_file_name)
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 def get_url():
-    return f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB')}"
+    # Same precedence as app.core.db: DATABASE_URL, then the MYSQL_* settings
+    return os.getenv('DATABASE_URL') or f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB')}"
 
 config.set_main_option('sqlalchemy.url', get_url())
 
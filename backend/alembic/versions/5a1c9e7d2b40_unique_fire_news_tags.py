@@ -0,0 +1,34 @@
+"""unique_fire_news_tags
+
+Revision ID: 5a1c9e7d2b40
+Revises: f9e5bfbc39ac
+Create Date: 2026-10-19 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a1c9e7d2b40'
+down_revision: Union[str, Sequence[str], None] = 'f9e5bfbc39ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Remove duplicate associations, keeping the oldest row for each pair
+    op.execute(
+        "DELETE t1 FROM fire_news_tags t1 "
+        "JOIN fire_news_tags t2 ON t1.fire_news_id = t2.fire_news_id "
+        "AND t1.tag_id = t2.tag_id AND t1.id > t2.id"
+    )
+    op.create_unique_constraint('uq_fire_news_tag', 'fire_news_tags', ['fire_news_id', 'tag_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_fire_news_tag', 'fire_news_tags', type_='unique')
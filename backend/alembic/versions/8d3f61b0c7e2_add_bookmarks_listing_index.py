@@ -0,0 +1,28 @@
+"""add_bookmarks_listing_index
+
+Revision ID: 8d3f61b0c7e2
+Revises: 5a1c9e7d2b40
+Create Date: 2026-10-19 10:02:17.553810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f61b0c7e2'
+down_revision: Union[str, Sequence[str], None] = '5a1c9e7d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookmarks_user_type_created', 'bookmarks', ['user_id', 'data_type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookmarks_user_type_created', table_name='bookmarks')
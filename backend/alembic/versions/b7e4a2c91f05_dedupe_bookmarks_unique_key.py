@@ -0,0 +1,44 @@
+"""dedupe_bookmarks_unique_key
+
+Revision ID: b7e4a2c91f05
+Revises: 8d3f61b0c7e2
+Create Date: 2026-10-19 11:26:50.318742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4a2c91f05'
+down_revision: Union[str, Sequence[str], None] = '8d3f61b0c7e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_unique_key(name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    names = {c['name'] for c in inspector.get_unique_constraints('bookmarks')}
+    names |= {i['name'] for i in inspector.get_indexes('bookmarks') if i.get('unique')}
+    return name in names
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the oldest bookmark of every (user, news, type) duplicate group
+    op.execute(
+        "DELETE b1 FROM bookmarks b1 "
+        "JOIN bookmarks b2 ON b1.user_id = b2.user_id "
+        "AND b1.news_id = b2.news_id AND b1.data_type = b2.data_type AND b1.id > b2.id"
+    )
+    # Databases created from the bookmarks migration already have the key
+    if not _has_unique_key('uq_user_news_type'):
+        op.create_unique_constraint('uq_user_news_type', 'bookmarks', ['user_id', 'news_id', 'data_type'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The key is left in place: older revisions may already have created it
+    pass
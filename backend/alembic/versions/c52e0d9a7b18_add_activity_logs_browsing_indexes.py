@@ -0,0 +1,32 @@
+"""add_activity_logs_browsing_indexes
+
+Revision ID: c52e0d9a7b18
+Revises: b7e4a2c91f05
+Create Date: 2026-10-19 12:48:03.926411
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52e0d9a7b18'
+down_revision: Union[str, Sequence[str], None] = 'b7e4a2c91f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_activity_logs_created_at', 'activity_logs', ['created_at'], unique=False)
+    op.create_index('ix_activity_logs_user_created', 'activity_logs', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_activity_logs_action_created', 'activity_logs', ['action_type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_activity_logs_action_created', table_name='activity_logs')
+    op.drop_index('ix_activity_logs_user_created', table_name='activity_logs')
+    op.drop_index('ix_activity_logs_created_at', table_name='activity_logs')
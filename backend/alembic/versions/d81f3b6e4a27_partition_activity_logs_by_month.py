@@ -0,0 +1,76 @@
+"""partition_activity_logs_by_month
+
+Revision ID: d81f3b6e4a27
+Revises: c52e0d9a7b18
+Create Date: 2026-10-19 14:05:33.471902
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f3b6e4a27'
+down_revision: Union[str, Sequence[str], None] = 'c52e0d9a7b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def _partition_clause(first_month: date, last_month: date) -> str:
+    """One partition per month from first_month to last_month, plus a catch-all"""
+    partitions = []
+    month = first_month
+    while month <= last_month:
+        upper = _next_month(month)
+        partitions.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{upper:%Y-%m-%d}'))")
+        month = upper
+    partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+    return ",\n    ".join(partitions)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+
+    # Partitioned InnoDB tables can't have foreign keys; user_id stays a plain column
+    inspector = sa.inspect(bind)
+    for fk in inspector.get_foreign_keys('activity_logs'):
+        op.drop_constraint(fk['name'], 'activity_logs', type_='foreignkey')
+
+    # The partitioning column must be NOT NULL and part of every unique key
+    op.execute("UPDATE activity_logs SET created_at = NOW() WHERE created_at IS NULL")
+    op.alter_column('activity_logs', 'created_at', existing_type=sa.DateTime(timezone=True),
+                    nullable=False, existing_server_default=sa.text('now()'))
+    op.execute("ALTER TABLE activity_logs DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)")
+
+    oldest = bind.execute(sa.text("SELECT MIN(created_at) FROM activity_logs")).scalar() or datetime.utcnow()
+    today = datetime.utcnow().date()
+    first_month = date(oldest.year, oldest.month, 1)
+    last_month = _next_month(_next_month(date(today.year, today.month, 1)))
+    op.execute(
+        "ALTER TABLE activity_logs PARTITION BY RANGE (TO_DAYS(created_at)) (\n    "
+        + _partition_clause(first_month, last_month)
+        + "\n)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+
+    op.execute("ALTER TABLE activity_logs REMOVE PARTITIONING")
+    op.execute("ALTER TABLE activity_logs DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+    op.alter_column('activity_logs', 'created_at', existing_type=sa.DateTime(timezone=True),
+                    nullable=True, existing_server_default=sa.text('now()'))
+    op.create_foreign_key(None, 'activity_logs', 'users', ['user_id'], ['id'])
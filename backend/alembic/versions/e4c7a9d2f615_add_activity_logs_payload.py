@@ -0,0 +1,84 @@
+"""add_activity_logs_payload
+
+Revision ID: e4c7a9d2f615
+Revises: d81f3b6e4a27
+Create Date: 2026-10-19 15:22:47.108356
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c7a9d2f615'
+down_revision: Union[str, Sequence[str], None] = 'd81f3b6e4a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Upload logs written before the payload column existed only carry these counts as text
+LEGACY_DETAILS = [
+    re.compile(r"^Excel upload with reporter '(?P<reporter>.*)': (?P<inserted>\d+) new items, (?P<skipped>\d+) skipped$"),
+    re.compile(r"^Bulk upload: (?P<inserted>\d+) new items, (?P<skipped>\d+) duplicates$"),
+]
+
+
+def _legacy_payload(details):
+    for pattern in LEGACY_DETAILS:
+        match = pattern.match(details or '')
+        if match:
+            fields = match.groupdict()
+            payload = {"inserted": int(fields["inserted"]), "skipped": int(fields["skipped"])}
+            if fields.get("reporter") is not None:
+                payload["reporter"] = fields["reporter"]
+            return payload
+    return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('activity_logs', sa.Column('payload', sa.JSON(), nullable=True))
+    op.add_column('activity_logs', sa.Column('payload_reporter', sa.String(length=255),
+                  sa.Computed("payload->>'$.reporter'", persisted=False)))
+    op.add_column('activity_logs', sa.Column('payload_inserted', sa.Integer(),
+                  sa.Computed("CAST(payload->>'$.inserted' AS SIGNED)", persisted=False)))
+    op.add_column('activity_logs', sa.Column('payload_skipped', sa.Integer(),
+                  sa.Computed("CAST(payload->>'$.skipped' AS SIGNED)", persisted=False)))
+    op.create_index('ix_activity_logs_reporter_created', 'activity_logs', ['payload_reporter', 'created_at'], unique=False)
+
+    # Backfill payloads for existing upload logs in keyset batches
+    bind = op.get_bind()
+    activity_logs = sa.table('activity_logs', sa.column('id', sa.Integer), sa.column('action_type', sa.String),
+                             sa.column('details', sa.Text), sa.column('payload', sa.JSON))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(activity_logs.c.id, activity_logs.c.details)
+            .where(activity_logs.c.action_type == 'news_uploaded', activity_logs.c.id > last_id)
+            .order_by(activity_logs.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        updates = [{"row_id": row.id, "payload": payload} for row in rows
+                   if (payload := _legacy_payload(row.details)) is not None]
+        if updates:
+            bind.execute(
+                activity_logs.update().where(activity_logs.c.id == sa.bindparam('row_id'))
+                .values(payload=sa.bindparam('payload')),
+                updates
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_activity_logs_reporter_created', table_name='activity_logs')
+    op.drop_column('activity_logs', 'payload_skipped')
+    op.drop_column('activity_logs', 'payload_inserted')
+    op.drop_column('activity_logs', 'payload_reporter')
+    op.drop_column('activity_logs', 'payload')
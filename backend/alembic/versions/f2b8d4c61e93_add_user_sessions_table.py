@@ -0,0 +1,44 @@
+"""add_user_sessions_table
+
+Revision ID: f2b8d4c61e93
+Revises: e4c7a9d2f615
+Create Date: 2026-10-19 16:10:12.584230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4c61e93'
+down_revision: Union[str, Sequence[str], None] = 'e4c7a9d2f615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('family_id', sa.String(length=32), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token_hash')
+    )
+    op.create_index('ix_user_sessions_family', 'user_sessions', ['family_id'], unique=False)
+    op.create_index('ix_user_sessions_user', 'user_sessions', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_sessions_user', table_name='user_sessions')
+    op.drop_index('ix_user_sessions_family', table_name='user_sessions')
+    op.drop_table('user_sessions')
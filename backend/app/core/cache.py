@@ -0,0 +1,45 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+class TTLCache:
+    """Small thread-safe in-process cache with per-entry expiry and LRU eviction"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a load racing with a write isn't cached
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader() to fill it when missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+
+        # Load outside the lock so a slow query doesn't block other keys
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = (now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Hashable = None):
+        """Drop one key, or everything when no key is given"""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -1,12 +1,17 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from dotenv import load_dotenv
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '../../.env'))
 
-DATABASE_URL = f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB')}"
+# DATABASE_URL overrides the MYSQL_* settings, e.g. to point a server at a scratch database
+DATABASE_URL = os.getenv('DATABASE_URL') or f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB')}"
 
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -17,4 +22,32 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def insert_ignore(db, table, rows):
+    """Bulk insert rows, skipping the ones that collide with a unique key"""
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == 'mysql':
+        stmt = mysql_insert(table)
+        # No-op update so only duplicate keys are swallowed, not other errors
+        stmt = stmt.on_duplicate_key_update({table.c.id.name: table.c.id})
+    elif dialect == 'sqlite':
+        stmt = sqlite_insert(table).on_conflict_do_nothing()
+    elif dialect == 'postgresql':
+        stmt = postgresql_insert(table).on_conflict_do_nothing()
+    else:
+        _insert_each_ignoring_conflicts(db, table, rows)
+        return
+    db.execute(stmt, rows)
+
+def _insert_each_ignoring_conflicts(db, table, rows):
+    """Portable insert_ignore: one INSERT per row in a savepoint, rolled back when a unique key collides"""
+    stmt = insert(table)
+    for row in rows:
+        try:
+            with db.begin_nested():
+                db.execute(stmt, row)
+        except IntegrityError:
+            pass
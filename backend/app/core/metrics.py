@@ -0,0 +1,290 @@
+import os
+import bisect
+import secrets
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.core.shared_state import shared_dir, write_json, read_json, json_files
+
+# How often each worker publishes its metrics for the others' /metrics scrapes (multi-process mode)
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
+
+# /metrics is served only to scrapers sending "Authorization: Bearer <METRICS_TOKEN>", or
+# to clients at one of METRICS_ALLOWED_HOSTS (comma-separated addresses, loopback by default)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_ALLOWED_HOSTS = {host.strip() for host in os.getenv('METRICS_ALLOWED_HOSTS', '127.0.0.1,::1').split(',') if host.strip()}
+
+# Latency buckets in seconds, from sub-millisecond queries up to slow uploads
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = [[list(key), value] for key, value in self._values.items()]
+        return {"kind": self.kind, "help": self.documentation, "labelnames": list(self.labelnames), "values": values}
+
+class Counter(_Metric):
+    """Monotonically increasing total, optionally split by labels"""
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def merge(self, values):
+        """Add another process's values to these"""
+        with self._lock:
+            for key, value in values:
+                key = tuple(key)
+                self._values[key] = self._values.get(key, 0) + value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(_Metric):
+    """Cumulative-bucket distribution of observations (latencies, sizes)"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = [[list(key), [list(counts), total]] for key, (counts, total) in self._values.items()]
+        return {"kind": self.kind, "help": self.documentation, "labelnames": list(self.labelnames),
+                "buckets": list(self.buckets), "values": values}
+
+    def merge(self, values):
+        with self._lock:
+            for key, (counts, total) in values:
+                entry = self._values.setdefault(tuple(key), [[0] * (len(self.buckets) + 1), 0.0])
+                entry[0] = [mine + theirs for mine, theirs in zip(entry[0], counts)]
+                entry[1] += total
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+class Registry:
+    """Process-local collection of metrics rendered in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def merge(self, snapshot: Dict[str, dict], gauges: bool = True):
+        """Add a snapshot() of another registry; gauges=False skips gauges (of processes that are gone)"""
+        for name, data in snapshot.items():
+            if data["kind"] == "gauge" and not gauges:
+                continue
+            if data["kind"] == "histogram":
+                metric = self.histogram(name, data["help"], data["labelnames"], data["buckets"])
+            else:
+                metric = self._register(_KINDS[data["kind"]], name, data["help"], data["labelnames"])
+            metric.merge(data["values"])
+
+_KINDS = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+registry = Registry()
+
+# Multi-process mode (SHARED_STATE_DIR, set by gunicorn.conf.py): every worker
+# writes its registry to metrics/<pid>.json, and whichever worker a scrape
+# lands on renders the sum over all of them. Counters and histograms of
+# workers that exited are folded into metrics/archive.json by the master, so
+# totals never go backwards when a worker is recycled; their gauges are dropped.
+
+ARCHIVE = "archive"
+
+def write_worker_metrics(pid: Optional[int] = None):
+    directory = shared_dir("metrics")
+    if directory is not None:
+        pid = pid or os.getpid()
+        write_json(os.path.join(directory, f"{pid}.json"), {"pid": pid, "metrics": registry.snapshot()})
+
+def render_metrics() -> str:
+    """Prometheus text for the whole server: this process alone, or every worker's in multi-process mode"""
+    directory = shared_dir("metrics")
+    if directory is None:
+        return registry.render()
+    write_worker_metrics()
+    archive = read_json(os.path.join(directory, f"{ARCHIVE}.json")) or {"pids": [], "metrics": {}}
+    folded = {str(pid) for pid in archive["pids"]}
+    merged = Registry()
+    # This worker's metrics first keeps the output order stable between scrapes
+    merged.merge(registry.snapshot())
+    own = str(os.getpid())
+    for name, path in json_files(directory):
+        if name in (ARCHIVE, own) or name in folded:
+            continue
+        data = read_json(path)
+        if data is not None:
+            merged.merge(data["metrics"])
+    merged.merge(archive["metrics"], gauges=False)
+    return merged.render()
+
+def mark_process_dead(pid: int):
+    """Fold an exited worker's counters and histograms into the archive (gunicorn child_exit, in the master)"""
+    directory = shared_dir("metrics")
+    if directory is None:
+        return
+    path = os.path.join(directory, f"{pid}.json")
+    data = read_json(path)
+    if data is None:
+        return
+    archive_path = os.path.join(directory, f"{ARCHIVE}.json")
+    archive = read_json(archive_path) or {"pids": [], "metrics": {}}
+    folded = Registry()
+    folded.merge(archive["metrics"])
+    folded.merge(data["metrics"], gauges=False)
+    # Readers skip the pid's own file while it is listed, so it is never counted twice;
+    # the listing is removed again once the file is gone, before a new worker can reuse the pid
+    write_json(archive_path, {"pids": archive["pids"] + [pid], "metrics": folded.snapshot()})
+    os.unlink(path)
+    write_json(archive_path, {"pids": archive["pids"], "metrics": folded.snapshot()})
+
+class MetricsPublisher(threading.Thread):
+    """Writes this worker's metrics every METRICS_FLUSH_SECONDS, and once more on stop()"""
+
+    def __init__(self, interval: float = METRICS_FLUSH_SECONDS):
+        super().__init__(name="metrics-publisher", daemon=True)
+        self.interval = interval
+        self.stopping = threading.Event()
+
+    def start(self):
+        if shared_dir("metrics") is not None:
+            super().start()
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            write_worker_metrics()
+
+    def stop(self):
+        self.stopping.set()
+        write_worker_metrics()
+
+def route_template(scope) -> str:
+    """Path template of the matched route (e.g. /api/fire-news/{news_id}), so ids don't explode label cardinality"""
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
+    return "unmatched"
+
+def scrape_allowed(client_host: Optional[str], authorization: Optional[str]) -> bool:
+    """Whether a /metrics request may read the metrics (see METRICS_TOKEN and METRICS_ALLOWED_HOSTS)"""
+    if METRICS_TOKEN and authorization:
+        scheme, _, token = authorization.partition(' ')
+        if scheme.lower() == 'bearer' and secrets.compare_digest(token.strip().encode(), METRICS_TOKEN.encode()):
+            return True
+    return client_host in METRICS_ALLOWED_HOSTS
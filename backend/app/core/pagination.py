@@ -0,0 +1,25 @@
+import base64
+from datetime import datetime
+from fastapi import HTTPException
+from typing import Optional, Tuple
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the (created_at, id) position of the last row on a page as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Decode a cursor produced by encode_cursor, rejecting malformed values with a 400"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded.encode()).decode().rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_before(created_at_col, id_col, cursor: Tuple[datetime, int]):
+    """Filter for rows that sort after the cursor in (created_at DESC, id DESC) order"""
+    created_at, row_id = cursor
+    return (created_at_col < created_at) | ((created_at_col == created_at) & (id_col < row_id))
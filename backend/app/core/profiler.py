@@ -0,0 +1,217 @@
+import os
+import re
+import sys
+import time
+import uuid
+import asyncio
+import threading
+import contextvars
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+import anyio.to_thread
+from app.core.shared_state import shared_dir, write_json, read_json, json_files
+
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', 2))
+# Finished profiles kept, oldest dropped first
+PROFILE_STORE_SIZE = int(os.getenv('PROFILE_STORE_SIZE', 20))
+
+# Frames from these modules put a sample in the "sql" or "serialization" bucket;
+# everything else is "python"
+SQL_MODULES = ('sqlalchemy', 'pymysql', 'sqlite3', 'MySQLdb')
+SERIALIZATION_MODULES = ('json', 'orjson', 'fastapi/encoders', 'pydantic', 'starlette/responses', 'fastapi/routing.py:serialize_response')
+
+_active_profile: contextvars.ContextVar[Optional["RequestProfile"]] = contextvars.ContextVar('active_profile', default=None)
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LIBRARY_PREFIX = re.compile(r'^.*/(?:site-packages|dist-packages)/|^.*/lib/python\d+\.\d+/')
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_BACKEND_DIR):
+        filename = filename[len(_BACKEND_DIR) + 1:]
+    else:
+        filename = _LIBRARY_PREFIX.sub('', filename)
+    return f"{filename}:{code.co_name}"
+
+def _category(labels: List[str]) -> str:
+    for label in labels:
+        if label.startswith(SQL_MODULES):
+            return 'sql'
+    for label in labels:
+        if label.startswith(SERIALIZATION_MODULES):
+            return 'serialization'
+    return 'python'
+
+class RequestProfile:
+    """Folded-stack samples for one request"""
+
+    def __init__(self, endpoint: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.endpoint = endpoint
+        self.started_at = datetime.utcnow()
+        self.duration_ms: Optional[float] = None
+        self.stacks: Counter = Counter()
+        self.categories: Counter = Counter()
+
+    def add(self, frame):
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        labels.reverse()
+        category = _category(labels)
+        self.categories[category] += 1
+        self.stacks[';'.join([category] + labels)] += 1
+
+    def folded(self) -> str:
+        """Brendan Gregg's folded format, readable by flamegraph.pl and speedscope"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> dict:
+        interval = PROFILE_SAMPLE_INTERVAL_MS
+        return {
+            "id": self.id,
+            "endpoint": self.endpoint,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "samples": sum(self.categories.values()),
+            "sample_interval_ms": interval,
+            "estimated_ms": {category: round(count * interval, 1) for category, count in self.categories.items()},
+        }
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "endpoint": self.endpoint, "started_at": self.started_at, "duration_ms": self.duration_ms,
+                "stacks": dict(self.stacks), "categories": dict(self.categories)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RequestProfile":
+        profile = cls(data["endpoint"])
+        profile.id = data["id"]
+        profile.started_at = datetime.fromisoformat(data["started_at"])
+        profile.duration_ms = data["duration_ms"]
+        profile.stacks = Counter(data["stacks"])
+        profile.categories = Counter(data["categories"])
+        return profile
+
+class _Sampler(threading.Thread):
+    """Samples the stacks that belong to one request until stopped.
+
+    The request's async parts run in its own task on the event loop thread; its
+    sync parts run in anyio worker threads, which hold a copy of the request's
+    context while running them. A thread's stack is sampled only while it is
+    doing this request's work.
+    """
+
+    def __init__(self, profile: RequestProfile, loop_thread_id: int, task: Optional[asyncio.Task]):
+        super().__init__(name="request-profiler", daemon=True)
+        self.profile = profile
+        self.loop_thread_id = loop_thread_id
+        self.task = task
+        self.loop = task.get_loop() if task else None
+        self.stopping = threading.Event()
+
+    def _owns(self, thread_id: int, frame) -> bool:
+        if thread_id == self.loop_thread_id:
+            return self.task is not None and asyncio.current_task(self.loop) is self.task
+        while frame is not None:
+            if 'anyio' in frame.f_code.co_filename:
+                for value in frame.f_locals.values():
+                    if isinstance(value, contextvars.Context):
+                        return value.get(_active_profile) is self.profile
+            frame = frame.f_back
+        return False
+
+    def run(self):
+        interval = PROFILE_SAMPLE_INTERVAL_MS / 1000
+        own_id = threading.get_ident()
+        while not self.stopping.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id and self._owns(thread_id, frame):
+                    self.profile.add(frame)
+
+_PROFILE_ID = re.compile(r'^[0-9a-f]{16}$')
+
+class ProfileStore:
+    """The last PROFILE_STORE_SIZE profiles.
+
+    In memory for a single process; with several workers (SHARED_STATE_DIR)
+    one file per profile under profiles/, so the X-Profile-Id a worker hands
+    out can be fetched from any worker.
+    """
+
+    def __init__(self, size: int = PROFILE_STORE_SIZE):
+        self.size = size
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile):
+        directory = shared_dir("profiles")
+        if directory is None:
+            with self._lock:
+                self._profiles[profile.id] = profile
+                while len(self._profiles) > self.size:
+                    self._profiles.popitem(last=False)
+            return
+        write_json(os.path.join(directory, f"{profile.id}.json"), profile.to_dict())
+        files = sorted(json_files(directory), key=lambda item: _mtime(item[1]))
+        for _, path in files[:-self.size]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        directory = shared_dir("profiles")
+        if directory is None:
+            with self._lock:
+                return self._profiles.get(profile_id)
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        data = read_json(os.path.join(directory, f"{profile_id}.json"))
+        return RequestProfile.from_dict(data) if data else None
+
+    def summaries(self) -> List[Dict]:
+        directory = shared_dir("profiles")
+        if directory is None:
+            with self._lock:
+                profiles = list(reversed(self._profiles.values()))
+        else:
+            profiles = [RequestProfile.from_dict(data) for data in (read_json(path) for _, path in json_files(directory)) if data]
+            profiles.sort(key=lambda profile: profile.started_at, reverse=True)
+        return [profile.summary() for profile in profiles]
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+profile_store = ProfileStore()
+
+class profile_request:
+    """Async context manager sampling the current request while it runs"""
+
+    def __init__(self, endpoint: str):
+        self.profile = RequestProfile(endpoint)
+
+    async def __aenter__(self) -> RequestProfile:
+        self._token = _active_profile.set(self.profile)
+        self._started = time.perf_counter()
+        self._sampler = _Sampler(self.profile, threading.get_ident(), asyncio.current_task())
+        self._sampler.start()
+        return self.profile
+
+    async def __aexit__(self, *exc):
+        self._sampler.stopping.set()
+        self.profile.duration_ms = round((time.perf_counter() - self._started) * 1000, 1)
+        _active_profile.reset(self._token)
+        # The sampler can be mid-way through a pass over every thread's stack, and a
+        # shared store writes a file; neither should hold up the event loop
+        await anyio.to_thread.run_sync(self._finish)
+        return False
+
+    def _finish(self):
+        self._sampler.join()
+        profile_store.add(self.profile)
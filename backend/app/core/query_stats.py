@@ -0,0 +1,121 @@
+import os
+import re
+import time
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.metrics import registry, route_template
+from app.core.slow_queries import slow_query_log
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SQL_QUERY_STATS_ENABLED = os.getenv('SQL_QUERY_STATS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# Warn when one statement shape runs more than this many times in a single request
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', 10))
+
+STATEMENTS = registry.counter('sql_statements_total', 'SQL statements executed', ['route'])
+QUERIES_PER_REQUEST = registry.histogram(
+    'sql_queries_per_request', 'SQL statements per request', ['route'],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+DB_SECONDS_PER_REQUEST = registry.histogram('sql_time_per_request_seconds', 'Time spent in SQL per request', ['route'])
+N_PLUS_ONE = registry.counter('sql_n_plus_one_total', 'Requests that repeated one statement shape past the threshold', ['route'])
+
+_QUOTED = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*,?)+\)", re.IGNORECASE)
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_SPACE = re.compile(r"\s+")
+
+def normalize_sql(statement: str) -> str:
+    """Statement shape: literals and bind parameters become ?, IN lists collapse to IN (...)"""
+    shape = _QUOTED.sub('?', statement)
+    shape = _NUMBER.sub('?', shape)
+    shape = _PARAM.sub('?', shape)
+    shape = _IN_LIST.sub('IN (...)', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+class RequestQueryStats:
+    """SQL statements attributed to one request"""
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope or {}
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[normalize_sql(statement)] += 1
+
+    def repeated(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD):
+        """(shape, count) pairs that ran more than threshold times"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    @property
+    def endpoint(self) -> str:
+        """Method and route template; the route is known once routing has run"""
+        return f"{self.scope.get('method', '')} {route_template(self.scope)}".strip()
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+    def finish(self):
+        """Publish the totals once the request is done"""
+        route = route_template(self.scope)
+        STATEMENTS.inc(self.count, route=route)
+        QUERIES_PER_REQUEST.observe(self.count, route=route)
+        DB_SECONDS_PER_REQUEST.observe(self.seconds, route=route)
+        repeated = self.repeated()
+        if repeated:
+            N_PLUS_ONE.inc(route=route)
+            for shape, count in repeated:
+                logger.warning(f"Possible N+1 in {route}: statement ran {count} times: {shape[:300]}")
+
+# Set per request by QueryStatsMiddleware; sync endpoints run in a threadpool
+# with a copy of the context, so they see (and update) the same object
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar('request_query_stats', default=None)
+
+def current_query_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+def start_request_stats(scope: Optional[dict] = None):
+    """Begin attributing statements in this context to a new request; returns the reset token"""
+    return _current_stats.set(RequestQueryStats(scope))
+
+def end_request_stats(token):
+    _current_stats.reset(token)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start_time'].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if slow_query_log.is_slow(elapsed) and not conn.info.get('slow_query_explain'):
+        endpoint = stats.endpoint if stats else None
+        slow_query_log.record(conn, statement, normalize_sql(statement), parameters, executemany, elapsed, endpoint)
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute; drop their start time
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('query_start_time'):
+        connection.info['query_start_time'].pop()
+
+_installed = False
+
+def install_query_hooks():
+    """Time every statement on every engine (idempotent)"""
+    global _installed
+    if _installed or not SQL_QUERY_STATS_ENABLED:
+        return
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(Engine, 'handle_error', _handle_error)
+    _installed = True
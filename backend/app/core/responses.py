@@ -0,0 +1,19 @@
+import orjson
+from fastapi.responses import JSONResponse
+from app.core.tracing import span
+
+class TracedJSONResponse(JSONResponse):
+    """Default JSON response, rendered with orjson; encoding shows up as its own span in traced requests.
+
+    Output matches Starlette's json.dumps rendering (compact, UTF-8) except for
+    floats Python writes with an exponent: 1e-05 and 1e+16 come out as 0.00001
+    and 1e16, the same numbers. datetimes are written exactly as isoformat()
+    would, so endpoints can hand them over unconverted.
+    """
+
+    def render(self, content) -> bytes:
+        with span("response.render") as current:
+            body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            if current is not None:
+                current.set(bytes=len(body))
+            return body
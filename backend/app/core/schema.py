@@ -0,0 +1,77 @@
+import os
+import re
+import logging
+from typing import Optional, Set
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+# What the app does at startup when the database isn't at the migration head:
+# 'strict' refuses to start, 'warn' logs and serves anyway, 'off' skips the check
+SCHEMA_CHECK = os.getenv('SCHEMA_CHECK', 'strict').lower()
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'alembic', 'versions')
+
+_REVISION = re.compile(r"^revision\b[^=\n]*=\s*['\"]([^'\"]+)['\"]", re.MULTILINE)
+_DOWN_REVISION = re.compile(r"^down_revision\b[^=\n]*=\s*(\([^)]*\)|[^\n]*)", re.MULTILINE)
+_QUOTED = re.compile(r"['\"]([^'\"]+)['\"]")
+
+def expected_heads(versions_dir: str = VERSIONS_DIR) -> Set[str]:
+    """Head revisions of the migration scripts.
+
+    Read straight from the files: importing alembic to ask it would cost more
+    than the rest of the startup check put together.
+    """
+    revisions, parents = set(), set()
+    for name in os.listdir(versions_dir):
+        if not name.endswith('.py'):
+            continue
+        with open(os.path.join(versions_dir, name), encoding='utf-8') as f:
+            source = f.read()
+        revision = _REVISION.search(source)
+        if not revision:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION.search(source)
+        if down_revision:
+            parents.update(_QUOTED.findall(down_revision.group(1)))
+    return revisions - parents
+
+def current_revisions(conn) -> Optional[Set[str]]:
+    """Revisions stamped in alembic_version, or None when the database was never migrated"""
+    if not inspect(conn).has_table('alembic_version'):
+        return None
+    return {row[0] for row in conn.execute(text("SELECT version_num FROM alembic_version"))}
+
+class SchemaStatus:
+    def __init__(self, current: Optional[Set[str]], expected: Set[str]):
+        self.current = current
+        self.expected = expected
+
+    @property
+    def up_to_date(self) -> bool:
+        return self.current == self.expected
+
+    def describe(self) -> str:
+        if self.current is None:
+            return f"database has no alembic_version table; expected {', '.join(sorted(self.expected))}"
+        if self.up_to_date:
+            return f"database schema is at {', '.join(sorted(self.current))}"
+        return (f"database schema is at {', '.join(sorted(self.current)) or 'no revision'}, "
+                f"code expects {', '.join(sorted(self.expected))}")
+
+def schema_status(engine) -> SchemaStatus:
+    with engine.connect() as conn:
+        return SchemaStatus(current_revisions(conn), expected_heads())
+
+def verify_schema(engine, mode: str = SCHEMA_CHECK):
+    """Startup check; migrations themselves are an explicit step (python migrate.py)"""
+    if mode == 'off':
+        return
+    status = schema_status(engine)
+    if status.up_to_date:
+        return
+    message = f"{status.describe()}; run `python migrate.py`"
+    if mode == 'strict':
+        raise RuntimeError(message)
+    logger.warning(message)
@@ -0,0 +1,55 @@
+import os
+import json
+import tempfile
+from datetime import date, datetime
+from typing import Any, Iterator, Optional, Tuple
+
+# Directory shared by every worker process of one server; gunicorn.conf.py creates
+# one per master. Unset (a single uvicorn process, tests), the metrics registry,
+# profile store and slow query log keep everything in memory
+SHARED_STATE_DIR = os.getenv('SHARED_STATE_DIR') or None
+
+def is_shared() -> bool:
+    """Whether workers share state through files (cheap; shared_dir also creates the directory)"""
+    return bool(SHARED_STATE_DIR)
+
+def shared_dir(name: str) -> Optional[str]:
+    """SHARED_STATE_DIR/name, created on first use; None in single-process mode"""
+    if not SHARED_STATE_DIR:
+        return None
+    path = os.path.join(SHARED_STATE_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def write_json(path: str, data: Any):
+    """Replace path atomically, so readers in other workers never see a partial file"""
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(descriptor, 'w') as f:
+            json.dump(data, f, default=_default)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+
+def read_json(path: str) -> Optional[Any]:
+    """Contents of path, or None when it is gone (its worker cleaned up in between)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def json_files(directory: str) -> Iterator[Tuple[str, str]]:
+    """(name without .json, path) of every finished file in directory"""
+    for entry in os.scandir(directory):
+        if entry.name.endswith('.json') and not entry.name.startswith('.'):
+            yield entry.name[:-5], entry.path
@@ -0,0 +1,184 @@
+import os
+import queue
+import logging
+import itertools
+import threading
+from collections import deque
+from datetime import datetime
+from app.core.metrics import registry
+from app.core.shared_state import is_shared, shared_dir, write_json, read_json, json_files
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 250))
+SLOW_QUERY_LOG_SIZE = int(os.getenv('SLOW_QUERY_LOG_SIZE', 200))
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'true').lower() in ('1', 'true', 'yes')
+
+SLOW_QUERIES = registry.counter('sql_slow_queries_total', 'Statements slower than SLOW_QUERY_THRESHOLD_MS', ['endpoint'])
+
+def parameter_shape(parameters: Any, executemany: bool = False):
+    """Types of the bound parameters, never their values"""
+    if executemany and parameters:
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+class SlowQueryLog:
+    """Bounded ring buffer of slow statements, with EXPLAIN plans captured in the background.
+
+    EXPLAIN runs on a separate pooled connection from a single worker thread, so
+    the request that ran the slow statement never waits for it. The original
+    parameter values are held only until the plan is captured.
+
+    With several workers (SHARED_STATE_DIR) each one also writes its buffer to
+    slow-queries/<pid>.json, and entries() reads them all, so the admin view
+    shows the whole server whichever worker serves it. That write happens on
+    the same background thread, so the statement hook only appends to memory.
+    """
+
+    ARCHIVE = "archive"
+    CLEARED = "cleared"
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, size: int = SLOW_QUERY_LOG_SIZE, explain: bool = SLOW_QUERY_EXPLAIN):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self._entries: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # EXPLAIN jobs, and None to ask for the buffer to be published
+        self._jobs: queue.Queue = queue.Queue(maxsize=50)
+        self._unpublished = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def is_slow(self, seconds: float) -> bool:
+        return seconds >= self.threshold
+
+    def record(self, conn, statement: str, shape: str, parameters: Any, executemany: bool, seconds: float, endpoint: Optional[str]):
+        entry = {
+            "id": next(self._ids),
+            "worker": os.getpid(),
+            "recorded_at": datetime.utcnow(),
+            "duration_ms": round(seconds * 1000, 1),
+            "statement": shape,
+            "parameters": parameter_shape(parameters, executemany),
+            "endpoint": endpoint,
+            "explain": None,
+            "explain_error": None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+        if is_shared():
+            self._unpublished.set()
+            self._submit(None)
+        SLOW_QUERIES.inc(endpoint=endpoint or "background")
+        logger.warning(f"Slow query ({entry['duration_ms']} ms) in {endpoint or 'background'}: {shape[:300]}")
+
+        if self.explain and not executemany and statement.lstrip()[:6].upper() in ("SELECT", "(SELEC"):
+            self._submit((conn.engine, entry, statement, parameters))
+
+    def _submit(self, job):
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            # A pending publish request is covered by the jobs ahead of it
+            if job is not None:
+                job[1]["explain_error"] = "EXPLAIN skipped: queue full"
+            return
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run_jobs, name="slow-query-explain", daemon=True)
+            self._worker.start()
+
+    def _run_jobs(self):
+        while True:
+            try:
+                job = self._jobs.get(timeout=30)
+            except queue.Empty:
+                return
+            if job is not None:
+                engine, entry, statement, parameters = job
+                try:
+                    entry["explain"] = self._explain(engine, statement, parameters)
+                except Exception as e:
+                    entry["explain_error"] = str(e)[:500]
+                self._unpublished.set()
+            # Several slow statements queued together are published once
+            if self._unpublished.is_set() and is_shared():
+                self._unpublished.clear()
+                self._publish()
+
+    def _explain(self, engine, statement: str, parameters: Any) -> List[dict]:
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == 'sqlite' else "EXPLAIN "
+        with engine.connect() as side:
+            # Keeps the EXPLAIN itself out of the slow log
+            side.info['slow_query_explain'] = True
+            try:
+                result = side.exec_driver_sql(prefix + statement, parameters or ())
+                return [dict(row._mapping) for row in result]
+            finally:
+                side.info.pop('slow_query_explain', None)
+
+    def _publish(self):
+        directory = shared_dir("slow-queries")
+        if directory is None:
+            return
+        with self._lock:
+            entries = list(self._entries)
+        try:
+            write_json(os.path.join(directory, f"{os.getpid()}.json"), entries)
+        except OSError as e:
+            logger.warning(f"Could not publish slow queries: {e}")
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        """Newest first"""
+        directory = shared_dir("slow-queries")
+        if directory is None:
+            with self._lock:
+                entries = list(reversed(self._entries))
+            return entries[:limit] if limit else entries
+
+        # Other workers' entries come back from JSON with ISO timestamps; recorded_at sorts the same either way
+        cleared = (read_json(os.path.join(directory, f"{self.CLEARED}.json")) or {}).get("at", "")
+        # Keyed by (worker, id): a worker's entries can briefly be both in its own file and the archive
+        merged = {}
+        for name, path in json_files(directory):
+            if name != self.CLEARED:
+                for entry in read_json(path) or []:
+                    merged[(entry.get("worker"), entry["id"])] = entry
+        # This worker's own entries straight from memory, including any not yet published
+        with self._lock:
+            own = [{**entry, "recorded_at": entry["recorded_at"].isoformat()} for entry in self._entries]
+        for entry in own:
+            merged[(entry["worker"], entry["id"])] = entry
+        entries = [entry for entry in merged.values() if entry["recorded_at"] > cleared]
+        entries.sort(key=lambda entry: entry["recorded_at"], reverse=True)
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        directory = shared_dir("slow-queries")
+        if directory is not None:
+            # Other workers still hold their entries; readers hide everything recorded before this
+            write_json(os.path.join(directory, f"{self.CLEARED}.json"), {"at": datetime.utcnow().isoformat()})
+            self._publish()
+
+    def archive_worker(self, pid: int):
+        """Move an exited worker's entries into the shared archive, keeping the newest (gunicorn child_exit)"""
+        directory = shared_dir("slow-queries")
+        if directory is None:
+            return
+        path = os.path.join(directory, f"{pid}.json")
+        entries = read_json(path)
+        if entries is None:
+            return
+        archive_path = os.path.join(directory, f"{self.ARCHIVE}.json")
+        archived = (read_json(archive_path) or []) + entries
+        archived.sort(key=lambda entry: entry["recorded_at"])
+        write_json(archive_path, archived[-(self._entries.maxlen or len(archived)):])
+        os.unlink(path)
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,270 @@
+import os
+import json
+import time
+import queue
+import random
+import logging
+import secrets
+import threading
+import urllib.request
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fraction of requests traced
+TRACE_SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', 0.0))
+# Let an incoming traceparent's sampled flag decide instead of TRACE_SAMPLE_RATE. Any client
+# can set that flag, so only enable this behind a gateway that sets or strips traceparent
+TRACE_TRUST_INCOMING_SAMPLED = os.getenv('TRACE_TRUST_INCOMING_SAMPLED', 'false').lower() in ('1', 'true', 'yes')
+# 'file' writes rotating JSON lines, 'otlp' posts OTLP/HTTP JSON to TRACE_OTLP_ENDPOINT
+TRACE_EXPORTER = os.getenv('TRACE_EXPORTER', 'file').lower()
+TRACE_FILE = os.getenv('TRACE_FILE', os.path.join(os.path.dirname(__file__), '../../traces/traces.jsonl'))
+TRACE_FILE_MAX_BYTES = int(os.getenv('TRACE_FILE_MAX_BYTES', 10 * 1024 * 1024))
+TRACE_FILE_BACKUPS = int(os.getenv('TRACE_FILE_BACKUPS', 5))
+TRACE_OTLP_ENDPOINT = os.getenv('TRACE_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+TRACE_SERVICE_NAME = os.getenv('TRACE_SERVICE_NAME', 'firenews-backend')
+
+class Span:
+    __slots__ = ('trace', 'name', 'span_id', 'parent_id', 'start_ns', 'end_ns', 'attributes', 'error')
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def add(self, **amounts):
+        """Add to numeric attributes, for work repeated too often to span each time"""
+        for key, amount in amounts.items():
+            self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def end(self):
+        self.end_ns = time.time_ns()
+        self.trace.spans.append(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+class Trace:
+    """Spans of one sampled request, exported together when the root span ends"""
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.spans: List[Span] = []
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+class _SpanScope:
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        self.span = Span(parent.trace, self.name, parent.span_id, self.attributes)
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.span.end()
+        return False
+
+class _NoopScope:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+_NOOP = _NoopScope()
+
+def span(name: str, **attributes):
+    """Child span of the current one; a shared no-op when the request isn't traced"""
+    if _current_span.get() is None:
+        return _NOOP
+    return _SpanScope(name, attributes)
+
+def parse_traceparent(header: Optional[str]):
+    """W3C traceparent -> (trace_id, parent_span_id, sampled), or None if absent or malformed"""
+    if not header:
+        return None
+    parts = header.strip().split('-')
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == '0' * 32 or parts[2] == '0' * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+def start_trace(name: str, traceparent: Optional[str] = None, force: bool = False, **attributes):
+    """Root span for a request, or None when it isn't sampled.
+
+    An incoming traceparent supplies the trace id, so our spans join the
+    caller's trace. Sampling is decided here by TRACE_SAMPLE_RATE; the caller's
+    sampled flag only counts with TRACE_TRUST_INCOMING_SAMPLED, so untrusted
+    clients can't turn on tracing and export for their requests. force traces
+    regardless, even with the exporter disabled.
+    """
+    incoming = parse_traceparent(traceparent)
+    trace_id, parent_id, sampled = incoming or (None, None, False)
+    if not (incoming and TRACE_TRUST_INCOMING_SAMPLED):
+        sampled = random.random() < TRACE_SAMPLE_RATE
+    if not force and (not sampled or TRACE_EXPORTER == 'none'):
+        return None
+    root = Span(Trace(trace_id), name, parent_id, attributes)
+    return root, _current_span.set(root)
+
+def finish_trace(root: Span, token, export: bool = True):
+    """End the root span; export=False keeps the trace in-process (benchmarks read it directly)"""
+    _current_span.reset(token)
+    root.end()
+    if export:
+        trace_exporter.submit(root.trace)
+
+def traceparent_of(root: Span) -> str:
+    return f"00-{root.trace.trace_id}-{root.span_id}-01"
+
+class TraceExporter:
+    """Writes finished traces from a background thread so requests never wait on I/O"""
+
+    def __init__(self, mode: str = TRACE_EXPORTER, queue_size: int = 1000):
+        self.mode = mode
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._file_logger: Optional[logging.Logger] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, trace: Trace):
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=30)]
+            except queue.Empty:
+                return
+            while len(batch) < 100:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if self.mode == 'otlp':
+                    self._post_otlp(batch)
+                else:
+                    self._write_file(batch)
+            except Exception as e:
+                logger.error(f"Failed to export {len(batch)} traces: {e}")
+
+    def _write_file(self, batch: List[Trace]):
+        if self._file_logger is None:
+            os.makedirs(os.path.dirname(os.path.abspath(TRACE_FILE)), exist_ok=True)
+            handler = RotatingFileHandler(TRACE_FILE, maxBytes=TRACE_FILE_MAX_BYTES, backupCount=TRACE_FILE_BACKUPS)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            file_logger = logging.getLogger('app.traces')
+            file_logger.propagate = False
+            file_logger.setLevel(logging.INFO)
+            file_logger.addHandler(handler)
+            self._file_logger = file_logger
+        for trace in batch:
+            self._file_logger.info(json.dumps({
+                "trace_id": trace.trace_id,
+                "spans": [span.to_dict() for span in trace.spans]
+            }, default=str))
+
+    def _post_otlp(self, batch: List[Trace]):
+        spans = []
+        for trace in batch:
+            for item in trace.spans:
+                spans.append({
+                    "traceId": trace.trace_id,
+                    "spanId": item.span_id,
+                    "parentSpanId": item.parent_id or "",
+                    "name": item.name,
+                    "kind": 2 if item.parent_id is None else 1,
+                    "startTimeUnixNano": str(item.start_ns),
+                    "endTimeUnixNano": str(item.end_ns),
+                    "attributes": [{"key": key, "value": {"stringValue": str(value)}} for key, value in item.attributes.items()],
+                    "status": {"code": 2, "message": item.error} if item.error else {"code": 1},
+                })
+        body = {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": TRACE_SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": spans}]
+        }]}
+        request = urllib.request.Request(
+            TRACE_OTLP_ENDPOINT, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+        )
+        urllib.request.urlopen(request, timeout=5).close()
+
+trace_exporter = TraceExporter()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_span.get() is None or context is None:
+        return
+    scope = _SpanScope("db.query", {"statement": statement[:500], "executemany": executemany})
+    scope.__enter__()
+    context._trace_scope = scope
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    scope = getattr(context, '_trace_scope', None)
+    if scope is not None:
+        context._trace_scope = None
+        scope.__exit__(None, None, None)
+
+def _handle_error(exception_context):
+    scope = getattr(exception_context.execution_context, '_trace_scope', None)
+    if scope is not None:
+        exception_context.execution_context._trace_scope = None
+        error = exception_context.original_exception
+        scope.__exit__(type(error), error, None)
+
+_installed = False
+
+def install_tracing_hooks():
+    """Give every SQL statement in a traced request its own span (idempotent)"""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(Engine, 'handle_error', _handle_error)
+    _installed = True
@@ -0,0 +1,58 @@
+import os
+import sys
+import signal
+import logging
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Recycle a worker once its resident memory passes this many MiB (0 = never)
+WORKER_MAX_RSS_MB = float(os.getenv('WORKER_MAX_RSS_MB', 1024))
+WORKER_RSS_CHECK_SECONDS = float(os.getenv('WORKER_RSS_CHECK_SECONDS', 10))
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process, or None where it can't be read cheaply"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, IndexError, ValueError):
+        pass
+    if sys.platform == 'darwin':
+        # Peak rather than current on macOS, which is close enough for a recycling limit
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024)
+    return None
+
+class RssWatchdog:
+    """Asks its own worker process to shut down gracefully once RSS passes a limit.
+
+    A large Excel parse can leave a worker holding hundreds of MB that CPython
+    never returns to the OS. SIGTERM makes uvicorn finish in-flight requests
+    and exit; the gunicorn master then starts a fresh worker in its place.
+    """
+
+    def __init__(self, max_rss_mb: float = WORKER_MAX_RSS_MB, interval: float = WORKER_RSS_CHECK_SECONDS):
+        self.max_rss_mb = max_rss_mb
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.max_rss_mb <= 0 or current_rss_mb() is None:
+            return
+        self._thread = threading.Thread(target=self._run, name="rss-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            rss = current_rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                logger.warning(f"Worker {os.getpid()} RSS {rss:.0f} MiB is over {self.max_rss_mb:.0f} MiB; recycling")
+                os.kill(os.getpid(), signal.SIGTERM)
+                return
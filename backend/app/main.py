@@ -1,18 +1,29 @@
 import os
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from dotenv import load_dotenv
 from app.routers import auth, users
 from app.routers import excel_uploads
 from app.routers import tags
 from app.routers import admin
 from app.routers import bookmarks
-from app.middleware.logging import LoggingMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.core.tracing import install_tracing_hooks
+from app.core.responses import TracedJSONResponse
+from app.core.query_stats import install_query_hooks
+from app.services.audit_sink import audit_sink
+from app.core.db import engine
+from app.core.schema import verify_schema
+from app.core.metrics import MetricsPublisher, render_metrics, scrape_allowed
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '../.env'))
 
-app = FastAPI()
+app = FastAPI(default_response_class=TracedJSONResponse)
 
 # Simplified CORS configuration - allow all origins for now
 app.add_middleware(
@@ -21,10 +32,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "Server-Timing", "X-Profile-Id", "traceparent"],  # Cursor for paginated listings, diagnostics
 )
 
-# Add logging middleware after CORS
-app.add_middleware(LoggingMiddleware)
+# Per-request SQL statement counts and timing
+install_query_hooks()
+app.add_middleware(QueryStatsMiddleware)
+
+# Admin-only per-request sampling profiler (X-Profile: 1)
+app.add_middleware(ProfilingMiddleware)
+
+# Sampled request traces (TRACE_SAMPLE_RATE or an incoming traceparent), with a span per SQL statement
+install_tracing_hooks()
+app.add_middleware(TracingMiddleware)
+
+# gzip/brotli for large JSON and text bodies (COMPRESSION_*); inside the metrics
+# middleware, so http_response_size_bytes counts the bytes actually sent
+app.add_middleware(CompressionMiddleware)
+
+# Request metrics and logging; added after CORS so it is outermost and times everything
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(users.router, prefix="/admin", tags=["admin"])
@@ -33,6 +60,33 @@ app.include_router(tags.router, prefix="/api", tags=["tags"])
 app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 app.include_router(bookmarks.router, prefix="")
 
+@app.on_event("startup")
+def check_schema_version():
+    # Migrations are an explicit deploy step (python migrate.py); a worker must
+    # not serve against a schema its models don't match
+    verify_schema(engine)
+
+@app.on_event("startup")
+def start_audit_sink():
+    # Started per worker process, after any fork
+    audit_sink.start()
+
+@app.on_event("shutdown")
+def stop_audit_sink():
+    # Flush queued activity logs before the process exits
+    audit_sink.stop()
+
+metrics_publisher = MetricsPublisher()
+
+@app.on_event("startup")
+def start_metrics_publisher():
+    # Multi-process mode only: lets a scrape on any worker report every worker's metrics
+    metrics_publisher.start()
+
+@app.on_event("shutdown")
+def stop_metrics_publisher():
+    metrics_publisher.stop()
+
 @app.get("/")
 def root():
     return {"message": "API is running"}
@@ -42,6 +96,13 @@ def root():
 def health_check():
     return {"status": "healthy", "message": "API is running"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics(request: Request):
+    """Prometheus text-format metrics, summed over all workers when there are several"""
+    if not scrape_allowed(request.client.host if request.client else None, request.headers.get('authorization')):
+        raise HTTPException(status_code=403, detail="Not allowed to read metrics")
+    return render_metrics()
+
 # Add OPTIONS handler for debugging
 @app.options("/{full_path:path}")
 async def options_handler(request: Request, full_path: str):
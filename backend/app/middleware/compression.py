@@ -0,0 +1,208 @@
+import os
+import time
+import zlib
+import importlib.util
+from functools import lru_cache
+from typing import Optional, Sequence
+from app.core.metrics import registry, route_template
+
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# Bodies smaller than this go out as they are; below ~1 KB the headers and CPU cost more than they save
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+# Server preference when the client accepts several equally; br needs the brotli package (in requirements.txt)
+COMPRESSION_ENCODINGS = [e.strip() for e in os.getenv('COMPRESSION_ENCODINGS', 'br,gzip').lower().split(',') if e.strip()]
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+# Brotli's 0-11 scale; 4 matches gzip -6's size on listing JSON with less CPU, 11 is far too slow per request
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', 4))
+
+COMPRESSIBLE_TYPES = {'application/json', 'application/javascript', 'application/xml', 'application/x-ndjson', 'image/svg+xml'}
+
+SECONDS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+COMPRESSED_RESPONSES = registry.counter('http_compressed_responses_total', 'Responses sent compressed', ['route', 'encoding'])
+UNCOMPRESSED_RESPONSES = registry.counter(
+    'http_uncompressed_responses_total', 'Compressible responses sent as they are, by reason', ['route', 'reason']
+)
+COMPRESSION_INPUT_BYTES = registry.counter(
+    'http_compression_input_bytes_total', 'Body bytes before compression', ['route', 'encoding']
+)
+COMPRESSION_OUTPUT_BYTES = registry.counter(
+    'http_compression_output_bytes_total', 'Body bytes after compression', ['route', 'encoding']
+)
+COMPRESSION_SECONDS = registry.histogram(
+    'http_compression_cpu_seconds', 'CPU time spent compressing one response body', ['route', 'encoding'], buckets=SECONDS_BUCKETS
+)
+
+@lru_cache(maxsize=None)
+def _brotli():
+    # Imported on the first br response, not at startup
+    import brotli
+    return brotli
+
+def available_encodings() -> list:
+    installed = {'gzip': True, 'br': importlib.util.find_spec('brotli') is not None}
+    return [encoding for encoding in COMPRESSION_ENCODINGS if installed.get(encoding)]
+
+def choose_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """Best of the available encodings by the client's q-values; ties go to the earlier one"""
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return (media_type.startswith('text/') or media_type in COMPRESSIBLE_TYPES
+            or media_type.endswith('+json') or media_type.endswith('+xml'))
+
+class GzipEncoder:
+    def __init__(self, level: int = GZIP_LEVEL):
+        # wbits 31: gzip container, with a zero mtime so equal bodies compress identically
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress one chunk of a stream and flush it, so the client can decode it right away"""
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b'') -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+class BrotliEncoder:
+    def __init__(self, quality: int = BROTLI_QUALITY):
+        self._compressor = _brotli().Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b'') -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+ENCODERS = {'gzip': GzipEncoder, 'br': BrotliEncoder}
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing text and JSON responses the client accepts.
+
+    Complete bodies under COMPRESSION_MIN_SIZE pass through untouched. A
+    streaming body is held back until it reaches the threshold (or ends), then
+    every further chunk is compressed and flushed as it arrives, so exports
+    keep streaming and never sit in memory whole. Input and output bytes and
+    the CPU time spent are recorded per route and encoding.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE, encodings: Optional[Sequence[str]] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings() if encodings is None else list(encodings)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not COMPRESSION_ENABLED or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        request_headers = dict(scope["headers"])
+        encoding = choose_encoding(request_headers.get(b"accept-encoding", b"").decode("latin-1"), self.encodings)
+
+        start = None
+        pending = []
+        pending_size = 0
+        encoder = None
+        input_bytes = output_bytes = 0
+        cpu_seconds = 0.0
+        passthrough = False
+
+        def skip(reason):
+            UNCOMPRESSED_RESPONSES.inc(route=route_template(scope), reason=reason)
+
+        async def send_uncompressed(body):
+            nonlocal passthrough
+            passthrough = True
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        async def send_wrapper(message):
+            nonlocal start, pending_size, encoder, input_bytes, output_bytes, cpu_seconds, passthrough
+            if message["type"] == "http.response.start":
+                headers = {key.lower(): value for key, value in message.get("headers", [])}
+                eligible = (is_compressible(headers.get(b"content-type", b"").decode("latin-1"))
+                            and b"content-encoding" not in headers
+                            and b"no-transform" not in headers.get(b"cache-control", b"").lower()
+                            and message["status"] not in (204, 304))
+                if not eligible:
+                    passthrough = True
+                    await send(message)
+                    return
+                # The body now depends on Accept-Encoding, whichever way this response goes
+                start = {**message, "headers": _with_vary(message.get("headers", []))}
+                if encoding is None:
+                    skip("not_accepted")
+                    passthrough = True
+                    await send(start)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                pending.append(body)
+                pending_size += len(body)
+                if pending_size < self.minimum_size:
+                    if more_body:
+                        return
+                    skip("below_minimum_size")
+                    await send_uncompressed(b"".join(pending))
+                    return
+                body = b"".join(pending)
+                pending.clear()
+                encoder = ENCODERS[encoding]()
+                headers = [(key, value) for key, value in start["headers"] if key.lower() != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode()))
+                started = time.thread_time()
+                compressed = encoder.compress(body) if more_body else encoder.finish(body)
+                cpu_seconds += time.thread_time() - started
+                if not more_body:
+                    headers.append((b"content-length", str(len(compressed)).encode()))
+                await send({**start, "headers": headers})
+            else:
+                started = time.thread_time()
+                compressed = encoder.compress(body) if more_body else encoder.finish(body)
+                cpu_seconds += time.thread_time() - started
+            input_bytes += len(body)
+            output_bytes += len(compressed)
+            if compressed or not more_body:
+                await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            if not more_body:
+                route = route_template(scope)
+                COMPRESSED_RESPONSES.inc(route=route, encoding=encoding)
+                COMPRESSION_INPUT_BYTES.inc(input_bytes, route=route, encoding=encoding)
+                COMPRESSION_OUTPUT_BYTES.inc(output_bytes, route=route, encoding=encoding)
+                COMPRESSION_SECONDS.observe(cpu_seconds, route=route, encoding=encoding)
+
+        await self.app(scope, receive, send_wrapper)
+
+def _with_vary(headers):
+    headers = list(headers)
+    for index, (key, value) in enumerate(headers):
+        if key.lower() == b"vary":
+            if b"accept-encoding" not in value.lower():
+                headers[index] = (key, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
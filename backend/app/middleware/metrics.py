@@ -0,0 +1,61 @@
+import time
+import logging
+from app.core.metrics import registry, route_template
+
+logger = logging.getLogger(__name__)
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+REQUESTS_IN_FLIGHT = registry.gauge('http_requests_in_flight', 'Requests currently being served')
+REQUEST_SECONDS = registry.histogram(
+    'http_request_duration_seconds', 'Time from request start to the last response byte', ['method', 'route']
+)
+RESPONSE_BYTES = registry.histogram(
+    'http_response_size_bytes', 'Response body size', ['method', 'route'], buckets=SIZE_BUCKETS
+)
+RESPONSES = registry.counter('http_responses_total', 'Responses by status code', ['method', 'route', 'status'])
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency, response size and status.
+
+    Unlike BaseHTTPMiddleware it doesn't wrap the response in a separate task,
+    so streaming responses pass straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        # Only log API requests and error responses to reduce noise
+        if path.startswith('/api/') or path.startswith('/auth/'):
+            logger.info(f"API Request: {method} {path}")
+
+        started = time.perf_counter()
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = route_template(scope)
+            REQUEST_SECONDS.observe(time.perf_counter() - started, method=method, route=route)
+            RESPONSE_BYTES.observe(size, method=method, route=route)
+            RESPONSES.inc(method=method, route=route, status=status_code)
+            if status_code >= 400:
+                logger.warning(f"Error Response: {status_code} for {method} {path}")
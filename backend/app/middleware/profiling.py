@@ -0,0 +1,50 @@
+from jose import jwt, JWTError
+from app.core.metrics import route_template
+from app.core.profiler import profile_request
+from app.services.auth_service import SECRET_KEY, ALGORITHM
+
+PROFILE_HEADER = b"x-profile"
+
+def _is_admin(headers) -> bool:
+    """Role claim of the bearer token; verified signature, no database lookup"""
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return False
+    return claims.get("role") == "admin"
+
+class ProfilingMiddleware:
+    """Samples a single request when an admin sends `X-Profile: 1`.
+
+    The profile id comes back in the X-Profile-Id response header; the folded
+    stacks are then available from /api/admin/profiles/{id}. Requests without
+    the header go straight to the app.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Nearly every request lacks the header; only build the dict and check the token for those that have it
+        requested = any(key == PROFILE_HEADER and value in (b"1", b"true") for key, value in scope["headers"])
+        if not requested or not _is_admin(dict(scope["headers"])):
+            await self.app(scope, receive, send)
+            return
+
+        async with profile_request(scope["path"]) as profile:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    message = {**message, "headers": list(message.get("headers", [])) + [(b"x-profile-id", profile.id.encode())]}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profile.endpoint = f"{scope['method']} {route_template(scope)}"
@@ -0,0 +1,33 @@
+from app.core.query_stats import SQL_QUERY_STATS_ENABLED, start_request_stats, end_request_stats
+
+class QueryStatsMiddleware:
+    """Attributes SQL statements to the request that ran them.
+
+    Adds a Server-Timing header with the statement count and DB time, feeds the
+    per-route SQL metrics and logs repeated statement shapes (likely N+1s).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SQL_QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request_stats(scope)
+        stats = token.var.get()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Statements run after the headers go out (streaming bodies) still count in the metrics
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stats.finish()
+            end_request_stats(token)
@@ -0,0 +1,72 @@
+from fastapi import params
+from fastapi.routing import APIRoute
+from app.core.metrics import route_template
+from app.core.tracing import current_span, span, start_trace, finish_trace, traceparent_of
+
+class TracingMiddleware:
+    """Opens the root span of sampled requests and joins an incoming W3C traceparent's trace.
+
+    Sampled responses carry a traceparent header pointing at the root span.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        traceparent = next((value for key, value in scope["headers"] if key == b"traceparent"), None)
+        started = start_trace(
+            f"{scope['method']} {scope['path']}",
+            traceparent.decode("latin-1") if traceparent else None,
+            method=scope["method"],
+            path=scope["path"]
+        )
+        if started is None:
+            await self.app(scope, receive, send)
+            return
+
+        root, token = started
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.set(status=message["status"])
+                headers = list(message.get("headers", [])) + [(b"traceparent", traceparent_of(root).encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            root.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            route = route_template(scope)
+            root.name = f"{scope['method']} {route}"
+            root.set(route=route)
+            finish_trace(root, token)
+
+class TracedBodyRoute(APIRoute):
+    """Route that reads the request body (JSON or multipart form) in a request.body span.
+
+    FastAPI parses the body before calling the endpoint and caches it on the
+    request, so reading it here first only moves that work under its own span.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if self.body_field is None:
+            return handler
+        is_form = isinstance(self.body_field.field_info, params.Form)
+
+        async def traced_handler(request):
+            if current_span() is not None:
+                with span("request.body", form=is_form):
+                    if is_form:
+                        await request.form()
+                    else:
+                        await request.body()
+            return await handler(request)
+
+        return traced_handler
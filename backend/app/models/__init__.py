@@ -5,6 +5,7 @@ from .activity_log import ActivityLog, ActivityType
 from .tag import Tag
 from .fire_news_tag import FireNewsTag
 from .bookmark import Bookmark
+from .user_session import UserSession
 
 __all__ = [
     "User",
@@ -15,5 +16,6 @@ __all__ = [
     "ActivityType",
     "Tag",
     "FireNewsTag",
-    "Bookmark"
+    "Bookmark",
+    "UserSession"
 ] 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, JSON, Computed
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.db import Base
@@ -18,13 +18,31 @@ class ActivityLog(Base):
     __tablename__ = "activity_logs"
 
     id = Column(Integer, primary_key=True, index=True)
+    # On MySQL the table is partitioned by month, which rules out a database-level
+    # foreign key; the ForeignKey here only drives the ORM relationship
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     action_type = Column(String(50), nullable=False)
     description = Column(Text, nullable=False)
     details = Column(Text, nullable=True)
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Structured event data (reporter, inserted, skipped, file_name, target_user_id,
+    # duration_ms); details/description stay as the human-readable text
+    payload = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Generated from payload so ingestion reports can filter and aggregate without parsing JSON
+    payload_reporter = Column(String(255), Computed("payload->>'$.reporter'", persisted=False))
+    payload_inserted = Column(Integer, Computed("CAST(payload->>'$.inserted' AS SIGNED)", persisted=False))
+    payload_skipped = Column(Integer, Computed("CAST(payload->>'$.skipped' AS SIGNED)", persisted=False))
     
     # Relationship
-    user = relationship("User", back_populates="activity_logs") 
\ No newline at end of file
+    user = relationship("User", back_populates="activity_logs")
+    
+    # Log browsing filters on user/action and always orders by created_at
+    __table_args__ = (
+        Index('ix_activity_logs_created_at', 'created_at'),
+        Index('ix_activity_logs_user_created', 'user_id', 'created_at'),
+        Index('ix_activity_logs_action_created', 'action_type', 'created_at'),
+        Index('ix_activity_logs_reporter_created', 'payload_reporter', 'created_at'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.db import Base
@@ -18,5 +18,8 @@ class Bookmark(Base):
     
     # Ensure unique bookmark per user per news item
     __table_args__ = (
+        UniqueConstraint('user_id', 'news_id', 'data_type', name='uq_user_news_type'),
+        # Serves the per-user listing, filtered by type and paged by created_at
+        Index('ix_bookmarks_user_type_created', 'user_id', 'data_type', 'created_at'),
         {'mysql_engine': 'InnoDB'}
     ) 
\ No newline at end of file
@@ -1,12 +1,15 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.sql import func
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
+from app.core.db import Base
 
 class FireNewsTag(Base):
     __tablename__ = 'fire_news_tags'
     id = Column(Integer, primary_key=True, index=True)
     fire_news_id = Column(Integer, ForeignKey('fire_news.id', ondelete='CASCADE'), nullable=False)
     tag_id = Column(Integer, ForeignKey('tags.id', ondelete='CASCADE'), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # One row per (news, tag) so ingestion and backfills can insert idempotently
+    __table_args__ = (
+        UniqueConstraint('fire_news_id', 'tag_id', name='uq_fire_news_tag'),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.core.db import Base
+
+class UserSession(Base):
+    """One refresh token. Rotation revokes the row and issues a new one in the same family."""
+    __tablename__ = "user_sessions"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # All tokens descending from one login; reuse of a rotated token revokes the whole family
+    family_id = Column(String(32), nullable=False)
+    # sha256 of the refresh token; the token itself is never stored
+    token_hash = Column(String(64), nullable=False, unique=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('ix_user_sessions_family', 'family_id'),
+        Index('ix_user_sessions_user', 'user_id'),
+    )
@@ -1,18 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.models.user import User
 from app.services.auth_service import get_current_user
 from app.services.activity_log_service import get_activity_log_service
-from app.schemas.activity_log import ActivityLogResponse
-from typing import List
+from app.schemas.activity_log import ActivityLogResponse, IngestionStatsRow
+from app.core.slow_queries import slow_query_log
+from app.core.profiler import profile_store
+from typing import List, Optional
 
 router = APIRouter()
 
 @router.get("/activity-logs", response_model=List[ActivityLogResponse])
 def get_activity_logs(
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page; overrides page"),
+    action_type: Optional[str] = Query(None),
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -21,27 +29,27 @@ def get_activity_logs(
         raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
     
     activity_log_service = get_activity_log_service(db)
-    logs = activity_log_service.get_all_activity_logs(limit=page_size)
+    logs, next_cursor = activity_log_service.list_activity_logs(
+        limit=page_size,
+        action_type=action_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        offset=(page - 1) * page_size
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
-    # Convert to response format
-    response_logs = []
-    for log in logs:
-        user_email = log.user.email if log.user else None
-        response_logs.append(ActivityLogResponse(
-            id=log.id,
-            action_type=log.action_type,
-            description=log.description,
-            details=log.details,
-            user_email=user_email,
-            created_at=log.created_at
-        ))
-    
-    return response_logs
+    return logs
 
-@router.get("/activity-logs/user/{user_id}")
+@router.get("/activity-logs/user/{user_id}", response_model=List[ActivityLogResponse])
 def get_user_activity_logs(
     user_id: int,
+    response: Response,
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -50,19 +58,74 @@ def get_user_activity_logs(
         raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
     
     activity_log_service = get_activity_log_service(db)
-    logs = activity_log_service.get_user_activity_logs(user_id, limit)
+    logs, next_cursor = activity_log_service.list_activity_logs(
+        limit=limit,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    return logs
+
+@router.get("/activity-logs/ingestion-stats", response_model=List[IngestionStatsRow])
+def get_ingestion_stats(
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    reporter: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Rows ingested per reporter per day (admin only)"""
+    if current_user.role.value not in ['admin', 'ADMIN']:
+        raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
     
-    # Convert to response format
-    response_logs = []
-    for log in logs:
-        user_email = log.user.email if log.user else None
-        response_logs.append(ActivityLogResponse(
-            id=log.id,
-            action_type=log.action_type,
-            description=log.description,
-            details=log.details,
-            user_email=user_email,
-            created_at=log.created_at
-        ))
+    activity_log_service = get_activity_log_service(db)
+    return activity_log_service.ingestion_stats(start_date=start_date, end_date=end_date, reporter=reporter)
+
+@router.get("/slow-queries")
+def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_user)
+):
+    """Recent statements over SLOW_QUERY_THRESHOLD_MS across all workers, with EXPLAIN plans (admin only)"""
+    if current_user.role.value not in ['admin', 'ADMIN']:
+        raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
+    
+    return {
+        "threshold_ms": slow_query_log.threshold * 1000,
+        "queries": slow_query_log.entries(limit)
+    }
+
+@router.delete("/slow-queries")
+def clear_slow_queries(current_user: User = Depends(get_current_user)):
+    """Empty the slow query log (admin only)"""
+    if current_user.role.value not in ['admin', 'ADMIN']:
+        raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
+    
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
+
+@router.get("/profiles")
+def list_profiles(current_user: User = Depends(get_current_user)):
+    """Request profiles captured with X-Profile: 1 by any worker, newest first (admin only)"""
+    if current_user.role.value not in ['admin', 'ADMIN']:
+        raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
+    
+    return profile_store.summaries()
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: str, current_user: User = Depends(get_current_user)):
+    """Folded stacks of one profile, for flamegraph.pl or speedscope (admin only).
+
+    The first frame of each stack is its category: python, sql or serialization.
+    """
+    if current_user.role.value not in ['admin', 'ADMIN']:
+        raise HTTPException(status_code=403, detail="Access denied. Admin role required.")
     
-    return response_logs 
\ No newline at end of file
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.folded()
@@ -1,20 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.schemas.auth import UserCreate, UserLogin, Token, UserOut
+from app.schemas.auth import UserCreate, UserLogin, Token, UserOut, RefreshRequest
 from app.services.auth_service import AuthService, get_current_user
 from app.services.user_service import get_user_service
 from app.services.activity_log_service import get_activity_log_service
+from app.services.password_service import password_service
+from app.services.session_service import get_session_service
 from app.core.db import get_db
 
 router = APIRouter()
 
 auth_service = AuthService()
 
+# Register and login are async so the bcrypt work can be awaited on the password
+# pool; their database calls still run on the regular threadpool.
 @router.post("/register", response_model=UserOut)
-def register(user: UserCreate, request: Request, db: Session = Depends(get_db)):
+async def register(user: UserCreate, request: Request, db: Session = Depends(get_db)):
     user_service = get_user_service(db)
     
-    db_user = user_service.get_by_email(user.email)
+    db_user = await run_in_threadpool(user_service.get_by_email, user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -23,25 +28,52 @@ def register(user: UserCreate, request: Request, db: Session = Depends(get_db)):
     user_agent = request.headers.get('user-agent')
     
     # Create user with activity logging
-    created_user = user_service.create_user(user, ip_address, user_agent)
+    hashed_password = await password_service.hash(user.password)
+    created_user = await run_in_threadpool(
+        user_service.create_user, user, ip_address, user_agent, hashed_password
+    )
     
     return created_user
 
 @router.post("/login", response_model=Token)
-def login(user: UserLogin, request: Request, db: Session = Depends(get_db)):
+async def login(user: UserLogin, request: Request, db: Session = Depends(get_db)):
     user_service = get_user_service(db)
     activity_log_service = get_activity_log_service(db)
     
-    db_user = user_service.authenticate_user(user.email, user.password)
+    db_user = await run_in_threadpool(user_service.get_by_email, user.email)
     if not db_user:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
+    valid, new_hash = await password_service.verify_and_update(user.password, db_user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=401, detail="Incorrect email or password")
+    if new_hash:
+        await run_in_threadpool(user_service.update_password_hash, db_user, new_hash)
     
     # Log user login
     ip_address = request.client.host
     user_agent = request.headers.get('user-agent')
-    activity_log_service.log_user_login(db_user, ip_address, user_agent)
+    await run_in_threadpool(activity_log_service.log_user_login, db_user, ip_address, user_agent)
     
-    return auth_service.create_token(db_user)
+    refresh_token = await run_in_threadpool(get_session_service(db).create_session, db_user)
+    return auth_service.create_token(db_user, refresh_token)
+
+@router.post("/refresh", response_model=Token)
+def refresh(data: RefreshRequest, db: Session = Depends(get_db)):
+    """Swap a refresh token for a new access token and a rotated refresh token"""
+    user, refresh_token = get_session_service(db).rotate(data.refresh_token)
+    return auth_service.create_token(user, refresh_token)
+
+@router.post("/logout")
+def logout(data: RefreshRequest, request: Request, db: Session = Depends(get_db)):
+    """End the session the refresh token belongs to"""
+    user_id = get_session_service(db).revoke(data.refresh_token)
+    if user_id is not None:
+        user = get_user_service(db).get_by_id(user_id)
+        if user:
+            ip_address = request.client.host
+            user_agent = request.headers.get('user-agent')
+            get_activity_log_service(db).log_user_logout(user, ip_address, user_agent)
+    return {"message": "Logged out"}
 
 @router.get("/me", response_model=UserOut)
 def me(current_user: UserOut = Depends(get_current_user)):
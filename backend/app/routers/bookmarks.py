@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.db import get_db
+from app.core.pagination import decode_cursor, encode_cursor, keyset_before
 from app.models.bookmark import Bookmark
 from app.models.user import User
 from app.models.fire_news import FireNews
-from app.services.auth_service import get_current_user
-from pydantic import BaseModel
+from app.services.auth_service import get_current_user, get_token_claims
+from app.schemas.auth import TokenClaims
+from app.services.bookmark_service import get_bookmark_service, invalidate_bookmark_index
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 router = APIRouter(prefix="/api/bookmarks", tags=["bookmarks"])
@@ -15,6 +19,10 @@ class BookmarkCreate(BaseModel):
     news_id: int
     data_type: str  # 'fire_news' or 'emergency_911'
 
+class BookmarkCheckRequest(BaseModel):
+    news_ids: List[int] = Field(..., max_length=500)
+    data_type: str  # 'fire_news' or 'emergency_911'
+
 class BookmarkResponse(BaseModel):
     id: int
     user_id: int
@@ -25,113 +33,113 @@ class BookmarkResponse(BaseModel):
     class Config:
         from_attributes = True
 
-class BookmarkWithNewsResponse(BaseModel):
-    id: int
-    user_id: int
-    news_id: int
-    data_type: str
-    created_at: datetime
-    news: dict  # Will contain the news item data
-    
-    class Config:
-        from_attributes = True
+BOOKMARK_COLUMNS = (
+    Bookmark.id,
+    Bookmark.user_id,
+    Bookmark.news_id,
+    Bookmark.data_type,
+    Bookmark.created_at,
+)
+BOOKMARK_KEYS = tuple(col.key for col in BOOKMARK_COLUMNS)
+
+# The news fields the bookmark tables (DataTable, Emergency911Table) and the bookmarks
+# page show, sort or search on; toggling verified/hidden sends them back in the update
+NEWS_SUMMARY_COLUMNS = (
+    FireNews.id,
+    FireNews.data_type,
+    FireNews.title,
+    FireNews.content,
+    FireNews.published_date,
+    FireNews.incident_date,
+    FireNews.url,
+    FireNews.source,
+    FireNews.fire_related_score,
+    FireNews.verification_result,
+    FireNews.state,
+    FireNews.county,
+    FireNews.city,
+    FireNews.province,
+    FireNews.country,
+    FireNews.latitude,
+    FireNews.longitude,
+    FireNews.image_url,
+    FireNews.tags,
+    FireNews.reporter_name,
+    FireNews.station_name,
+    FireNews.address,
+    FireNews.context,
+    FireNews.address_accuracy_score,
+    FireNews.incident_type,
+    FireNews.priority_level,
+    FireNews.response_time,
+    FireNews.units_dispatched,
+    FireNews.status,
+    FireNews.notes,
+    FireNews.is_verified,
+    FireNews.is_hidden,
+    FireNews.created_at,
+    FireNews.updated_at,
+)
+NEWS_SUMMARY_KEYS = tuple(col.key for col in NEWS_SUMMARY_COLUMNS)
 
 @router.post("/", response_model=BookmarkResponse)
-async def create_bookmark(
+def create_bookmark(
     bookmark: BookmarkCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Create a new bookmark for the current user"""
-    
-    # Check if news item exists
-    news_item = db.query(FireNews).filter(FireNews.id == bookmark.news_id).first()
-    if not news_item:
+    """Bookmark a news item for the current user (idempotent)"""
+    try:
+        new_bookmark = get_bookmark_service(db).create_bookmark(
+            current_user.id, bookmark.news_id, bookmark.data_type
+        )
+    except IntegrityError:
+        # The only constraint left to fail is the fire_news foreign key
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="News item not found"
         )
-    
-    # Check if bookmark already exists
-    existing_bookmark = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user.id,
-        Bookmark.news_id == bookmark.news_id,
-        Bookmark.data_type == bookmark.data_type
-    ).first()
-    
-    if existing_bookmark:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Bookmark already exists"
-        )
-    
-    # Create new bookmark
-    new_bookmark = Bookmark(
-        user_id=current_user.id,
-        news_id=bookmark.news_id,
-        data_type=bookmark.data_type
-    )
-    
-    db.add(new_bookmark)
-    db.commit()
-    db.refresh(new_bookmark)
+    invalidate_bookmark_index(current_user.id)
     
     return new_bookmark
 
-@router.get("/", response_model=List[BookmarkWithNewsResponse])
-async def get_user_bookmarks(
+@router.get("/")
+def get_user_bookmarks(
+    response: Response,
     data_type: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: TokenClaims = Depends(get_token_claims),
     db: Session = Depends(get_db)
 ):
-    """Get all bookmarks for the current user"""
-    
-    query = db.query(Bookmark).filter(Bookmark.user_id == current_user.id)
+    """Get the current user's bookmarks, newest first, with a summary of each news item"""
+    query = db.query(*BOOKMARK_COLUMNS, *NEWS_SUMMARY_COLUMNS).join(
+        FireNews, FireNews.id == Bookmark.news_id
+    ).filter(Bookmark.user_id == current_user.id)
     
     if data_type:
         query = query.filter(Bookmark.data_type == data_type)
     
-    bookmarks = query.all()
-    
-    # Get the news data for each bookmark
-    result = []
-    for bookmark in bookmarks:
-        news_item = db.query(FireNews).filter(FireNews.id == bookmark.news_id).first()
-        if news_item:
-            bookmark_dict = bookmark.__dict__.copy()
-            bookmark_dict['news'] = {
-                'id': news_item.id,
-                'title': news_item.title,
-                'content': news_item.content,
-                'published_date': news_item.published_date,
-                'incident_date': news_item.incident_date,
-                'url': news_item.url,
-                'source': news_item.source,
-                'fire_related_score': news_item.fire_related_score,
-                'verification_result': news_item.verification_result,
-                'state': news_item.state,
-                'county': news_item.county,
-                'city': news_item.city,
-                'province': news_item.province,
-                'country': news_item.country,
-                'latitude': news_item.latitude,
-                'longitude': news_item.longitude,
-                'image_url': news_item.image_url,
-                'tags': news_item.tags,
-                'reporter_name': news_item.reporter_name,
-                'incident_type': news_item.incident_type,
-                'priority_level': news_item.priority_level,
-                'response_time': news_item.response_time,
-                'units_dispatched': news_item.units_dispatched,
-                'status': news_item.status,
-                'notes': news_item.notes,
-                'is_verified': news_item.is_verified,
-                'is_hidden': news_item.is_hidden,
-                'created_at': news_item.created_at,
-                'updated_at': news_item.updated_at,
-                'data_type': news_item.data_type
-            }
-            result.append(bookmark_dict)
+    position = decode_cursor(cursor)
+    if position:
+        query = query.filter(keyset_before(Bookmark.created_at, Bookmark.id, position))
+    
+    rows = query.order_by(Bookmark.created_at.desc(), Bookmark.id.desc()).limit(limit + 1).all()
+    
+    bookmark_fields = len(BOOKMARK_COLUMNS)
+    result = [
+        {
+            **dict(zip(BOOKMARK_KEYS, row[:bookmark_fields])),
+            "news": dict(zip(NEWS_SUMMARY_KEYS, row[bookmark_fields:]))
+        }
+        for row in rows[:limit]
+    ]
+    
+    # Fetching one extra row tells us whether another page exists
+    if len(rows) > limit:
+        last = result[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last["created_at"], last["id"])
     
     return result
 
@@ -156,6 +164,7 @@ async def delete_bookmark(
     
     db.delete(bookmark)
     db.commit()
+    invalidate_bookmark_index(current_user.id)
     
     return {"message": "Bookmark deleted successfully"}
 
@@ -182,22 +191,28 @@ async def delete_bookmark_by_news_id(
     
     db.delete(bookmark)
     db.commit()
+    invalidate_bookmark_index(current_user.id)
     
     return {"message": "Bookmark deleted successfully"}
 
+@router.post("/check")
+def check_bookmark_status_batch(
+    check: BookmarkCheckRequest,
+    current_user: TokenClaims = Depends(get_token_claims),
+    db: Session = Depends(get_db)
+):
+    """Check which of a page of news items are bookmarked by the current user"""
+    bookmarked = get_bookmark_service(db).bookmarked_subset(current_user.id, check.news_ids, check.data_type)
+    return {"bookmarks": bookmarked}
+
 @router.get("/check/{news_id}")
-async def check_bookmark_status(
+def check_bookmark_status(
     news_id: int,
     data_type: str,
-    current_user: User = Depends(get_current_user),
+    current_user: TokenClaims = Depends(get_token_claims),
     db: Session = Depends(get_db)
 ):
     """Check if a news item is bookmarked by the current user"""
+    bookmark_id = get_bookmark_service(db).bookmarked_subset(current_user.id, [news_id], data_type).get(news_id)
     
-    bookmark = db.query(Bookmark).filter(
-        Bookmark.news_id == news_id,
-        Bookmark.user_id == current_user.id,
-        Bookmark.data_type == data_type
-    ).first()
-    
-    return {"is_bookmarked": bookmark is not None, "bookmark_id": bookmark.id if bookmark else None} 
\ No newline at end of file
+    return {"is_bookmarked": bookmark_id is not None, "bookmark_id": bookmark_id}
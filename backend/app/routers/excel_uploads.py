@@ -1,4 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, Form, Request, Depends, HTTPException, Query
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.models.excel_upload import ExcelUpload
@@ -6,21 +7,46 @@ from app.schemas.excel_upload import ExcelUploadCreate, ExcelUploadOut
 from app.models.user import User, UserRole
 from app.services.auth_service import get_current_user
 from app.services.activity_log_service import get_activity_log_service
+from app.services.tag_service import CHUNK_SIZE, get_tag_service
+from app.core.tracing import current_span, span
+from app.core.responses import TracedJSONResponse
+from app.core.row_encoders import RowEncoder
+from app.middleware.tracing import TracedBodyRoute
 from app.models.fire_news import FireNews
-import os, shutil
+import os, shutil, time
 from datetime import datetime
 from typing import List
 from pydantic import BaseModel
 from app.models.activity_log import ActivityType
-import pandas as pd
 import io
 
 
-router = APIRouter()
+# Ingest bodies are large, so their parsing gets its own span on traced requests
+router = APIRouter(route_class=TracedBodyRoute)
 
 UPLOAD_DIR = '/app/uploads'  # Make sure this directory exists in your Docker setup
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Fields of each listing view, in response order
+FIRE_NEWS_ROW = RowEncoder(
+    FireNews.id, FireNews.title, FireNews.content, FireNews.published_date, FireNews.url, FireNews.source,
+    FireNews.fire_related_score, FireNews.verification_result, FireNews.verified_at, FireNews.state,
+    FireNews.county, FireNews.city, FireNews.province, FireNews.country, FireNews.latitude, FireNews.longitude,
+    FireNews.image_url, FireNews.tags, FireNews.reporter_name, FireNews.is_verified, FireNews.is_hidden,
+    FireNews.created_at, FireNews.updated_at,
+)
+EMERGENCY_911_ROW = RowEncoder(
+    FireNews.id, FireNews.title, FireNews.incident_date, FireNews.station_name, FireNews.city, FireNews.county,
+    FireNews.address, FireNews.context, FireNews.verified_address, FireNews.latitude, FireNews.longitude,
+    FireNews.address_accuracy_score, FireNews.reporter_name, FireNews.incident_type, FireNews.priority_level,
+    FireNews.response_time, FireNews.units_dispatched, FireNews.status, FireNews.notes, FireNews.is_verified,
+    FireNews.is_hidden, FireNews.created_at, FireNews.updated_at,
+)
+
+# Columns that identify an already ingested row
+FIRE_NEWS_KEY = (FireNews.title, FireNews.published_date)
+EMERGENCY_911_KEY = (FireNews.station_name, FireNews.incident_date)
+
 # Pydantic models for JSON validation
 class FireNewsItem(BaseModel):
     title: str
@@ -72,7 +98,21 @@ class Emergency911BulkUpload(BaseModel):
     items: List[Emergency911Item]
 
 def parse_datetime(dt_str):
-    """Parse datetime string to datetime object with comprehensive format support"""
+    """Parse datetime string to datetime object with comprehensive format support.
+
+    Ingest calls this once or twice per row, so on a traced request the calls
+    and time spent are added up on the current span instead of a span each.
+    """
+    active = current_span()
+    if active is None:
+        return _parse_datetime(dt_str)
+    started = time.perf_counter()
+    try:
+        return _parse_datetime(dt_str)
+    finally:
+        active.add(parse_datetime_calls=1, parse_datetime_ms=(time.perf_counter() - started) * 1000)
+
+def _parse_datetime(dt_str):
     if not dt_str:
         return None
     
@@ -188,6 +228,49 @@ def parse_datetime(dt_str):
 
 
 
+def insert_new_rows(db: Session, candidates: List[FireNews], key, *criteria) -> list:
+    """Insert the candidates whose key columns match no stored row (nor an earlier candidate).
+
+    Uses a fixed number of statements per CHUNK_SIZE rows: one lookup of the
+    stored keys, one multi-row INSERT and one SELECT reading the new ids back.
+    Returns the inserted rows with the id, title, content, context and tags
+    tag_ingested needs.
+    """
+    if not candidates:
+        return []
+    names = [column.key for column in key]
+    first = key[0]
+
+    def key_of(row):
+        return tuple(getattr(row, name) for name in names)
+
+    def lookup(*columns, rows):
+        values = list({getattr(row, first.key) for row in rows})
+        for start in range(0, len(values), CHUNK_SIZE):
+            yield from db.query(*columns).filter(first.in_(values[start:start + CHUNK_SIZE]), *criteria)
+
+    with span("ingest.dedup", rows=len(candidates)):
+        stored = {tuple(row) for row in lookup(*key, rows=candidates)}
+    fresh = {}
+    for candidate in candidates:
+        if key_of(candidate) not in stored:
+            fresh.setdefault(key_of(candidate), candidate)
+    if not fresh:
+        return []
+
+    with span("ingest.insert_rows", rows=len(fresh)):
+        # render_nulls keeps rows with different None columns in one executemany; the
+        # loops never pass None for a column with a default (is_verified, is_hidden, ...)
+        db.execute(insert(FireNews).execution_options(render_nulls=True), [
+            {name: value for name, value in vars(row).items() if not name.startswith('_')}
+            for row in fresh.values()
+        ])
+        return [row for row in lookup(FireNews.id, FireNews.title, FireNews.content, FireNews.context, FireNews.tags,
+                                      FireNews.published_date, FireNews.station_name, FireNews.incident_date,
+                                      rows=fresh.values())
+                if key_of(row) in fresh and key_of(row) not in stored]
+
+
 @router.post("/excel-uploads", response_model=ExcelUploadOut)
 def upload_excel(
     request: Request,
@@ -239,17 +322,22 @@ def process_excel_upload(
     db: Session = Depends(get_db)
 ):
     """Process Excel file and upload fire news entries with specified reporter name"""
+    # pandas (and openpyxl behind read_excel) cost a few hundred ms and tens of MB
+    # to import, so only the workers that actually process a sheet pay for them
+    import pandas as pd
+    started = time.perf_counter()
     try:
         # Validate file type
         if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
             raise HTTPException(status_code=400, detail="Only Excel and CSV files (.xlsx, .xls, .csv) are supported")
         
         # Read file based on type
-        content = file.file.read()
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            df = pd.read_excel(io.BytesIO(content))
+        with span("ingest.read", file_name=file.filename):
+            content = file.file.read()
+            if file.filename.endswith('.csv'):
+                df = pd.read_csv(io.BytesIO(content))
+            else:
+                df = pd.read_excel(io.BytesIO(content))
         
         # Handle different column requirements based on reporter name
         if reporter_name == "911":
@@ -273,119 +361,112 @@ def process_excel_upload(
         
         # Convert DataFrame to list of dictionaries
         items = []
-        inserted = 0
+        candidates = []
         skipped = 0
         
-        for index, row in df.iterrows():
-            try:
-                if reporter_name == "911":
-                    # Process 911 emergency data
-                    # Create title from station name and date
-                    station_name = str(row.get('Station Name', '')).strip()
-                    date_str = str(row.get('Date', '')).strip()
-                    title = f"911 Emergency - {station_name} - {date_str}"
-                    
-                    # Create content from context
-                    context = str(row.get('Context', '')).strip()
-                    content = context if context else f"Emergency call from {station_name}"
-                    
-                    # Check for duplicate based on station name and date
-                    incident_date = parse_datetime(date_str)
-                    exists = db.query(FireNews).filter(
-                        FireNews.station_name == station_name,
-                        FireNews.incident_date == incident_date,
-                        FireNews.data_type == 'emergency_911'
-                    ).first()
+        with span("ingest.rows", rows=len(df)):
+            for index, row in df.iterrows():
+                try:
+                    if reporter_name == "911":
+                        # Process 911 emergency data
+                        # Create title from station name and date
+                        station_name = str(row.get('Station Name', '')).strip()
+                        date_str = str(row.get('Date', '')).strip()
+                        title = f"911 Emergency - {station_name} - {date_str}"
                     
-                    if exists:
-                        skipped += 1
-                        continue  # Skip duplicate
+                        # Create content from context
+                        context = str(row.get('Context', '')).strip()
+                        content = context if context else f"Emergency call from {station_name}"
                     
-                    # Create FireNews record for 911 emergency data
-                    fire_news = FireNews(
-                        title=title,
-                        content=content,
-                        incident_date=incident_date,
-                        station_name=station_name,
-                        city=str(row.get('City', '')) if pd.notna(row.get('City')) else None,
-                        county=str(row.get('County', '')) if pd.notna(row.get('County')) else None,
-                        address=str(row.get('Address', '')) if pd.notna(row.get('Address')) else None,
-                        context=context,
-                        verified_address=str(row.get('Verified Address', '')) if pd.notna(row.get('Verified Address')) else None,
-                        latitude=float(row.get('Lat', 0)) if pd.notna(row.get('Lat')) else None,
-                        longitude=float(row.get('Long', 0)) if pd.notna(row.get('Long')) else None,
-                        address_accuracy_score=float(row.get('Address Accuracy Score', 0)) if pd.notna(row.get('Address Accuracy Score')) else None,
-                        reporter_name=reporter_name,
-                        data_type='emergency_911'
-                    )
-                else:
-                    # Process regular fire news data
-                    # Create FireNewsItem with reporter_name from form
-                    item = FireNewsItem(
-                        title=str(row.get('title', '')).strip(),
-                        content=str(row.get('content', '')).strip(),
-                        published_date=str(row.get('published_date', '')) if pd.notna(row.get('published_date')) else None,
-                        url=str(row.get('url', '')) if pd.notna(row.get('url')) else None,
-                        source=str(row.get('source', '')) if pd.notna(row.get('source')) else None,
-                        fire_related_score=float(row.get('fire_related_score', 0.8)) if pd.notna(row.get('fire_related_score')) else 0.8,
-                        verification_result=str(row.get('verification_result', 'yes')) if pd.notna(row.get('verification_result')) else 'yes',
-                        verified_at=str(row.get('verified_at', '')) if pd.notna(row.get('verified_at')) else None,
-                        state=str(row.get('state', '')) if pd.notna(row.get('state')) else None,
-                        county=str(row.get('county', '')) if pd.notna(row.get('county')) else None,
-                        city=str(row.get('city', '')) if pd.notna(row.get('city')) else None,
-                        province=str(row.get('province', '')) if pd.notna(row.get('province')) else None,
-                        country=str(row.get('country', 'USA')) if pd.notna(row.get('country')) else 'USA',
-                        latitude=float(row.get('latitude')) if pd.notna(row.get('latitude')) else None,
-                        longitude=float(row.get('longitude')) if pd.notna(row.get('longitude')) else None,
-                        image_url=str(row.get('image_url', '')) if pd.notna(row.get('image_url')) else None,
-                        tags=str(row.get('tags', '')) if pd.notna(row.get('tags')) else None,
-                        reporter_name=reporter_name,  # Use the reporter name from form
-                        verifier_feedback=str(row.get('verifier_feedback', '')) if pd.notna(row.get('verifier_feedback')) else None
-                    )
+                        # Duplicates (same station name and date) are dropped after the loop
+                        incident_date = parse_datetime(date_str)
                     
-                    # Check for duplicate
-                    published_date = parse_datetime(item.published_date)
-                    exists = db.query(FireNews).filter(
-                        FireNews.title == item.title,
-                        FireNews.published_date == published_date
-                    ).first()
+                        # Create FireNews record for 911 emergency data
+                        fire_news = FireNews(
+                            title=title,
+                            content=content,
+                            incident_date=incident_date,
+                            station_name=station_name,
+                            city=str(row.get('City', '')) if pd.notna(row.get('City')) else None,
+                            county=str(row.get('County', '')) if pd.notna(row.get('County')) else None,
+                            address=str(row.get('Address', '')) if pd.notna(row.get('Address')) else None,
+                            context=context,
+                            verified_address=str(row.get('Verified Address', '')) if pd.notna(row.get('Verified Address')) else None,
+                            latitude=float(row.get('Lat', 0)) if pd.notna(row.get('Lat')) else None,
+                            longitude=float(row.get('Long', 0)) if pd.notna(row.get('Long')) else None,
+                            address_accuracy_score=float(row.get('Address Accuracy Score', 0)) if pd.notna(row.get('Address Accuracy Score')) else None,
+                            reporter_name=reporter_name,
+                            data_type='emergency_911'
+                        )
+                    else:
+                        # Process regular fire news data
+                        # Create FireNewsItem with reporter_name from form
+                        item = FireNewsItem(
+                            title=str(row.get('title', '')).strip(),
+                            content=str(row.get('content', '')).strip(),
+                            published_date=str(row.get('published_date', '')) if pd.notna(row.get('published_date')) else None,
+                            url=str(row.get('url', '')) if pd.notna(row.get('url')) else None,
+                            source=str(row.get('source', '')) if pd.notna(row.get('source')) else None,
+                            fire_related_score=float(row.get('fire_related_score', 0.8)) if pd.notna(row.get('fire_related_score')) else 0.8,
+                            verification_result=str(row.get('verification_result', 'yes')) if pd.notna(row.get('verification_result')) else 'yes',
+                            verified_at=str(row.get('verified_at', '')) if pd.notna(row.get('verified_at')) else None,
+                            state=str(row.get('state', '')) if pd.notna(row.get('state')) else None,
+                            county=str(row.get('county', '')) if pd.notna(row.get('county')) else None,
+                            city=str(row.get('city', '')) if pd.notna(row.get('city')) else None,
+                            province=str(row.get('province', '')) if pd.notna(row.get('province')) else None,
+                            country=str(row.get('country', 'USA')) if pd.notna(row.get('country')) else 'USA',
+                            latitude=float(row.get('latitude')) if pd.notna(row.get('latitude')) else None,
+                            longitude=float(row.get('longitude')) if pd.notna(row.get('longitude')) else None,
+                            image_url=str(row.get('image_url', '')) if pd.notna(row.get('image_url')) else None,
+                            tags=str(row.get('tags', '')) if pd.notna(row.get('tags')) else None,
+                            reporter_name=reporter_name,  # Use the reporter name from form
+                            verifier_feedback=str(row.get('verifier_feedback', '')) if pd.notna(row.get('verifier_feedback')) else None
+                        )
                     
-                    if exists:
-                        skipped += 1
-                        continue  # Skip duplicate
+                        # Duplicates (same title and date) are dropped after the loop
+                        published_date = parse_datetime(item.published_date)
                     
-                    # Create FireNews record for regular fire news
-                    fire_news = FireNews(
-                        title=item.title,
-                        content=item.content,
-                        published_date=published_date,
-                        url=item.url,
-                        source=item.source,
-                        fire_related_score=item.fire_related_score,
-                        verification_result=item.verification_result,
-                        verified_at=parse_datetime(item.verified_at),
-                        state=item.state,
-                        county=item.county,
-                        city=item.city,
-                        province=item.province,
-                        country=item.country,
-                        latitude=item.latitude,
-                        longitude=item.longitude,
-                        image_url=item.image_url,
-                        tags=item.tags,
-                        reporter_name=item.reporter_name,
-                        data_type='fire_news'
-                    )
+                        # Create FireNews record for regular fire news
+                        fire_news = FireNews(
+                            title=item.title,
+                            content=item.content,
+                            published_date=published_date,
+                            url=item.url,
+                            source=item.source,
+                            fire_related_score=item.fire_related_score,
+                            verification_result=item.verification_result,
+                            verified_at=parse_datetime(item.verified_at),
+                            state=item.state,
+                            county=item.county,
+                            city=item.city,
+                            province=item.province,
+                            country=item.country,
+                            latitude=item.latitude,
+                            longitude=item.longitude,
+                            image_url=item.image_url,
+                            tags=item.tags,
+                            reporter_name=item.reporter_name,
+                            data_type='fire_news'
+                        )
                 
-                db.add(fire_news)
-                inserted += 1
+                    candidates.append(fire_news)
                 
-            except Exception as e:
-                print(f"Error processing row {index + 1}: {str(e)}")
-                skipped += 1
-                continue
+                except Exception as e:
+                    print(f"Error processing row {index + 1}: {str(e)}")
+                    skipped += 1
+                    continue
         
-        db.commit()
+        # Link legacy and auto-detected tags to fire_news_tags in the same transaction
+        if reporter_name == "911":
+            new_rows = insert_new_rows(db, candidates, EMERGENCY_911_KEY, FireNews.data_type == 'emergency_911')
+        else:
+            new_rows = insert_new_rows(db, candidates, FIRE_NEWS_KEY)
+        inserted = len(new_rows)
+        skipped += len(candidates) - inserted
+        with span("ingest.insert", rows=len(new_rows)):
+            get_tag_service(db).tag_ingested(new_rows)
+        with span("ingest.commit"):
+            db.commit()
         
         # Log Excel processing activity (without user authentication)
         ip_address = request.client.host if request else None
@@ -397,7 +478,14 @@ def process_excel_upload(
             user_id=None,  # No user authentication required
             details=f"Excel upload with reporter '{reporter_name}': {inserted} new items, {skipped} skipped",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={
+                "reporter": reporter_name,
+                "inserted": inserted,
+                "skipped": skipped,
+                "file_name": file.filename,
+                "duration_ms": round((time.perf_counter() - started) * 1000)
+            }
         )
         
         return {
@@ -445,7 +533,7 @@ def get_fire_news(
             is_hidden=is_hidden
         )
     
-    query = db.query(FireNews)
+    query = db.query(*FIRE_NEWS_ROW.columns)
     # Filtering
     if county:
         query = query.filter(FireNews.county == county)
@@ -492,40 +580,13 @@ def get_fire_news(
     query = query.order_by(sort_col)
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
-    return {
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    }
+        "items": items,
+    })
 
 @router.get("/fire-news/search")
 def search_fire_news_by_title(
@@ -534,42 +595,15 @@ def search_fire_news_by_title(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100)
 ):
-    query = db.query(FireNews).filter(FireNews.title.ilike(f"%{title}%"))
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(FireNews.title.ilike(f"%{title}%"))
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
-    return {
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    }
+        "items": items,
+    })
 
 @router.get("/fire-news/reporters")
 def get_reporter_names(db: Session = Depends(get_db)):
@@ -698,55 +732,55 @@ def bulk_upload_fire_news(
     db: Session = Depends(get_db)
 ):
     """Bulk upload fire news from JSON data"""
+    started = time.perf_counter()
     try:
-        inserted = 0
-        skipped = 0
-        print(data.items)
-        for item in data.items:
-            # Parse dates
-            # print(f"Parsing published_date: {item.published_date}")
-            published_date = parse_datetime(item.published_date)
-            # print(f"Parsed published_date: {published_date}")
-            verified_at = parse_datetime(item.verified_at)
+        candidates = []
+        with span("ingest.rows", rows=len(data.items)):
+            for item in data.items:
+                # Parse dates
+                # print(f"Parsing published_date: {item.published_date}")
+                published_date = parse_datetime(item.published_date)
+                # print(f"Parsed published_date: {published_date}")
+                verified_at = parse_datetime(item.verified_at)
             
-            # Check for duplicate
-            exists = db.query(FireNews).filter(
-                FireNews.title == item.title,
-                FireNews.published_date == published_date
-            ).first()
+                # Duplicates (same title and date) are dropped after the loop
             
-            if exists:
-                skipped += 1
-                continue  # Skip duplicate
-            
-            # Create FireNews record
-            fire_news = FireNews(
-                title=item.title,
-                content=item.content,
-                published_date=published_date,
-                url=item.url,
-                source=item.source,
-                fire_related_score=item.fire_related_score,
-                verification_result=item.verification_result,
-                verified_at=verified_at,
-                state=item.state,
-                county=item.county,
-                city=item.city,
-                province=item.province,
-                country=item.country,
-                latitude=item.latitude,
-                longitude=item.longitude,
-                image_url=item.image_url,
-                tags=item.tags,
-                reporter_name=item.reporter_name,
-            )
+                # Create FireNews record
+                fire_news = FireNews(
+                    title=item.title,
+                    content=item.content,
+                    published_date=published_date,
+                    url=item.url,
+                    source=item.source,
+                    fire_related_score=item.fire_related_score,
+                    verification_result=item.verification_result,
+                    verified_at=verified_at,
+                    state=item.state,
+                    county=item.county,
+                    city=item.city,
+                    province=item.province,
+                    country=item.country,
+                    latitude=item.latitude,
+                    longitude=item.longitude,
+                    image_url=item.image_url,
+                    tags=item.tags,
+                    reporter_name=item.reporter_name,
+                )
             
-            db.add(fire_news)
-            inserted += 1
+                candidates.append(fire_news)
         
-        db.commit()
+        # Link legacy and auto-detected tags to fire_news_tags in the same transaction
+        new_rows = insert_new_rows(db, candidates, FIRE_NEWS_KEY)
+        inserted = len(new_rows)
+        skipped = len(candidates) - inserted
+        with span("ingest.insert", rows=len(new_rows)):
+            get_tag_service(db).tag_ingested(new_rows)
+        with span("ingest.commit"):
+            db.commit()
         
-        # Log bulk upload activity (without user authentication)
+        # Log bulk upload activity (without user authentication); a batch from one
+        # reporter is attributed to it, mixed batches have no reporter
+        reporters = {item.reporter_name for item in data.items}
         ip_address = request.client.host
         user_agent = request.headers.get('user-agent')
         activity_log_service = get_activity_log_service(db)
@@ -756,7 +790,13 @@ def bulk_upload_fire_news(
             user_id=None,  # No user authentication required
             details=f"Bulk upload: {inserted} new items, {skipped} duplicates",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={
+                "reporter": reporters.pop() if len(reporters) == 1 else None,
+                "inserted": inserted,
+                "skipped": skipped,
+                "duration_ms": round((time.perf_counter() - started) * 1000)
+            }
         )
         
         return {
@@ -777,38 +817,44 @@ def test_upload_fire_news(
     db: Session = Depends(get_db)
 ):
     """Test upload a single fire news item"""
+    started = time.perf_counter()
     try:
-        # Parse dates
-        print(f"Test upload - Parsing published_date: {data.published_date}")
-        published_date = parse_datetime(data.published_date)
-        print(f"Test upload - Parsed published_date: {published_date}")
-        verified_at = parse_datetime(data.verified_at)
+        with span("ingest.rows", rows=1):
+            # Parse dates
+            print(f"Test upload - Parsing published_date: {data.published_date}")
+            published_date = parse_datetime(data.published_date)
+            print(f"Test upload - Parsed published_date: {published_date}")
+            verified_at = parse_datetime(data.verified_at)
         
-        # Create FireNews record
-        fire_news = FireNews(
-            title=data.title,
-            content=data.content,
-            published_date=published_date,
-            url=data.url,
-            source=data.source,
-            fire_related_score=data.fire_related_score,
-            verification_result=data.verification_result,
-            verified_at=verified_at,
-            state=data.state,
-            county=data.county,
-            city=data.city,
-            province=data.province,
-            country=data.country,
-            latitude=data.latitude,
-            longitude=data.longitude,
-            image_url=data.image_url,
-            tags=data.tags,
-            reporter_name=data.reporter_name,
-        )
+            # Create FireNews record
+            fire_news = FireNews(
+                title=data.title,
+                content=data.content,
+                published_date=published_date,
+                url=data.url,
+                source=data.source,
+                fire_related_score=data.fire_related_score,
+                verification_result=data.verification_result,
+                verified_at=verified_at,
+                state=data.state,
+                county=data.county,
+                city=data.city,
+                province=data.province,
+                country=data.country,
+                latitude=data.latitude,
+                longitude=data.longitude,
+                image_url=data.image_url,
+                tags=data.tags,
+                reporter_name=data.reporter_name,
+            )
         
-        db.add(fire_news)
-        db.commit()
-        db.refresh(fire_news)
+        with span("ingest.insert", rows=1):
+            db.add(fire_news)
+            db.flush()
+            get_tag_service(db).tag_ingested([fire_news])
+        with span("ingest.commit"):
+            db.commit()
+            db.refresh(fire_news)
         
         # Log test upload activity
         ip_address = request.client.host
@@ -820,14 +866,22 @@ def test_upload_fire_news(
             user_id=None,  # No user authentication required for test upload
             details=f"Test upload: {data.title}",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={
+                "reporter": data.reporter_name,
+                "inserted": 1,
+                "skipped": 0,
+                "duration_ms": round((time.perf_counter() - started) * 1000)
+            }
         )
         
-        return {
-            "message": "Test upload successful",
-            "id": fire_news.id,
-            "title": fire_news.title
-        }
+        # The activity log's commit expired fire_news, so reading it back reloads the row
+        with span("ingest.response"):
+            return {
+                "message": "Test upload successful",
+                "id": fire_news.id,
+                "title": fire_news.title
+            }
         
     except Exception as e:
         db.rollback()
@@ -849,7 +903,7 @@ def get_all_leads(
     is_verified: bool = Query(None)
 ):
     """Get all non-hidden fire news entries (including 911 emergency data) with proper pagination"""
-    query = db.query(FireNews).filter(
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(
         FireNews.is_hidden == False
     )
     
@@ -895,41 +949,14 @@ def get_all_leads(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    }
+        "items": items,
+    })
 
 @router.get("/fire-news/tweet")
 def get_tweet_news(
@@ -947,7 +974,7 @@ def get_tweet_news(
     is_verified: bool = Query(None)
 ):
     """Get Twitter Fire Detection Bot entries with proper pagination"""
-    query = db.query(FireNews).filter(
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(
         FireNews.reporter_name == 'Twitter Fire Detection Bot',
         FireNews.is_hidden == False
     )
@@ -994,41 +1021,14 @@ def get_tweet_news(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    }
+        "items": items,
+    })
 
 @router.get("/fire-news/web")
 def get_web_news(
@@ -1046,7 +1046,7 @@ def get_web_news(
     is_verified: bool = Query(None)
 ):
     """Get web entries (non-Twitter, non-hidden, non-911) with proper pagination"""
-    query = db.query(FireNews).filter(
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(
         FireNews.reporter_name != 'Twitter Fire Detection Bot',
         FireNews.reporter_name != '911',
         FireNews.data_type != 'emergency_911',
@@ -1095,41 +1095,14 @@ def get_web_news(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    }
+        "items": items,
+    })
 
 @router.get("/fire-news/hidden")
 def get_hidden_news(
@@ -1147,7 +1120,7 @@ def get_hidden_news(
     is_verified: bool = Query(None)
 ):
     """Get hidden fire news entries with proper pagination"""
-    query = db.query(FireNews).filter(FireNews.is_hidden == True)
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(FireNews.is_hidden == True)
     
     # Filtering
     if county:
@@ -1191,41 +1164,14 @@ def get_hidden_news(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    } 
+        "items": items,
+    }) 
 
 @router.get("/fire-news/others")
 def get_others_news(
@@ -1243,7 +1189,7 @@ def get_others_news(
     is_verified: bool = Query(None)
 ):
     """Get fire news entries where reporter_name is empty or null"""
-    query = db.query(FireNews).filter(
+    query = db.query(*FIRE_NEWS_ROW.columns).filter(
         (FireNews.reporter_name.is_(None)) | 
         (FireNews.reporter_name == '') | 
         (FireNews.reporter_name == 'null')
@@ -1291,41 +1237,14 @@ def get_others_news(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = FIRE_NEWS_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "content": n.content,
-                "published_date": n.published_date.isoformat() if n.published_date else None,
-                "url": n.url,
-                "source": n.source,
-                "fire_related_score": n.fire_related_score,
-                "verification_result": n.verification_result,
-                "verified_at": n.verified_at.isoformat() if n.verified_at else None,
-                "state": n.state,
-                "county": n.county,
-                "city": n.city,
-                "province": n.province,
-                "country": n.country,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "image_url": n.image_url,
-                "tags": n.tags,
-                "reporter_name": n.reporter_name,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    } 
+        "items": items,
+    }) 
 
 @router.get("/fire-news/others-count")
 def get_others_count(db: Session = Depends(get_db)):
@@ -1353,7 +1272,7 @@ def get_911_emergency_data(
     status: str = Query(None)
 ):
     """Get 911 emergency data entries"""
-    query = db.query(FireNews).filter(FireNews.data_type == 'emergency_911')
+    query = db.query(*EMERGENCY_911_ROW.columns).filter(FireNews.data_type == 'emergency_911')
     
     # Filtering
     if county:
@@ -1410,41 +1329,14 @@ def get_911_emergency_data(
     
     # Pagination
     total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
+    items = EMERGENCY_911_ROW.page(db, query, page, page_size)
     
-    return {
+    return TracedJSONResponse({
         "total": total,
         "page": page,
         "page_size": page_size,
-        "items": [
-            {
-                "id": n.id,
-                "title": n.title,
-                "incident_date": n.incident_date.isoformat() if n.incident_date else None,
-                "station_name": n.station_name,
-                "city": n.city,
-                "county": n.county,
-                "address": n.address,
-                "context": n.context,
-                "verified_address": n.verified_address,
-                "latitude": n.latitude,
-                "longitude": n.longitude,
-                "address_accuracy_score": n.address_accuracy_score,
-                "reporter_name": n.reporter_name,
-                "incident_type": n.incident_type,
-                "priority_level": n.priority_level,
-                "response_time": n.response_time,
-                "units_dispatched": n.units_dispatched,
-                "status": n.status,
-                "notes": n.notes,
-                "is_verified": getattr(n, 'is_verified', False),
-                "is_hidden": getattr(n, 'is_hidden', False),
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-                "updated_at": n.updated_at.isoformat() if n.updated_at else None,
-            }
-            for n in items
-        ]
-    } 
+        "items": items,
+    }) 
 
 
 @router.post("/fire-news/add-911-reporter")
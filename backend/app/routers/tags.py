@@ -7,6 +7,7 @@ from app.models.fire_news_tag import FireNewsTag
 from app.schemas.tag import TagCreate, TagUpdate, Tag as TagSchema, TagList
 from app.models.user import User
 from app.services.auth_service import get_current_user
+from app.services.auto_tagger import invalidate_auto_tagger
 
 router = APIRouter()
 
@@ -81,6 +82,7 @@ def create_tag(
     db.add(db_tag)
     db.commit()
     db.refresh(db_tag)
+    invalidate_auto_tagger()
     return db_tag
 
 @router.put("/tags/{tag_id}", response_model=TagSchema)
@@ -101,6 +103,7 @@ def update_tag(
     
     db.commit()
     db.refresh(db_tag)
+    invalidate_auto_tagger()
     return db_tag
 
 @router.delete("/tags/{tag_id}")
@@ -117,6 +120,7 @@ def delete_tag(
     # Soft delete - set is_active to False
     db_tag.is_active = False
     db.commit()
+    invalidate_auto_tagger()
     
     return {"message": "Tag deleted successfully"}
 
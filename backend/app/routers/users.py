@@ -1,16 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
 from app.core.db import get_db
 from app.models.user import User, UserRole
 from app.models.activity_log import ActivityLog, ActivityType
-from app.schemas.auth import UserResponse, UserUpdate
+from app.schemas.auth import TokenClaims, UserResponse, UserUpdate
 from app.schemas.activity_log import ActivityLogResponse
 from app.services.auth_service import get_current_user
+from app.services.activity_log_service import get_activity_log_service
 from typing import List
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
+# Admin dashboard statistics are served from a short-lived cache so opening
+# the panel doesn't re-aggregate the whole activity log every time
+STATS_CACHE_TTL_SECONDS = float(os.getenv('STATS_CACHE_TTL_SECONDS', 30))
+_stats_cache = TTLCache(ttl_seconds=STATS_CACHE_TTL_SECONDS)
+
+def _actor(user: User) -> TokenClaims:
+    """Identity of the acting admin, still readable after a commit expires the User"""
+    return TokenClaims(id=user.id, email=user.email, role=user.role.value)
+
+def _count_where(condition):
+    return func.sum(case((condition, 1), else_=0))
+
 @router.get("/users", response_model=List[UserResponse])
 def get_all_users(
     db: Session = Depends(get_db),
@@ -39,15 +55,25 @@ def get_user_statistics(
             detail="Only administrators can view user statistics"
         )
     
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    admin_users = db.query(User).filter(User.role == UserRole.ADMIN).count()
-    reporter_users = db.query(User).filter(User.role == UserRole.REPORTER).count()
-    regular_users = db.query(User).filter(User.role == UserRole.USER).count()
-    
-    # Recent activity (last 7 days)
+    return _stats_cache.get_or_set("users", lambda: _compute_user_statistics(db))
+
+def _compute_user_statistics(db: Session):
+    # Every count comes from one conditional-aggregate query over users, with
+    # the recent activity count folded in as a scalar subquery
     week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_activities = db.query(ActivityLog).filter(ActivityLog.created_at >= week_ago).count()
+    recent_activities = db.query(func.count(ActivityLog.id)).filter(
+        ActivityLog.created_at >= week_ago
+    ).scalar_subquery()
+    
+    row = db.query(
+        func.count(User.id),
+        _count_where(User.is_active == True),
+        _count_where(User.role == UserRole.ADMIN),
+        _count_where(User.role == UserRole.REPORTER),
+        _count_where(User.role == UserRole.USER),
+        recent_activities
+    ).one()
+    total_users, active_users, admin_users, reporter_users, regular_users, recent = row
     
     return {
         "total_users": total_users,
@@ -56,7 +82,7 @@ def get_user_statistics(
         "admin_users": admin_users,
         "reporter_users": reporter_users,
         "regular_users": regular_users,
-        "recent_activities": recent_activities
+        "recent_activities": recent
     }
 
 @router.put("/users/{user_id}/role")
@@ -99,20 +125,16 @@ def update_user_role(
     
     old_role = user.role.value
     user.role = UserRole(new_role)
-    
-    # Create activity log
-    activity_log = ActivityLog(
-        user_id=user.id,
-        action_type=ActivityType.ROLE_CHANGED,
-        description=f"User {user.email} role changed from {old_role} to {new_role}",
-        details=f"Role updated by admin {current_user.email}"
-    )
-    db.add(activity_log)
+    # Read before the commit expires it; the audit row is only written once the change is committed
+    actor = _actor(current_user)
     
     db.commit()
     db.refresh(user)
+    _stats_cache.invalidate()
+    updated = UserResponse.from_orm(user)
+    get_activity_log_service(db).log_role_change(user, new_role, changed_by=actor, old_role=old_role)
     
-    return {"message": f"User role updated to {new_role}", "user": UserResponse.from_orm(user)}
+    return {"message": f"User role updated to {new_role}", "user": updated}
 
 @router.delete("/users/{user_id}")
 def delete_user(
@@ -148,27 +170,26 @@ def delete_user(
             )
     
     user_email = user.email
+    actor = _actor(current_user)
     db.delete(user)
     
-    # Create activity log
-    activity_log = ActivityLog(
-        action_type=ActivityType.USER_DELETED,
-        description=f"User {user_email} was deleted",
-        details=f"User account removed by admin {current_user.email}"
-    )
-    db.add(activity_log)
-    
     db.commit()
+    _stats_cache.invalidate()
+    get_activity_log_service(db).log_user_deletion(user_email, deleted_by=actor, user_id=user_id)
     return {"message": "User deleted successfully"}
 
 @router.get("/activity-logs", response_model=List[ActivityLogResponse])
 def get_activity_logs(
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     action_type: str = Query(None),
-    user_id: int = Query(None)
+    user_id: int = Query(None),
+    start_date: str = Query(None),
+    end_date: str = Query(None),
+    cursor: str = Query(None, description="Value of X-Next-Cursor from the previous page; overrides skip")
 ):
     """Get activity logs with filtering - Admin only"""
     if current_user.role != UserRole.ADMIN:
@@ -177,34 +198,19 @@ def get_activity_logs(
             detail="Only administrators can view activity logs"
         )
     
-    query = db.query(ActivityLog)
-    
-    if action_type:
-        query = query.filter(ActivityLog.action_type == action_type)
-    
-    if user_id:
-        query = query.filter(ActivityLog.user_id == user_id)
-    
-    logs = query.order_by(ActivityLog.created_at.desc()).offset(skip).limit(limit).all()
-    
-    # Convert to response format with user email
-    response_logs = []
-    for log in logs:
-        user_email = None
-        if log.user_id:
-            user = db.query(User).filter(User.id == log.user_id).first()
-            user_email = user.email if user else None
-        
-        response_logs.append(ActivityLogResponse(
-            id=log.id,
-            action_type=log.action_type,
-            description=log.description,
-            details=log.details,
-            user_email=user_email,
-            created_at=log.created_at
-        ))
-    
-    return response_logs
+    logs, next_cursor = get_activity_log_service(db).list_activity_logs(
+        limit=limit,
+        user_id=user_id,
+        action_type=action_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        offset=skip
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    return logs
 
 @router.get("/activity-logs/stats")
 def get_activity_statistics(
@@ -218,26 +224,34 @@ def get_activity_statistics(
             detail="Only administrators can view activity statistics"
         )
     
-    total_activities = db.query(ActivityLog).count()
-    
-    # Activities by type
-    activities_by_type = {}
-    for activity_type in ActivityType:
-        count = db.query(ActivityLog).filter(ActivityLog.action_type == activity_type.value).count()
-        activities_by_type[activity_type.value] = count
-    
-    # Recent activities (last 24 hours)
+    return _stats_cache.get_or_set("activity", lambda: _compute_activity_statistics(db))
+
+def _compute_activity_statistics(db: Session):
+    # Totals, per-type counts and the last-24h count from a single GROUP BY
     day_ago = datetime.utcnow() - timedelta(days=1)
-    recent_activities = db.query(ActivityLog).filter(ActivityLog.created_at >= day_ago).count()
+    type_counts = db.query(
+        ActivityLog.action_type,
+        func.count(ActivityLog.id),
+        _count_where(ActivityLog.created_at >= day_ago)
+    ).group_by(ActivityLog.action_type).all()
+    
+    activities_by_type = {activity_type.value: 0 for activity_type in ActivityType}
+    total_activities = 0
+    recent_activities = 0
+    for action_type, count, recent in type_counts:
+        total_activities += count
+        recent_activities += recent or 0
+        if action_type in activities_by_type:
+            activities_by_type[action_type] = count
     
     # Activities by user
     user_activities = db.query(
         ActivityLog.user_id,
         User.email,
-        db.func.count(ActivityLog.id).label('activity_count')
+        func.count(ActivityLog.id).label('activity_count')
     ).join(User, ActivityLog.user_id == User.id, isouter=True)\
      .group_by(ActivityLog.user_id, User.email)\
-     .order_by(db.func.count(ActivityLog.id).desc())\
+     .order_by(func.count(ActivityLog.id).desc())\
      .limit(10).all()
     
     return {
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Optional
+from datetime import date, datetime
 
 class ActivityLogBase(BaseModel):
     action_type: str
@@ -8,6 +8,7 @@ class ActivityLogBase(BaseModel):
     details: Optional[str] = None
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
 
 class ActivityLogCreate(ActivityLogBase):
     user_id: Optional[int] = None
@@ -25,8 +26,16 @@ class ActivityLogResponse(BaseModel):
     action_type: str
     description: str
     details: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
     user_email: Optional[str] = None
     created_at: datetime
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class IngestionStatsRow(BaseModel):
+    day: date
+    reporter: Optional[str] = None
+    uploads: int
+    inserted: int
+    skipped: int
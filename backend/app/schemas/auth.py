@@ -28,6 +28,14 @@ class Token(BaseModel):
     token_type: str
     refresh_token: Optional[str] = None
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class TokenClaims(BaseModel):
+    id: int
+    email: str
+    role: str
+
 class UserOut(BaseModel):
     id: int
     email: EmailStr
@@ -0,0 +1,126 @@
+import os
+import gzip
+import json
+import logging
+from datetime import date, datetime
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.models.activity_log import ActivityLog
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_LOG_RETENTION_MONTHS = int(os.getenv('ACTIVITY_LOG_RETENTION_MONTHS', 12))
+ACTIVITY_LOG_ARCHIVE_DIR = os.getenv('ACTIVITY_LOG_ARCHIVE_DIR', '/app/archive/activity_logs')
+# How many months of empty partitions to keep ready ahead of the current one
+ACTIVITY_LOG_PARTITIONS_AHEAD = int(os.getenv('ACTIVITY_LOG_PARTITIONS_AHEAD', 2))
+
+TABLE = ActivityLog.__tablename__
+EXPORT_COLUMNS = [column.name for column in ActivityLog.__table__.columns]
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+def add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+def retention_cutoff(today: Optional[date] = None, months: int = ACTIVITY_LOG_RETENTION_MONTHS) -> date:
+    """Rows created before this date are expired"""
+    return add_months(month_start(today or datetime.utcnow().date()), -months)
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+class ActivityLogRetention:
+    """Keeps activity_logs to a retention window, archiving expired months before removal.
+
+    On MySQL the table is RANGE-partitioned by month (see the d81f3b6e4a27
+    migration), so expiry exports a partition and then drops it whole. Other
+    databases fall back to exporting and deleting the expired rows.
+    """
+
+    def __init__(self, conn: Connection, archive_dir: str = ACTIVITY_LOG_ARCHIVE_DIR):
+        self.conn = conn
+        self.archive_dir = archive_dir
+        self.partitioned = conn.dialect.name == 'mysql' and bool(self.list_partitions())
+
+    def list_partitions(self) -> List[Tuple[str, Optional[int]]]:
+        """(name, TO_DAYS upper bound) of each partition, oldest first; pmax has no bound"""
+        rows = self.conn.execute(text(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ), {"table": TABLE}).all()
+        return [(name, None if bound == 'MAXVALUE' else int(bound)) for name, bound in rows]
+
+    def ensure_future_partitions(self, today: Optional[date] = None, months_ahead: int = ACTIVITY_LOG_PARTITIONS_AHEAD) -> List[str]:
+        """Split pmax so each month up to months_ahead has its own partition"""
+        if not self.partitioned:
+            return []
+        existing = {name for name, _ in self.list_partitions()}
+        current = month_start(today or datetime.utcnow().date())
+        months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+        missing = [month for month in months if partition_name(month) not in existing]
+        # Only months after the newest existing partition can be carved out of pmax
+        newest = max((name for name in existing if name != 'pmax'), default='p000000')
+        missing = [month for month in missing if partition_name(month) > newest]
+        if not missing:
+            return []
+        definitions = ", ".join(
+            f"PARTITION {partition_name(month)} VALUES LESS THAN (TO_DAYS('{add_months(month, 1):%Y-%m-%d}'))"
+            for month in missing
+        )
+        self.conn.execute(text(
+            f"ALTER TABLE {TABLE} REORGANIZE PARTITION pmax INTO ({definitions}, PARTITION pmax VALUES LESS THAN MAXVALUE)"
+        ))
+        return [partition_name(month) for month in missing]
+
+    def expired_partitions(self, cutoff: date) -> List[str]:
+        cutoff_days = self.conn.execute(text("SELECT TO_DAYS(:cutoff)"), {"cutoff": cutoff}).scalar()
+        return [name for name, bound in self.list_partitions() if bound is not None and bound <= cutoff_days]
+
+    def export(self, name: str, select_sql: str, params: dict) -> Tuple[str, int]:
+        """Stream rows into a gzip'd JSON-lines file; written under a temp name, then renamed"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = os.path.join(self.archive_dir, f"{TABLE}_{name}.jsonl.gz")
+        tmp_path = f"{path}.tmp"
+        count = 0
+        result = self.conn.execution_options(stream_results=True).execute(text(select_sql), params)
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as archive:
+            for row in result:
+                archive.write(json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_json_default) + "\n")
+                count += 1
+        os.replace(tmp_path, path)
+        return path, count
+
+    def enforce(self, today: Optional[date] = None, months: int = ACTIVITY_LOG_RETENTION_MONTHS) -> List[dict]:
+        """Archive and remove everything older than the retention window"""
+        cutoff = retention_cutoff(today, months)
+        columns = ", ".join(EXPORT_COLUMNS)
+        removed = []
+
+        if self.partitioned:
+            self.ensure_future_partitions(today)
+            for name in self.expired_partitions(cutoff):
+                path, count = self.export(name, f"SELECT {columns} FROM {TABLE} PARTITION ({name}) ORDER BY id", {})
+                self.conn.execute(text(f"ALTER TABLE {TABLE} DROP PARTITION {name}"))
+                logger.info(f"Archived {count} activity logs to {path} and dropped partition {name}")
+                removed.append({"partition": name, "rows": count, "archive": path})
+            return removed
+
+        params = {"cutoff": cutoff}
+        if not self.conn.execute(text(f"SELECT 1 FROM {TABLE} WHERE created_at < :cutoff LIMIT 1"), params).first():
+            return removed
+        # Row-level expiry can run repeatedly for the same cutoff, so each run gets its own archive
+        name = f"before_{cutoff:%Y%m}_{datetime.utcnow():%Y%m%d%H%M%S}"
+        path, count = self.export(name, f"SELECT {columns} FROM {TABLE} WHERE created_at < :cutoff ORDER BY id", params)
+        self.conn.execute(text(f"DELETE FROM {TABLE} WHERE created_at < :cutoff"), params)
+        self.conn.commit()
+        removed.append({"partition": None, "rows": count, "archive": path})
+        return removed
@@ -1,7 +1,12 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.core.pagination import decode_cursor, encode_cursor, keyset_before
 from app.models.activity_log import ActivityLog, ActivityType
 from app.models.user import User
-from typing import Optional
+from app.schemas.auth import TokenClaims
+from app.services.audit_sink import audit_sink
+from app.core.tracing import span
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 def get_activity_log_service(db: Session):
@@ -18,22 +23,39 @@ class ActivityLogService:
         user_id: Optional[int] = None,
         details: Optional[str] = None,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None
     ) -> ActivityLog:
-        """Create an activity log entry"""
-        activity_log = ActivityLog(
+        """Create an activity log entry.
+
+        payload holds the structured fields of the event (reporter, inserted,
+        skipped, file_name, target_user_id, actor_user_id, duration_ms) for reporting.
+        When the background audit sink is running the row is queued and written
+        in a later batch, and the returned (unsaved) ActivityLog has no id.
+        """
+        if payload is not None:
+            # Absent keys read back as SQL NULL from the generated columns; JSON nulls would not
+            payload = {key: value for key, value in payload.items() if value is not None}
+        row = dict(
             user_id=user_id,
             action_type=action_type.value,
             description=description,
             details=details,
             ip_address=ip_address,
             user_agent=user_agent,
+            payload=payload,
             created_at=datetime.utcnow()
         )
-        self.db.add(activity_log)
-        self.db.commit()
-        self.db.refresh(activity_log)
-        return activity_log
+        with span("activity_log.write", action_type=row["action_type"], queued=audit_sink.accepts()):
+            if audit_sink.accepts():
+                audit_sink.submit(row)
+                return ActivityLog(**row)
+
+            activity_log = ActivityLog(**row)
+            self.db.add(activity_log)
+            self.db.commit()
+            # No refresh: callers rarely read the row back, and an expired one reloads on first access
+            return activity_log
 
     def log_user_login(self, user: User, ip_address: Optional[str] = None, user_agent: Optional[str] = None):
         """Log user login activity"""
@@ -66,7 +88,8 @@ class ActivityLogService:
             user_id=user.id if user else None,
             details=f"File upload: {file_name}",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={"file_name": file_name}
         )
 
     def log_user_logout(self, user: User, ip_address: Optional[str] = None, user_agent: Optional[str] = None):
@@ -80,26 +103,29 @@ class ActivityLogService:
             user_agent=user_agent
         )
 
-    def log_role_change(self, user: User, new_role: str, changed_by: User, ip_address: Optional[str] = None, user_agent: Optional[str] = None):
-        """Log role change activity"""
+    def log_role_change(self, user: User, new_role: str, changed_by: Union[User, TokenClaims], ip_address: Optional[str] = None, user_agent: Optional[str] = None, old_role: Optional[str] = None):
+        """Log role change activity against the affected user; the admin who made it is the payload's actor"""
+        change = f"from {old_role} to {new_role}" if old_role else f"to {new_role}"
         return self.create_activity_log(
             action_type=ActivityType.ROLE_CHANGED,
-            description=f"User {user.email} role changed to {new_role}",
-            user_id=changed_by.id,
+            description=f"User {user.email} role changed {change}",
+            user_id=user.id,
             details=f"Role change: {user.email} -> {new_role} (changed by: {changed_by.email})",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={"target_user_id": user.id, "role": new_role, "actor_user_id": changed_by.id}
         )
 
-    def log_user_deletion(self, user_email: str, deleted_by: User, ip_address: Optional[str] = None, user_agent: Optional[str] = None):
-        """Log user deletion activity"""
+    def log_user_deletion(self, user_email: str, deleted_by: Union[User, TokenClaims], ip_address: Optional[str] = None, user_agent: Optional[str] = None, user_id: Optional[int] = None):
+        """Log user deletion activity; user_id stays empty as the affected user's row is gone"""
         return self.create_activity_log(
             action_type=ActivityType.USER_DELETED,
             description=f"User {user_email} deleted",
-            user_id=deleted_by.id,
+            user_id=None,
             details=f"User deletion: {user_email} (deleted by: {deleted_by.email})",
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            payload={"target_user_id": user_id, "actor_user_id": deleted_by.id}
         )
 
     def get_user_activity_logs(self, user_id: int, limit: int = 50):
@@ -110,4 +136,94 @@ class ActivityLogService:
 
     def get_all_activity_logs(self, limit: int = 100):
         """Get all activity logs"""
-        return self.db.query(ActivityLog).order_by(ActivityLog.created_at.desc()).limit(limit).all() 
\ No newline at end of file
+        return self.db.query(ActivityLog).order_by(ActivityLog.created_at.desc()).limit(limit).all()
+
+    def list_activity_logs(
+        self,
+        limit: int,
+        user_id: Optional[int] = None,
+        action_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Newest-first activity logs with the acting user's email, plus the cursor of the next page.
+
+        Dates are YYYY-MM-DD (end date inclusive); invalid dates are ignored.
+        """
+        query = self.db.query(
+            ActivityLog.id,
+            ActivityLog.action_type,
+            ActivityLog.description,
+            ActivityLog.details,
+            ActivityLog.payload,
+            ActivityLog.created_at,
+            User.email.label('user_email')
+        ).outerjoin(User, User.id == ActivityLog.user_id)
+        
+        if user_id:
+            query = query.filter(ActivityLog.user_id == user_id)
+        if action_type:
+            query = query.filter(ActivityLog.action_type == action_type)
+        query = self._filter_dates(query, start_date, end_date)
+        
+        query = query.order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+        position = decode_cursor(cursor)
+        if position:
+            query = query.filter(keyset_before(ActivityLog.created_at, ActivityLog.id, position))
+        elif offset:
+            query = query.offset(offset)
+        
+        rows = query.limit(limit + 1).all()
+        logs = [row._asdict() for row in rows[:limit]]
+        
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(logs[-1]["created_at"], logs[-1]["id"])
+        return logs, next_cursor
+
+    def _filter_dates(self, query, start_date: Optional[str], end_date: Optional[str]):
+        """Restrict to YYYY-MM-DD dates (end date inclusive); invalid dates are ignored"""
+        if start_date:
+            try:
+                start_datetime = datetime.strptime(start_date, '%Y-%m-%d')
+                query = query.filter(ActivityLog.created_at >= start_datetime)
+            except ValueError:
+                pass
+        if end_date:
+            try:
+                end_datetime = datetime.strptime(end_date, '%Y-%m-%d')
+                end_datetime = end_datetime.replace(hour=23, minute=59, second=59)
+                query = query.filter(ActivityLog.created_at <= end_datetime)
+            except ValueError:
+                pass
+        return query
+
+    def ingestion_stats(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        reporter: Optional[str] = None
+    ) -> List[dict]:
+        """Uploads, rows inserted and rows skipped per reporter per day, newest day first.
+
+        Reads the generated payload columns, so the aggregate only touches
+        upload events in the date range instead of parsing details text.
+        """
+        day = func.date(ActivityLog.created_at).label('day')
+        query = self.db.query(
+            day,
+            ActivityLog.payload_reporter.label('reporter'),
+            func.count(ActivityLog.id).label('uploads'),
+            func.coalesce(func.sum(ActivityLog.payload_inserted), 0).label('inserted'),
+            func.coalesce(func.sum(ActivityLog.payload_skipped), 0).label('skipped')
+        ).filter(ActivityLog.action_type == ActivityType.NEWS_UPLOADED.value)
+        
+        if reporter:
+            query = query.filter(ActivityLog.payload_reporter == reporter)
+        query = self._filter_dates(query, start_date, end_date)
+        
+        rows = query.group_by(day, ActivityLog.payload_reporter)\
+            .order_by(day.desc(), ActivityLog.payload_reporter).all()
+        return [row._asdict() for row in rows]
@@ -0,0 +1,119 @@
+import os
+import time
+import queue
+import logging
+import threading
+from sqlalchemy import insert
+from app.core.db import SessionLocal
+from app.models.activity_log import ActivityLog
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 'async' buffers activity logs and writes them from a background thread;
+# 'sync' writes them inside the request's own session (useful for tests)
+AUDIT_SINK_MODE = os.getenv('AUDIT_SINK_MODE', 'async').lower()
+AUDIT_FLUSH_INTERVAL_MS = int(os.getenv('AUDIT_FLUSH_INTERVAL_MS', 250))
+AUDIT_BATCH_SIZE = int(os.getenv('AUDIT_BATCH_SIZE', 500))
+AUDIT_QUEUE_SIZE = int(os.getenv('AUDIT_QUEUE_SIZE', 10000))
+
+class AuditSink:
+    """In-process queue of activity log rows drained by a background writer.
+
+    Rows are multi-row inserted every flush interval or once a batch fills up,
+    in their own transaction, so a failing audit write never reaches the request.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        flush_interval_ms: int = AUDIT_FLUSH_INTERVAL_MS,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        queue_size: int = AUDIT_QUEUE_SIZE
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=queue_size)
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def accepts(self) -> bool:
+        """True when entries should be queued rather than written by the caller"""
+        return AUDIT_SINK_MODE == 'async' and self.running
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the writer after flushing everything already queued"""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, row: dict) -> bool:
+        """Queue one activity_logs row; never blocks the caller"""
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Audit queue full, dropped activity log: {row.get('description')}")
+            return False
+
+    def flush(self):
+        """Write everything queued so far from the calling thread"""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _drain(self, block: bool = True) -> List[dict]:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                if block:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._drain(block=not self._stopping.is_set())
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[dict]):
+        db = self.session_factory()
+        try:
+            db.execute(insert(ActivityLog.__table__), batch)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to write {len(batch)} activity logs: {e}")
+        finally:
+            db.close()
+
+audit_sink = AuditSink()
@@ -1,15 +1,17 @@
 import os
 from datetime import datetime, timedelta
+from typing import Optional
 from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.models.user import User
-from app.schemas.auth import Token, UserOut
+from app.schemas.auth import Token, UserOut, TokenClaims
 from app.core.db import get_db
 from app.services.user_service import get_user_service
 from dotenv import load_dotenv
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
+from app.services.password_service import pwd_context
+from app.core.tracing import span
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '../../.env'))
 
@@ -18,7 +20,6 @@ ALGORITHM = os.getenv('ALGORITHM', 'HS256')
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES', 60))
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 class AuthService:
     def get_password_hash(self, password: str):
@@ -27,27 +28,54 @@ class AuthService:
     def verify_password(self, plain_password: str, hashed_password: str):
         return pwd_context.verify(plain_password, hashed_password)
     
-    def create_token(self, user: User):
+    def create_token(self, user: User, refresh_token: Optional[str] = None):
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode = {"sub": user.email, "role": user.role, "exp": expire}
+        # uid and role let requests resolve the user by primary key, or skip the lookup entirely
+        to_encode = {"sub": user.email, "uid": user.id, "role": user.role.value, "exp": expire}
         access_token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-        return {"access_token": access_token, "token_type": "bearer"}
+        token = {"access_token": access_token, "token_type": "bearer"}
+        if refresh_token:
+            token["refresh_token"] = refresh_token
+        return token
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
-    credentials_exception = HTTPException(
+def _credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    user_service = get_user_service(db)
-    user = user_service.get_by_email(email)
-    if user is None:
-        raise credentials_exception
-    return user 
\ No newline at end of file
+        raise _credentials_exception()
+    if payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
+    with span("auth.get_current_user"):
+        payload = _decode_token(token)
+        user_service = get_user_service(db)
+        if payload.get("uid") is not None:
+            user = user_service.get_by_id(payload["uid"])
+        else:
+            # Tokens issued before uid was added
+            user = user_service.get_by_email(payload["sub"])
+        if user is None:
+            raise _credentials_exception()
+        return user
+
+def get_token_claims(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> TokenClaims:
+    """Identity straight from the access token, without a database lookup.
+
+    For endpoints that only need the caller's id or role. Role changes and
+    deactivation take effect when the access token expires, so anything that
+    must see them immediately should use get_current_user.
+    """
+    payload = _decode_token(token)
+    if payload.get("uid") is None or payload.get("role") is None:
+        user = get_current_user(db, token)
+        return TokenClaims(id=user.id, email=user.email, role=user.role.value)
+    return TokenClaims(id=payload["uid"], email=payload["sub"], role=payload["role"])
@@ -0,0 +1,143 @@
+import os
+import json
+import threading
+from collections import deque
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.tag import Tag
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+AUTO_TAGGING_ENABLED = os.getenv('AUTO_TAGGING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+# Extra phrases that should resolve to an existing tag (matched case-insensitively).
+# Override or extend with AUTO_TAG_SYNONYMS='{"Tag Name": ["phrase", ...]}'.
+DEFAULT_SYNONYMS = {
+    "Brush Fire": ["brushfire", "grass fire", "vegetation fire"],
+    "Structure Fire": ["house fire", "building fire", "apartment fire", "residential fire"],
+    "Evacuation": ["evacuate", "evacuated", "evacuations", "evacuation order", "evacuation orders"],
+    "Red Flag": ["red flag warning", "red flag warnings"],
+    "Wildfire": ["wild fire", "forest fire"],
+    "Vehicle Fire": ["car fire", "truck fire"],
+}
+
+def _load_synonyms() -> Dict[str, List[str]]:
+    synonyms = dict(DEFAULT_SYNONYMS)
+    raw = os.getenv('AUTO_TAG_SYNONYMS')
+    if raw:
+        try:
+            synonyms.update(json.loads(raw))
+        except ValueError as e:
+            print(f"Ignoring invalid AUTO_TAG_SYNONYMS: {e}")
+    return {name.lower(): phrases for name, phrases in synonyms.items()}
+
+SYNONYMS = _load_synonyms()
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+class AhoCorasick:
+    """Multi-pattern matcher: one pass over the text finds every pattern occurrence"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]):
+        # State 0 is the root; each state has a transition dict, a failure link
+        # and the (pattern length, value) pairs that end there
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[Tuple[Tuple[int, int], ...]] = [()]
+
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = next_state
+            self.out[state] += ((len(pattern), value),)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.out[next_state] += self.out[self.fail[next_state]]
+
+    def search(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """Yield (start, end, value) for every match in text"""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                end = index + 1
+                for length, value in out[state]:
+                    yield end - length, end, value
+
+class AutoTagger:
+    def __init__(self, tags: Iterable[Tuple[int, str]]):
+        patterns = {}
+        for tag_id, name in tags:
+            for phrase in [name] + SYNONYMS.get(name.lower(), []):
+                phrase = _normalize(phrase)
+                if phrase:
+                    patterns.setdefault(phrase, tag_id)
+        self.pattern_count = len(patterns)
+        self.automaton = AhoCorasick(patterns.items())
+
+    def match(self, *fields: Optional[str]) -> Set[int]:
+        """Return the ids of tags whose name or synonym appears as whole words in the fields"""
+        text = _normalize('\n'.join(field for field in fields if field))
+        if not text or not self.pattern_count:
+            return set()
+        tag_ids = set()
+        last = len(text)
+        for start, end, tag_id in self.automaton.search(text):
+            if tag_id in tag_ids:
+                continue
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < last and text[end].isalnum():
+                continue
+            tag_ids.add(tag_id)
+        return tag_ids
+
+_lock = threading.Lock()
+_cached_tagger: Optional[AutoTagger] = None
+_cached_fingerprint = None
+_local_version = 0
+
+def invalidate_auto_tagger():
+    """Force a rebuild on next use (called when the tag catalog is edited in this process)"""
+    global _local_version
+    with _lock:
+        _local_version += 1
+
+def _catalog_fingerprint(db: Session):
+    # One cheap aggregate detects edits made by any process, not just this one
+    count, max_id, max_created, max_updated = db.query(
+        func.count(Tag.id), func.max(Tag.id), func.max(Tag.created_at), func.max(Tag.updated_at)
+    ).filter(Tag.is_active == True).one()
+    return (_local_version, count, max_id, max_created, max_updated)
+
+def get_auto_tagger(db: Session) -> Optional[AutoTagger]:
+    """Return the automaton for the active tag catalog, rebuilding it only when the catalog changed"""
+    global _cached_tagger, _cached_fingerprint
+    if not AUTO_TAGGING_ENABLED:
+        return None
+    fingerprint = _catalog_fingerprint(db)
+    with _lock:
+        if _cached_tagger is None or fingerprint != _cached_fingerprint:
+            tags = db.query(Tag.id, Tag.name).filter(Tag.is_active == True).all()
+            _cached_tagger = AutoTagger(tags)
+            _cached_fingerprint = fingerprint
+        return _cached_tagger
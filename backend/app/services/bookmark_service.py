@@ -0,0 +1,94 @@
+import os
+from datetime import datetime
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.models.bookmark import Bookmark
+from typing import Dict, Iterable, Tuple
+
+# Other workers only see a user's bookmark changes once their copy expires,
+# so keep this short
+BOOKMARK_CACHE_TTL_SECONDS = float(os.getenv('BOOKMARK_CACHE_TTL_SECONDS', 30))
+
+_bookmark_index_cache = TTLCache(ttl_seconds=BOOKMARK_CACHE_TTL_SECONDS)
+
+# MySQL error code for a unique key violation
+ER_DUP_ENTRY = 1062
+
+def get_bookmark_service(db: Session):
+    return BookmarkService(db)
+
+def invalidate_bookmark_index(user_id: int):
+    """Forget the cached bookmark index after the user adds or removes a bookmark"""
+    _bookmark_index_cache.invalidate(user_id)
+
+class BookmarkService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _load_index(self, user_id: int) -> Dict[Tuple[int, str], int]:
+        rows = self.db.query(Bookmark.news_id, Bookmark.data_type, Bookmark.id).filter(
+            Bookmark.user_id == user_id
+        ).all()
+        return {(news_id, data_type): bookmark_id for news_id, data_type, bookmark_id in rows}
+
+    def get_bookmark_index(self, user_id: int) -> Dict[Tuple[int, str], int]:
+        """Map (news_id, data_type) to bookmark id for every bookmark the user has"""
+        return _bookmark_index_cache.get_or_set(user_id, lambda: self._load_index(user_id))
+
+    def bookmarked_subset(self, user_id: int, news_ids: Iterable[int], data_type: str) -> Dict[int, int]:
+        """Return {news_id: bookmark_id} for the given ids that the user has bookmarked"""
+        index = self.get_bookmark_index(user_id)
+        return {
+            news_id: index[(news_id, data_type)]
+            for news_id in news_ids
+            if (news_id, data_type) in index
+        }
+
+    def create_bookmark(self, user_id: int, news_id: int, data_type: str) -> dict:
+        """Insert a bookmark, or return the existing one.
+
+        Relies on the uq_user_news_type unique key instead of a prior SELECT, and on
+        the fire_news foreign key instead of an existence query (callers should map
+        an IntegrityError to "news item not found"). A new bookmark costs a single
+        statement; only a repeated one is read back.
+        """
+        table = Bookmark.__table__
+        values = {"user_id": user_id, "news_id": news_id, "data_type": data_type}
+        dialect = self.db.get_bind().dialect.name
+        existing = select(table.c.id, table.c.created_at).where(
+            table.c.user_id == user_id, table.c.news_id == news_id, table.c.data_type == data_type
+        )
+
+        if dialect == 'mysql':
+            # No RETURNING, and with the CLIENT_FOUND_ROWS flag SQLAlchemy sets an untouched
+            # ON DUPLICATE KEY row counts as affected just like an insert, so neither the
+            # row count nor LAST_INSERT_ID tells a duplicate apart. A plain INSERT with the
+            # timestamp supplied does: it either succeeds, and we know every value, or
+            # fails on the unique key and the stored row is read instead.
+            created_at = datetime.utcnow().replace(microsecond=0)
+            try:
+                bookmark_id = self.db.execute(insert(table).values(**values, created_at=created_at)).lastrowid
+            except IntegrityError as e:
+                if e.orig.args[0] != ER_DUP_ENTRY:
+                    raise
+                self.db.rollback()
+                bookmark_id, created_at = self.db.execute(existing).one()
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(table).values(**values).on_conflict_do_update(
+                index_elements=['user_id', 'news_id', 'data_type'],
+                set_={"user_id": user_id}
+            ).returning(table.c.id, table.c.created_at)
+            bookmark_id, created_at = self.db.execute(stmt).one()
+        else:
+            # Portable fallback: look the bookmark up first, insert it when missing
+            row = self.db.execute(existing).first()
+            if row is None:
+                self.db.execute(insert(table).values(**values))
+                row = self.db.execute(existing).one()
+            bookmark_id, created_at = row
+
+        self.db.commit()
+        return {**values, "id": bookmark_id, "created_at": created_at}
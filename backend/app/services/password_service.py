@@ -0,0 +1,90 @@
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from app.core.metrics import registry
+from typing import Optional, Tuple
+
+# bcrypt cost factor. Hashes with any other cost are transparently rehashed on
+# the next successful login, so it can be raised (or lowered) at any time.
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+# Password work runs in its own small pool so a login burst can't occupy the
+# threads that serve everything else. bcrypt releases the GIL, so threads scale
+# across cores without the overhead of a process pool.
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+# Hash/verify requests allowed to wait or run at once before new ones get a 503
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv('PASSWORD_HASH_QUEUE_LIMIT', 64))
+PASSWORD_HASH_RETRY_AFTER_SECONDS = int(os.getenv('PASSWORD_HASH_RETRY_AFTER_SECONDS', 2))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS
+)
+
+HASH_SECONDS = registry.histogram(
+    'password_hash_seconds', 'Time spent in bcrypt per operation', ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+QUEUE_WAIT_SECONDS = registry.histogram(
+    'password_hash_queue_wait_seconds', 'Time password operations waited for a worker', ['operation']
+)
+QUEUE_DEPTH = registry.gauge('password_hash_queue_depth', 'Password operations queued or running')
+REJECTED = registry.counter('password_hash_rejected_total', 'Password operations refused because the queue was full', ['operation'])
+
+class PasswordService:
+    """Runs bcrypt hashing and verification on a bounded worker pool"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, queue_limit: int = PASSWORD_HASH_QUEUE_LIMIT):
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, operation: str):
+        with self._lock:
+            if self._pending >= self.queue_limit:
+                REJECTED.inc(operation=operation)
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication is busy, please retry shortly",
+                    headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER_SECONDS)}
+                )
+            self._pending += 1
+            QUEUE_DEPTH.set(self._pending)
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+            QUEUE_DEPTH.set(self._pending)
+
+    async def _run(self, operation: str, fn, *args):
+        self._reserve(operation)
+        queued_at = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            QUEUE_WAIT_SECONDS.observe(started - queued_at, operation=operation)
+            try:
+                return fn(*args)
+            finally:
+                HASH_SECONDS.observe(time.perf_counter() - started, operation=operation)
+
+        # Released when the work actually finishes, even if the request was cancelled meanwhile
+        future = self._executor.submit(timed)
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self._run('hash', pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Check a password; the second value is a replacement hash when the stored one uses an outdated cost"""
+        return await self._run('verify', pwd_context.verify_and_update, password, hashed_password)
+
+password_service = PasswordService()
@@ -0,0 +1,100 @@
+import os
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.user_session import UserSession
+from typing import Tuple
+
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv('REFRESH_TOKEN_EXPIRE_DAYS', 14))
+# A rotated token presented again within this window is most likely a second
+# tab racing the first one's refresh, so it is refused without revoking the family
+REFRESH_REUSE_GRACE_SECONDS = int(os.getenv('REFRESH_REUSE_GRACE_SECONDS', 10))
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _refresh_error(detail: str = "Invalid refresh token"):
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+
+def get_session_service(db: Session):
+    return SessionService(db)
+
+class SessionService:
+    """Refresh-token sessions with rotation and reuse detection"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _issue(self, user_id: int, family_id: str) -> str:
+        token = secrets.token_urlsafe(32)
+        self.db.add(UserSession(
+            user_id=user_id,
+            family_id=family_id,
+            token_hash=_hash_token(token),
+            expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        return token
+
+    def create_session(self, user: User) -> str:
+        """Start a new session family at login and return its refresh token"""
+        # Clear out this user's dead sessions so the table stays compact
+        self.db.query(UserSession).filter(
+            UserSession.user_id == user.id,
+            UserSession.expires_at <= datetime.utcnow()
+        ).delete(synchronize_session=False)
+        token = self._issue(user.id, secrets.token_hex(16))
+        self.db.commit()
+        return token
+
+    def rotate(self, refresh_token: str) -> Tuple[User, str]:
+        """Exchange a refresh token for its successor; returns the session's user and the new token"""
+        session = self.db.query(UserSession).filter(UserSession.token_hash == _hash_token(refresh_token)).first()
+        if session is None:
+            raise _refresh_error()
+        now = datetime.utcnow()
+
+        if session.revoked_at is not None:
+            if now - session.revoked_at > timedelta(seconds=REFRESH_REUSE_GRACE_SECONDS):
+                # A token that was already rotated is being replayed: end every session descending from that login
+                self.revoke_family(session.family_id)
+            raise _refresh_error()
+        if session.expires_at <= now:
+            raise _refresh_error("Refresh token expired")
+
+        user = self.db.get(User, session.user_id)
+        if user is None or not user.is_active:
+            self.revoke_family(session.family_id)
+            raise _refresh_error()
+
+        # Conditional update so two concurrent refreshes can't both rotate the same token
+        revoked = self.db.execute(
+            update(UserSession)
+            .where(UserSession.id == session.id, UserSession.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        if revoked.rowcount != 1:
+            self.db.rollback()
+            raise _refresh_error()
+        token = self._issue(user.id, session.family_id)
+        self.db.commit()
+        return user, token
+
+    def revoke(self, refresh_token: str):
+        """End the session a refresh token belongs to (logout); returns its user id, if any"""
+        session = self.db.query(UserSession).filter(UserSession.token_hash == _hash_token(refresh_token)).first()
+        if session is None:
+            return None
+        self.revoke_family(session.family_id)
+        return session.user_id
+
+    def revoke_family(self, family_id: str):
+        self.db.execute(
+            update(UserSession)
+            .where(UserSession.family_id == family_id, UserSession.revoked_at.is_(None))
+            .values(revoked_at=datetime.utcnow())
+        )
+        self.db.commit()
@@ -0,0 +1,116 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.db import insert_ignore
+from app.services.auto_tagger import get_auto_tagger
+from app.models.fire_news import FireNews
+from app.models.fire_news_tag import FireNewsTag
+from app.models.tag import Tag
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Keep IN (...) lists and multi-row inserts at a size MySQL handles comfortably
+CHUNK_SIZE = 500
+
+def get_tag_service(db: Session):
+    return TagService(db)
+
+def split_legacy_tags(raw: Optional[str]) -> List[str]:
+    """Tokenize a legacy comma-separated tags string into unique tag names"""
+    if not raw:
+        return []
+    names = []
+    seen = set()
+    for token in str(raw).split(','):
+        name = ' '.join(token.split())[:100]
+        key = name.lower()
+        if not name or key in ('nan', 'none', 'null') or key in seen:
+            continue
+        seen.add(key)
+        names.append(name)
+    return names
+
+def _chunks(items: List, size: int = CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class TagService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _lookup_tag_ids(self, keys: List[str]) -> Dict[str, int]:
+        # The tag catalog is small, so matching on lower(name) costs little and
+        # behaves the same regardless of the column collation
+        tag_ids = {}
+        for chunk in _chunks(keys):
+            for tag_id, name in self.db.query(Tag.id, Tag.name).filter(func.lower(Tag.name).in_(chunk)):
+                tag_ids[name.lower()] = tag_id
+        return tag_ids
+
+    def resolve_tag_ids(self, names: Iterable[str]) -> Dict[str, int]:
+        """Map tag names (lower-cased) to ids, creating the tags that don't exist yet"""
+        wanted = {}
+        for name in names:
+            wanted.setdefault(name.lower(), name)
+        if not wanted:
+            return {}
+
+        tag_ids = self._lookup_tag_ids(list(wanted))
+        missing = [name for key, name in wanted.items() if key not in tag_ids]
+        if missing:
+            for chunk in _chunks(missing):
+                insert_ignore(self.db, Tag.__table__, [{"name": name, "is_active": True} for name in chunk])
+            tag_ids.update(self._lookup_tag_ids([name.lower() for name in missing]))
+        return tag_ids
+
+    def attach(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """Bulk insert (fire_news_id, tag_id) associations, ignoring existing ones"""
+        rows = [{"fire_news_id": news_id, "tag_id": tag_id} for news_id, tag_id in set(pairs)]
+        for chunk in _chunks(rows):
+            insert_ignore(self.db, FireNewsTag.__table__, chunk)
+        return len(rows)
+
+    def legacy_tag_pairs(self, items: Iterable[Tuple[int, Optional[str]]]) -> List[Tuple[int, int]]:
+        """Turn (fire_news_id, legacy tags string) pairs into (fire_news_id, tag_id) pairs"""
+        tokenized = [(news_id, split_legacy_tags(raw)) for news_id, raw in items]
+        tag_ids = self.resolve_tag_ids(name for _, names in tokenized for name in names)
+        return [
+            (news_id, tag_ids[name.lower()])
+            for news_id, names in tokenized
+            for name in names
+            if name.lower() in tag_ids
+        ]
+
+    def attach_legacy_tags(self, items: Iterable[Tuple[int, Optional[str]]]) -> int:
+        """Create fire_news_tags rows from (fire_news_id, legacy tags string) pairs"""
+        return self.attach(self.legacy_tag_pairs(items))
+
+    def tag_ingested(self, news_items: List[FireNews]) -> int:
+        """Link freshly inserted (flushed) rows to their legacy tags and auto-detected tags"""
+        if not news_items:
+            return 0
+        pairs = self.legacy_tag_pairs((n.id, n.tags) for n in news_items if n.tags)
+        tagger = get_auto_tagger(self.db)
+        if tagger is not None:
+            for n in news_items:
+                pairs.extend((n.id, tag_id) for tag_id in tagger.match(n.title, n.content, n.context))
+        return self.attach(pairs)
+
+    def backfill_legacy_tags(self, batch_size: int = 1000, start_after_id: int = 0) -> Iterator[Tuple[int, int, int]]:
+        """Backfill fire_news_tags from FireNews.tags, committing one keyset chunk at a time.
+
+        Yields (last_id, rows_scanned, links_written) after every committed chunk so callers
+        can checkpoint and resume from last_id.
+        """
+        last_id = start_after_id
+        while True:
+            rows = self.db.query(FireNews.id, FireNews.tags).filter(
+                FireNews.id > last_id,
+                FireNews.tags.isnot(None),
+                FireNews.tags != ''
+            ).order_by(FireNews.id).limit(batch_size).all()
+            if not rows:
+                return
+
+            linked = self.attach_legacy_tags((row.id, row.tags) for row in rows)
+            self.db.commit()
+            last_id = rows[-1].id
+            yield last_id, len(rows), linked
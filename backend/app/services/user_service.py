@@ -1,12 +1,10 @@
 from app.models.user import User
 from app.schemas.auth import UserCreate
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from app.services.password_service import pwd_context
 from app.services.activity_log_service import get_activity_log_service
 from typing import Optional
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def get_user_service(db: Session):
     return UserService(db)
 
@@ -17,8 +15,10 @@ class UserService:
     def get_by_email(self, email: str):
         return self.db.query(User).filter(User.email == email).first()
 
-    def create_user(self, user: UserCreate, ip_address: Optional[str] = None, user_agent: Optional[str] = None):
-        hashed_password = pwd_context.hash(user.password)
+    def create_user(self, user: UserCreate, ip_address: Optional[str] = None, user_agent: Optional[str] = None, hashed_password: Optional[str] = None):
+        """Create a user; pass hashed_password when it was already computed on the password pool"""
+        if hashed_password is None:
+            hashed_password = pwd_context.hash(user.password)
         db_user = User(
             email=user.email,
             hashed_password=hashed_password,
@@ -41,10 +41,20 @@ class UserService:
 
     def authenticate_user(self, email: str, password: str):
         user = self.get_by_email(email)
-        if not user or not pwd_context.verify(password, user.hashed_password):
+        if not user:
+            return None
+        valid, new_hash = pwd_context.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            self.update_password_hash(user, new_hash)
         return user
 
+    def update_password_hash(self, user: User, hashed_password: str):
+        """Store a rehashed password (e.g. after the bcrypt cost changed)"""
+        user.hashed_password = hashed_password
+        self.db.commit()
+
     def list_users(self):
         return self.db.query(User).all()
 
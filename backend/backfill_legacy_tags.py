@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Backfill the legacy comma-separated FireNews.tags column into fire_news_tags.
+
+Runs in keyset chunks (one short transaction per chunk) and records the last
+processed id in a checkpoint file, so an interrupted run resumes where it stopped.
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.db import SessionLocal
+from app.services.tag_service import get_tag_service
+
+DEFAULT_CHECKPOINT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.legacy_tags_backfill.checkpoint')
+
+def read_checkpoint(path):
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+def write_checkpoint(path, last_id):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(str(last_id))
+    os.replace(tmp_path, path)
+
+def backfill_legacy_tags(batch_size, checkpoint_path, reset=False):
+    start_after_id = 0 if reset else read_checkpoint(checkpoint_path)
+    if start_after_id:
+        print(f"Resuming after fire_news.id={start_after_id}")
+
+    db = SessionLocal()
+    scanned = 0
+    linked = 0
+    try:
+        tag_service = get_tag_service(db)
+        for last_id, rows, links in tag_service.backfill_legacy_tags(batch_size, start_after_id):
+            write_checkpoint(checkpoint_path, last_id)
+            scanned += rows
+            linked += links
+            print(f"Processed up to id {last_id}: {scanned} rows scanned, {linked} tag links written")
+        print(f"Backfill complete: {scanned} rows scanned, {linked} tag links written")
+    except Exception as e:
+        print(f"Error during backfill: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per keyset chunk (default: 1000)")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="checkpoint file path")
+    parser.add_argument("--reset", action="store_true", help="ignore the checkpoint and start from the beginning")
+    args = parser.parse_args()
+    backfill_legacy_tags(args.batch_size, args.checkpoint, args.reset)
@@ -0,0 +1,62 @@
+"""Helpers shared by the benchmark scripts: scratch databases, result files and run metadata"""
+
+import os
+import sys
+import json
+import platform
+import subprocess
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, 'benchmarks', 'results')
+
+def mysql_url() -> str:
+    """BENCHMARK_MYSQL_URL, or the app's MYSQL_* settings pointed at the firenews_bench database"""
+    url = os.getenv('BENCHMARK_MYSQL_URL')
+    if url:
+        return url
+    return (f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}"
+            f"@{os.getenv('MYSQL_HOST', 'localhost')}:{os.getenv('MYSQL_PORT', 3306)}/firenews_bench")
+
+def scratch_database_error(url: str):
+    """Benchmarks drop and recreate tables, so only databases named *bench* are accepted"""
+    from sqlalchemy.engine import make_url
+    parsed = make_url(url)
+    if parsed.get_backend_name() == 'sqlite':
+        return None
+    if "bench" not in (parsed.database or ""):
+        return f"refusing to drop tables in '{parsed.database}': the database name must contain 'bench'"
+    return None
+
+def peak_rss_mb() -> float:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment(**extra) -> dict:
+    import sqlalchemy
+    return {
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sqlalchemy": sqlalchemy.__version__,
+        **extra,
+    }
+
+def write_report(name: str, report: dict, output: str = None) -> str:
+    """Writes a JSON report, by default to benchmarks/results/<name>-<timestamp>.json"""
+    output = output or os.path.join(RESULTS_DIR, f"{name}-{datetime.utcnow():%Y%m%dT%H%M%SZ}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"benchmark": name, "generated_at": datetime.utcnow().isoformat() + "Z", **report}, f, indent=2, default=str)
+    return output
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Import-time report for app.main, i.e. what every new worker pays before it
+can answer /health.
+
+Imports the app in fresh interpreters with -X importtime, keeps the fastest
+run, and lists the slowest application modules and third-party packages.
+Fails when a module that must stay lazy (pandas, openpyxl, numpy) got
+imported, or with --max-ms when the import took longer than that.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --top 30 --max-ms 800
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from collections import defaultdict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import BACKEND_DIR, environment, write_report
+
+# Only the upload endpoints need these; importing them at boot costs ~300 ms and ~40 MB
+LAZY_MODULES = ("pandas", "numpy", "openpyxl")
+
+PROBE = (
+    "import sys, time, json\n"
+    "started = time.perf_counter()\n"
+    "import app.main\n"
+    "seconds = time.perf_counter() - started\n"
+    "print(json.dumps({'seconds': seconds, 'modules': sorted(sys.modules)}))\n"
+)
+
+def run_probe(importtime: bool):
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", PROBE]
+    env = {**os.environ}
+    # app.core.db builds its engine URL at import; nothing connects
+    env.setdefault("MYSQL_PORT", "3306")
+    result = subprocess.run(command, cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+def parse_importtime(stderr: str):
+    """(module, self_us, cumulative_us, depth) for each line of -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Report how long importing app.main takes and what it pulls in")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per measurement; the fastest counts")
+    parser.add_argument("--top", type=int, default=15, help="Rows per table")
+    parser.add_argument("--max-ms", type=float, help="Exit 1 when the import takes longer than this")
+    parser.add_argument("--output", help="Also write a JSON report here ('-' for benchmarks/results/import-time-<timestamp>.json)")
+    args = parser.parse_args()
+
+    # Wall time without -X importtime's own overhead, then one detailed run
+    wall = min(run_probe(importtime=False)[0]["seconds"] for _ in range(args.repeat))
+    probe, stderr = run_probe(importtime=True)
+    rows = parse_importtime(stderr)
+
+    # A module shows up once per import site that triggered it; keep its real (largest) entry
+    first_import = {}
+    for row in rows:
+        if row[0].startswith("app.") and row[2] > first_import.get(row[0], (None, 0, 0))[2]:
+            first_import[row[0]] = row
+    app_modules = sorted(first_import.values(), key=lambda row: -row[2])
+    # Third-party cost by top-level package, counting each package's outermost import only
+    packages = defaultdict(int)
+    for name, _, cumulative_us, _ in rows:
+        top = name.split(".")[0]
+        if top != "app" and name == top:
+            packages[top] += cumulative_us
+    loaded_lazy = [name for name in LAZY_MODULES if name in probe["modules"]]
+
+    print(f"import app.main: {wall * 1000:.0f} ms (best of {args.repeat}), {len(probe['modules'])} modules loaded")
+    print(f"\nSlowest application modules (cumulative, with -X importtime overhead):")
+    for name, self_us, cumulative_us, _ in app_modules[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {self_us / 1000:>7.1f} ms self  {name}")
+    print(f"\nSlowest third-party packages:")
+    for name, cumulative_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    failures = []
+    if loaded_lazy:
+        failures.append(f"imported at startup but should load lazily: {', '.join(loaded_lazy)}")
+    if args.max_ms is not None and wall * 1000 > args.max_ms:
+        failures.append(f"import took {wall * 1000:.0f} ms, limit is {args.max_ms:.0f} ms")
+
+    if args.output:
+        output = write_report("import-time", {
+            "environment": environment(),
+            "seconds": round(wall, 4),
+            "modules_loaded": len(probe["modules"]),
+            "lazy_modules_loaded": loaded_lazy,
+            "app_modules": [{"module": name, "self_ms": round(self_us / 1000, 1), "cumulative_ms": round(cumulative_us / 1000, 1)}
+                            for name, self_us, cumulative_us, _ in app_modules],
+            "packages": {name: round(cumulative_us / 1000, 1) for name, cumulative_us in packages.items()},
+        }, None if args.output == "-" else args.output)
+        print(f"\nResults written to {output}")
+
+    for failure in failures:
+        print(f"\nFAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Ingestion benchmark for process-excel, bulk-upload and test-upload.
+
+Drives the router functions in-process against a scratch database with
+synthetic sheets (see benchmarks/synthetic.py) and writes one JSON document
+with rows/sec, peak RSS, SQL statement counts and the time split between
+body parsing, reading, row building, date parsing, dedup, insert, commit and
+response encoding, so runs can be compared across versions.
+
+Each scenario runs in a fresh process, so peak RSS is per scenario and no
+engine or import state leaks between them. The phase split comes from the
+request tracing spans (app.core.tracing); handler print output is discarded.
+
+    python benchmarks/ingestion.py --rows 1000 10000 --database sqlite
+    BENCHMARK_MYSQL_URL=mysql+pymysql://root:pw@localhost:3306/firenews_bench \\
+        python benchmarks/ingestion.py --database sqlite mysql
+
+The MySQL database is dropped and recreated for every scenario, so its name
+must contain "bench".
+"""
+
+import io
+import os
+import sys
+import json
+import asyncio
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import mysql_url, scratch_database_error, peak_rss_mb, environment, write_report
+from benchmarks.synthetic import fire_news_rows, emergency_911_rows
+
+# (endpoint, sheet) pairs; 911 data only arrives through process-excel
+SCENARIOS = [
+    ("process-excel", "fire_news"),
+    ("process-excel", "emergency_911"),
+    ("bulk-upload", "fire_news"),
+    ("test-upload", "fire_news"),
+]
+
+def _sheet_bytes(rows, sheet_format: str) -> bytes:
+    import pandas as pd
+    buffer = io.BytesIO()
+    if sheet_format == 'xlsx':
+        pd.DataFrame(rows).to_excel(buffer, index=False)
+    else:
+        pd.DataFrame(rows).to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+def _seed_duplicates(db, sheet: str, rows, ratio: float, seed: int) -> int:
+    """Insert a share of the sheet's rows up front, stored the way the handlers store them"""
+    from sqlalchemy import insert
+    from app.models.fire_news import FireNews
+    from app.routers.excel_uploads import parse_datetime
+
+    picked = random.Random(seed).sample(rows, int(len(rows) * ratio))
+    # parse_datetime prints every value it can't parse
+    with contextlib.redirect_stdout(io.StringIO()):
+        values = _stored_rows(sheet, picked, parse_datetime)
+    if values:
+        db.execute(insert(FireNews.__table__), values)
+    db.commit()
+    return len(values)
+
+def _stored_rows(sheet: str, picked, parse_datetime):
+    if sheet == 'emergency_911':
+        return [{
+            "title": f"911 Emergency - {row['Station Name']} - {row['Date']}",
+            "station_name": row["Station Name"],
+            "incident_date": parse_datetime(row["Date"]),
+            "data_type": "emergency_911",
+            "reporter_name": "911",
+        } for row in picked]
+    return [{
+        "title": row["title"],
+        "content": row["content"],
+        "published_date": parse_datetime(row["published_date"]),
+        "data_type": "fire_news",
+        "reporter_name": row["reporter_name"],
+    } for row in picked]
+
+def _request(content_type: bytes = b"application/json", body: bytes = b""):
+    from starlette.requests import Request
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request({
+        "type": "http", "method": "POST", "path": "/", "query_string": b"",
+        "headers": [(b"user-agent", b"ingestion-benchmark"), (b"content-type", content_type)],
+        "client": ("127.0.0.1", 0),
+    }, receive)
+
+def _multipart(file_name: str, content: bytes, reporter_name: str):
+    """process-excel's multipart/form-data body, as the frontend sends it"""
+    boundary = "ingestion-benchmark"
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="reporter_name"\r\n\r\n{reporter_name}\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode() + content + f'\r\n--{boundary}--\r\n'.encode()
+    return f"multipart/form-data; boundary={boundary}".encode(), body
+
+async def _read_form(request):
+    return await request.form()
+
+def _encode(response):
+    """Serialize a handler's return value the way FastAPI does for the client"""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    return JSONResponse(jsonable_encoder(response))
+
+def _phases(root, wall_ms: float) -> dict:
+    spans = [span.to_dict() for span in root.trace.spans]
+
+    def total(name):
+        return sum(span["duration_ms"] for span in spans if span["name"] == name)
+
+    # parse_datetime adds its time to whichever span is current, which is ingest.rows
+    parse = sum(span["attributes"].get("parse_datetime_ms", 0) for span in spans)
+    parse_in_rows = sum(span["attributes"].get("parse_datetime_ms", 0) for span in spans if span["name"] == "ingest.rows")
+    phases = {
+        "body": total("request.body"),
+        "validate": total("benchmark.validate"),
+        "read": total("ingest.read"),
+        "build": total("ingest.rows") - parse_in_rows,
+        "parse": parse,
+        "dedup": total("ingest.dedup"),
+        "insert": total("ingest.insert_rows") + total("ingest.insert"),
+        "commit": total("ingest.commit"),
+        "activity_log": total("activity_log.write"),
+        "response": total("ingest.response") + total("benchmark.response"),
+    }
+    phases["other"] = wall_ms - sum(phases.values())
+    return {phase: round(ms, 1) for phase, ms in phases.items()}
+
+def run_scenario(config: dict) -> dict:
+    """Runs one (database, endpoint, sheet, rows) scenario; executed in a fresh process"""
+    # app.core.db builds the application engine at import; the benchmark never uses it
+    os.environ.setdefault('MYSQL_PORT', '3306')
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.core.db import Base
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from app.core.query_stats import install_query_hooks, start_request_stats, current_query_stats, end_request_stats
+    from app.core.tracing import install_tracing_hooks, start_trace, finish_trace, span
+    from app.routers.excel_uploads import (
+        process_excel_upload, bulk_upload_fire_news, test_upload_fire_news, FireNewsBulkUpload, FireNewsItem
+    )
+
+    endpoint, sheet, rows = config["endpoint"], config["sheet"], config["rows"]
+    scratch = None
+    if config["database"] == 'sqlite':
+        scratch = tempfile.TemporaryDirectory(prefix='ingestion-bench-')
+        url = f"sqlite:///{os.path.join(scratch.name, 'bench.db')}"
+    else:
+        url = config["database_url"]
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    install_query_hooks()
+    install_tracing_hooks()
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    generate = emergency_911_rows if sheet == 'emergency_911' else fire_news_rows
+    if endpoint == 'test-upload':
+        rows = min(rows, config["test_upload_limit"])
+    items = generate(rows, seed=config["seed"])
+    # test-upload doesn't check for duplicates, so there is nothing to seed
+    ratio = 0 if endpoint == 'test-upload' else config["duplicate_ratio"]
+    seeded = _seed_duplicates(db, sheet, items, ratio, config["seed"])
+    # Request bodies are encoded up front, as the client would; the handlers' side starts at parsing them
+    if endpoint == 'process-excel':
+        reporter = "911" if sheet == 'emergency_911' else "Scraper"
+        content_type, body = _multipart(f"bench.{config['sheet_format']}", _sheet_bytes(items, config["sheet_format"]), reporter)
+    elif endpoint == 'bulk-upload':
+        body = json.dumps({"items": items}).encode()
+    else:
+        bodies = [json.dumps(item).encode() for item in items]
+
+    result = {
+        "database": engine.dialect.name,
+        "server_version": ".".join(str(part) for part in engine.dialect.server_version_info or ()),
+        "endpoint": endpoint,
+        "sheet": sheet,
+        "rows": rows,
+        "duplicates_seeded": seeded,
+        "rss_before_mb": peak_rss_mb(),
+    }
+
+    stats_token = start_request_stats()
+    root, trace_token = start_trace(f"benchmark {endpoint}", force=True)
+    started = time.perf_counter()
+    inserted = skipped = 0
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if endpoint == 'process-excel':
+                with span("request.body", form=True):
+                    form = asyncio.run(_read_form(_request(content_type, body)))
+                response = process_excel_upload(file=form["file"], reporter_name=form["reporter_name"], request=None, db=db)
+                with span("benchmark.response"):
+                    _encode(response)
+                inserted, skipped = response["inserted"], response["skipped"]
+            elif endpoint == 'bulk-upload':
+                with span("request.body", form=False):
+                    payload = json.loads(body)
+                with span("benchmark.validate"):
+                    data = FireNewsBulkUpload(**payload)
+                response = bulk_upload_fire_news(data=data, request=_request(), db=db)
+                with span("benchmark.response"):
+                    _encode(response)
+                inserted, skipped = response["inserted"], response["skipped"]
+            else:
+                request = _request()
+                for item_body in bodies:
+                    with span("request.body", form=False):
+                        payload = json.loads(item_body)
+                    with span("benchmark.validate"):
+                        data = FireNewsItem(**payload)
+                    response = test_upload_fire_news(data=data, request=request, db=db)
+                    with span("benchmark.response"):
+                        _encode(response)
+                    inserted += 1
+    except Exception as e:
+        result["error"] = str(getattr(e, 'detail', e))[:500]
+    wall = time.perf_counter() - started
+    finish_trace(root, trace_token, export=False)
+    stats = current_query_stats()
+    end_request_stats(stats_token)
+    db.close()
+    engine.dispose()
+    if scratch is not None:
+        scratch.cleanup()
+
+    result.update({
+        "inserted": inserted,
+        "skipped": skipped,
+        "seconds": round(wall, 3),
+        "rows_per_second": round(rows / wall, 1) if wall else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "queries": stats.count,
+        "query_seconds": round(stats.seconds, 3),
+        "phases_ms": _phases(root, wall * 1000),
+    })
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fire news ingestion endpoints")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000], help="Sheet sizes to run")
+    parser.add_argument("--database", nargs="+", choices=["sqlite", "mysql"], default=["sqlite"],
+                        help="Databases to run against; mysql uses BENCHMARK_MYSQL_URL or MYSQL_* with database firenews_bench")
+    parser.add_argument("--endpoint", nargs="+", choices=sorted({endpoint for endpoint, _ in SCENARIOS}),
+                        help="Only run these endpoints (default: all)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2,
+                        help="Share of each sheet already in the database before the upload")
+    parser.add_argument("--sheet-format", choices=["csv", "xlsx"], default="csv", help="File format sent to process-excel")
+    parser.add_argument("--test-upload-limit", type=int, default=1000,
+                        help="test-upload takes one item per call; cap the calls per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/ingestion-<timestamp>.json)")
+    args = parser.parse_args()
+
+    database_url = None
+    if "mysql" in args.database:
+        database_url = mysql_url()
+        error = scratch_database_error(database_url)
+        if error:
+            parser.error(error)
+
+    scenarios = [
+        {
+            "database": database, "database_url": database_url, "endpoint": endpoint, "sheet": sheet, "rows": rows,
+            "duplicate_ratio": args.duplicate_ratio, "sheet_format": args.sheet_format,
+            "test_upload_limit": args.test_upload_limit, "seed": args.seed,
+        }
+        for database in args.database
+        for endpoint, sheet in SCENARIOS if not args.endpoint or endpoint in args.endpoint
+        for rows in args.rows
+    ]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for config in scenarios:
+        label = f"{config['database']} {config['endpoint']} {config['sheet']} rows={config['rows']}"
+        print(f"Running {label} ...", file=sys.stderr, flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(run_scenario, config).result()
+        results.append(result)
+        if "error" in result:
+            print(f"  failed: {result['error']}", file=sys.stderr)
+        else:
+            print(f"  {result['rows_per_second']} rows/s, {result['queries']} queries, "
+                  f"peak RSS {result['peak_rss_mb']} MB, phases {result['phases_ms']}", file=sys.stderr)
+
+    import pandas
+    output = write_report("ingestion", {
+        "environment": environment(pandas=pandas.__version__),
+        "parameters": {
+            "duplicate_ratio": args.duplicate_ratio, "sheet_format": args.sheet_format,
+            "test_upload_limit": args.test_upload_limit, "seed": args.seed,
+        },
+        "results": results,
+    }, args.output)
+    print(f"Results written to {output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
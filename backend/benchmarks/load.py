@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Read-path load harness replaying the dashboard's request mix.
+
+Virtual users behave like pages/dashboard.tsx: on load they fetch /auth/me,
+the filter options, others-count and the tag list, then keep paging through
+the reporter tabs with filters, sorting and search. Every listing page is
+followed by the batched bookmark check for its cards (lib/bookmarkStatus.ts);
+now and then a user opens a card's tags, lists reporters or flips
+verified/hidden on a card and back.
+
+By default the app runs in-process (httpx ASGITransport) against a seeded
+database of --rows fire news rows; the SQLite file is cached under
+benchmarks/results so larger sizes are seeded once. --base-url targets a
+running server instead and leaves seeding to whoever started it. In-process
+runs share one event loop between clients and app, so they understate what a
+separate server sustains; use them to compare versions, not for capacity.
+
+    python benchmarks/load.py --rows 100000 --users 10 50 100 --duration 30
+    python benchmarks/load.py --base-url http://localhost:8000 --token $TOKEN --users 50
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import asyncio
+import argparse
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# app.core.db builds its engine from MYSQL_* at import; main() points DATABASE_URL at the benchmark
+# database, and this keeps the import from failing when neither is set
+os.environ.setdefault('MYSQL_PORT', '3306')
+
+from benchmarks.common import RESULTS_DIR, mysql_url, scratch_database_error, environment, write_report
+from benchmarks.synthetic import STATES
+
+# (weight, tab endpoint) for the listing requests; 'all' is the dashboard default
+TABS = [
+    (35, "/api/fire-news/all-leads"),
+    (20, "/api/fire-news/tweet"),
+    (20, "/api/fire-news/web"),
+    (10, "/api/fire-news/911"),
+    (5, "/api/fire-news/hidden"),
+    (5, "/api/fire-news/others"),
+    (5, "/api/fire-news"),
+]
+SEARCH_TERMS = ["wildfire", "evacuations", "warehouse", "Redding", "brush fire", "County"]
+COUNTIES = [county for pairs in STATES.values() for county, _ in pairs]
+
+def seed_database(engine, rows: int, users: int, seed: int = 42, log=print):
+    """Generates the dataset with benchmarks.dataset; reuses a database already seeded to this size"""
+    from sqlalchemy import inspect, text
+    from app.core.db import Base
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from benchmarks.dataset import DatasetGenerator
+
+    if inspect(engine).has_table("fire_news"):
+        with engine.connect() as conn:
+            have_rows = conn.execute(text("SELECT COUNT(*) FROM fire_news")).scalar()
+            have_users = conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
+        if have_rows == rows and have_users >= users:
+            log(f"Reusing seeded database ({rows} rows, {have_users} users)")
+            return
+    # 2024 history, which the listing date filters below pick their ranges from
+    generator = DatasetGenerator(engine, seed=seed, end=datetime(2025, 1, 1), days=366, workers=min(4, os.cpu_count() or 1), log=log)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    generator.generate(rows, users=users, bookmarks_per_user=25)
+
+def build_app(engine):
+    """The real FastAPI app with get_db bound to the benchmark database"""
+    from sqlalchemy.orm import sessionmaker
+    from app.main import app
+    from app.core.db import get_db
+
+    BenchSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_bench_db():
+        db = BenchSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_bench_db
+    return app
+
+def access_tokens(engine, users: int):
+    from sqlalchemy.orm import Session
+    from app.models import User
+    from app.services.auth_service import AuthService
+
+    auth = AuthService()
+    with Session(engine) as db:
+        return [auth.create_token(user)["access_token"] for user in db.query(User).order_by(User.id).limit(users)]
+
+def percentile(ordered, p: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+class Recorder:
+    """Latency samples per endpoint, collected only between start() and stop()"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.recording = False
+        self.seconds = 0.0
+
+    def start(self):
+        self.recording = True
+        self._started = time.perf_counter()
+
+    def stop(self):
+        self.recording = False
+        self.seconds = time.perf_counter() - self._started
+
+    def add(self, label: str, seconds: float, ok: bool):
+        if not self.recording:
+            return
+        self.samples[label].append(seconds)
+        if not ok:
+            self.errors[label] += 1
+
+    def summary(self) -> dict:
+        endpoints = {}
+        for label, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            endpoints[label] = {
+                "count": len(ordered),
+                "errors": self.errors[label],
+                "rps": round(len(ordered) / self.seconds, 2),
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+                "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+                "p95_ms": round(percentile(ordered, 95) * 1000, 1),
+                "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+        total = sum(len(samples) for samples in self.samples.values())
+        return {
+            "seconds": round(self.seconds, 1),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "rps": round(total / self.seconds, 2) if self.seconds else 0,
+            "endpoints": endpoints,
+        }
+
+class VirtualUser:
+    """One dashboard session in a closed loop: act, wait the think time, repeat"""
+
+    def __init__(self, client, recorder: Recorder, token: str, rng: random.Random, think_time: float):
+        self.client = client
+        self.recorder = recorder
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rng = rng
+        self.think_time = think_time
+        # Cards on the last listing page, as (id, data_type)
+        self.cards = []
+        self.actions = [
+            (40, self.listing),
+            (12, self.card_tags),
+            (10, self.others_count),
+            (8, self.filter_options),
+            (5, self.toggle),
+            (5, self.tag_filter),
+            (5, self.me),
+            (3, self.reporters),
+        ]
+
+    async def call(self, label: str, method: str, url: str, **kwargs):
+        import httpx
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.recorder.add(label, time.perf_counter() - started, ok)
+        return response if ok else None
+
+    async def me(self):
+        await self.call("GET /auth/me", "GET", "/auth/me")
+
+    async def filter_options(self):
+        await self.call("GET /api/fire-news (filters)", "GET", "/api/fire-news", params={"page": 1, "page_size": 100})
+
+    async def others_count(self):
+        await self.call("GET /api/fire-news/others-count", "GET", "/api/fire-news/others-count")
+
+    async def reporters(self):
+        await self.call("GET /api/fire-news/reporters", "GET", "/api/fire-news/reporters")
+
+    async def tag_filter(self):
+        await self.call("GET /api/tags", "GET", "/api/tags", params={"page": 1, "page_size": 100, "is_active": "true"})
+
+    async def listing(self):
+        rng = self.rng
+        endpoint = rng.choices([tab for _, tab in TABS], [weight for weight, _ in TABS])[0]
+        params = {
+            "page": rng.choice([1, 1, 1, 2, 3, rng.randint(4, 50)]),
+            "page_size": rng.choice([10, 10, 10, 25, 50]),
+            "sort_by": "incident_date" if endpoint.endswith("/911") else rng.choice(["published_date"] * 4 + ["title", "created_at"]),
+            "sort_order": rng.choice(["desc", "desc", "asc"]),
+        }
+        if rng.random() < 0.15:
+            params["county"] = rng.choice(COUNTIES)
+        if rng.random() < 0.15:
+            params["state"] = rng.choice(list(STATES))
+        if rng.random() < 0.15:
+            params["search"] = rng.choice(SEARCH_TERMS)
+        if rng.random() < 0.1 and not endpoint.endswith("/911"):
+            params["is_verified"] = rng.choice(["true", "false"])
+        if rng.random() < 0.1:
+            start = date(2024, 1, 1) + timedelta(days=rng.randrange(0, 335))
+            params["start_date"], params["end_date"] = start.isoformat(), (start + timedelta(days=30)).isoformat()
+
+        response = await self.call(f"GET {endpoint}", "GET", endpoint, params=params)
+        if response is None:
+            return
+        default_type = "emergency_911" if endpoint.endswith("/911") else "fire_news"
+        self.cards = [(item["id"], item.get("data_type") or default_type) for item in response.json().get("items", [])]
+        # Each card asks for its bookmark status; the frontend coalesces them into one POST per data type
+        by_type = defaultdict(list)
+        for news_id, data_type in self.cards:
+            by_type[data_type].append(news_id)
+        for data_type, news_ids in by_type.items():
+            await self.call("POST /api/bookmarks/check", "POST", "/api/bookmarks/check",
+                            json={"news_ids": news_ids, "data_type": data_type})
+
+    async def card_tags(self):
+        if self.cards:
+            news_id, _ = self.rng.choice(self.cards)
+            await self.call("GET /api/fire-news/{news_id}/tags", "GET", f"/api/fire-news/{news_id}/tags")
+
+    async def toggle(self):
+        # Flip and flip back so the dataset stays as seeded
+        if self.cards:
+            news_id, _ = self.rng.choice(self.cards)
+            field = self.rng.choice(["toggle-verified", "toggle-verified", "toggle-hidden"])
+            for _ in range(2):
+                await self.call(f"PUT /api/fire-news/{{news_id}}/{field}", "PUT", f"/api/fire-news/{news_id}/{field}")
+
+    async def run(self, stop: asyncio.Event):
+        # Page load, as the dashboard's mount effects do it
+        for action in (self.me, self.filter_options, self.others_count, self.tag_filter, self.listing):
+            await action()
+        weights = [weight for weight, _ in self.actions]
+        actions = [action for _, action in self.actions]
+        while not stop.is_set():
+            await self.rng.choices(actions, weights)[0]()
+            if self.think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+
+async def run_stage(client, tokens, users: int, duration: float, warmup: float, think_time: float, seed: int) -> dict:
+    recorder = Recorder()
+    stop = asyncio.Event()
+    virtual_users = [
+        VirtualUser(client, recorder, tokens[i % len(tokens)], random.Random(seed + i), think_time)
+        for i in range(users)
+    ]
+    tasks = [asyncio.create_task(user.run(stop)) for user in virtual_users]
+    await asyncio.sleep(warmup)
+    recorder.start()
+    await asyncio.sleep(duration)
+    recorder.stop()
+    stop.set()
+    await asyncio.gather(*tasks)
+    return {"users": users, **recorder.summary()}
+
+def print_stage(stage: dict):
+    print(f"\nusers={stage['users']}  {stage['rps']} req/s  {stage['requests']} requests  {stage['errors']} errors", file=sys.stderr)
+    print(f"  {'endpoint':<52}{'count':>7}{'rps':>8}{'p50':>8}{'p95':>8}{'p99':>8}", file=sys.stderr)
+    for label, row in stage["endpoints"].items():
+        print(f"  {label:<52}{row['count']:>7}{row['rps']:>8}{row['p50_ms']:>8}{row['p95_ms']:>8}{row['p99_ms']:>8}", file=sys.stderr)
+
+async def run_stages(args, app, tokens) -> list:
+    import httpx
+    if app is not None:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=60)
+    else:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=httpx.Limits(max_connections=max(args.users)))
+    stages = []
+    async with client:
+        for users in args.users:
+            print(f"Running {users} users for {args.duration}s (+{args.warmup}s warmup) ...", file=sys.stderr, flush=True)
+            stage = await run_stage(client, tokens, users, args.duration, args.warmup, args.think_time, args.seed)
+            print_stage(stage)
+            stages.append(stage)
+    return stages
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay the dashboard's read-path request mix against the API")
+    parser.add_argument("--rows", type=int, default=100000, help="fire_news rows to seed (e.g. 100000 to 5000000)")
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 50, 100], help="Concurrent virtual users, one stage each")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per stage")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before each stage")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause between a user's actions in seconds (0 = closed loop)")
+    parser.add_argument("--database", choices=["sqlite", "mysql"], default="sqlite",
+                        help="In-process database; mysql uses BENCHMARK_MYSQL_URL or MYSQL_* with database firenews_bench")
+    parser.add_argument("--sqlite-path", help="Seeded SQLite file (default: benchmarks/results/load-<rows>.db)")
+    parser.add_argument("--base-url", help="Load a running server instead of the in-process app (no seeding)")
+    parser.add_argument("--token", action="append", help="Bearer token for --base-url; repeat to spread users over accounts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--seed-only", action="store_true", help="Seed the database and exit")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/load-<timestamp>.json)")
+    args = parser.parse_args()
+
+    app, engine, tokens = None, None, args.token
+    if args.base_url:
+        if not tokens:
+            parser.error("--base-url needs at least one --token")
+    else:
+        from sqlalchemy import create_engine
+        if args.database == "mysql":
+            url = mysql_url()
+            error = scratch_database_error(url)
+            if error:
+                parser.error(error)
+        else:
+            url = f"sqlite:///{args.sqlite_path or os.path.join(RESULTS_DIR, f'load-{args.rows}.db')}"
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+        # Seeding and token signing import the app, whose engine is built from this
+        os.environ["DATABASE_URL"] = url
+        engine = create_engine(url)
+        seed_database(engine, args.rows, max(args.users), args.seed, log=lambda line: print(line, file=sys.stderr))
+        if args.seed_only:
+            return
+        app = build_app(engine)
+        tokens = access_tokens(engine, max(args.users))
+
+    stages = asyncio.run(run_stages(args, app, tokens))
+    output = write_report("load", {
+        "environment": environment(
+            target=args.base_url or "in-process",
+            database=engine.dialect.name if engine is not None else None,
+        ),
+        "parameters": {
+            "rows": None if args.base_url else args.rows, "duration": args.duration, "warmup": args.warmup,
+            "think_time": args.think_time, "seed": args.seed,
+        },
+        "stages": stages,
+    }, args.output)
+    print(f"\nResults written to {output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
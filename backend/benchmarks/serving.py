@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Throughput of the single-process server against the gunicorn production setup.
+
+Starts the real server once per mode against the same seeded database: first
+as a single uvicorn process, the way docker-compose.prod.yml used to run it,
+then with gunicorn.conf.py for each --workers count. Each server is loaded
+over HTTP with load.py's dashboard request mix and shut down again. The
+report has throughput, latency percentiles and the server's memory (RSS and,
+on Linux, PSS, which counts pages shared copy-on-write only once).
+
+The load generator is one asyncio process. If its CPU saturates before the
+server's, the multi-worker numbers are capped by the client; run it on
+another machine with load.py --base-url for capacity planning.
+
+    python benchmarks/serving.py --rows 100000 --workers 2 4 --users 50
+    python benchmarks/serving.py --database mysql --workers 8 --duration 60
+"""
+
+import os
+import sys
+import time
+import socket
+import signal
+import asyncio
+import argparse
+import subprocess
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import BACKEND_DIR, RESULTS_DIR, mysql_url, scratch_database_error, environment, write_report
+from benchmarks.load import seed_database, access_tokens, run_stages
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def server_command(mode: str, port: int):
+    if mode == "uvicorn":
+        return [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)]
+    return [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"]
+
+def process_tree(pid: int):
+    """pid and all its descendants (Linux /proc only; just pid elsewhere)"""
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return pids
+
+def memory_mb(pid: int) -> dict:
+    """Summed RSS and PSS of the server's process tree, in MiB"""
+    rss = pss = 0
+    pids = process_tree(pid)
+    for current in pids:
+        try:
+            with open(f"/proc/{current}/smaps_rollup") as f:
+                for line in f:
+                    key, value = line.split(":", 1)
+                    if key in ("Rss", "Pss"):
+                        kib = int(value.split()[0])
+                        rss += kib if key == "Rss" else 0
+                        pss += kib if key == "Pss" else 0
+        except OSError:
+            return {"processes": len(pids), "rss_mb": None, "pss_mb": None}
+    return {"processes": len(pids), "rss_mb": round(rss / 1024, 1), "pss_mb": round(pss / 1024, 1)}
+
+def wait_until_healthy(process, base_url: str, timeout: float = 60):
+    import httpx
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server not healthy after {timeout}s")
+
+def run_mode(args, mode: str, workers, url: str, tokens) -> dict:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    # The seeded database is built with create_all, not migrations, so it has no alembic_version
+    env = {**os.environ, "DATABASE_URL": url, "PORT": str(port), "BIND": f"127.0.0.1:{port}", "SCHEMA_CHECK": "off"}
+    if workers:
+        env["WEB_CONCURRENCY"] = str(workers)
+    label = mode if mode == "uvicorn" else f"gunicorn x{workers or 'default'}"
+    log_path = os.path.join(RESULTS_DIR, f"serving-{mode}-{workers or 'default'}.log")
+    print(f"\n== {label} (server log: {log_path})", file=sys.stderr, flush=True)
+
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(server_command(mode, port), cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            started = time.perf_counter()
+            wait_until_healthy(process, base_url)
+            ready_seconds = time.perf_counter() - started
+            load_args = argparse.Namespace(base_url=base_url, users=args.users, duration=args.duration,
+                                           warmup=args.warmup, think_time=args.think_time, seed=args.seed)
+            stages = asyncio.run(run_stages(load_args, None, tokens))
+            memory = memory_mb(process.pid)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            try:
+                process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return {"mode": label, "workers": workers if mode == "gunicorn" else 1, "ready_seconds": round(ready_seconds, 2),
+            "memory": memory, "stages": stages}
+
+def print_comparison(results):
+    print(f"\n{'mode':<22}{'users':>7}{'req/s':>10}{'speedup':>9}{'p50':>8}{'p95':>8}{'p99':>8}{'errors':>8}{'RSS MB':>9}{'PSS MB':>9}",
+          file=sys.stderr)
+    baseline = {stage["users"]: stage["rps"] for stage in results[0]["stages"]}
+    for result in results:
+        memory = result["memory"]
+        for stage in result["stages"]:
+            # Whole-mix latency from the per-endpoint rows, weighted by count
+            rows = stage["endpoints"].values()
+            weighted = lambda key: round(sum(row[key] * row["count"] for row in rows) / max(1, stage["requests"]), 1)
+            speedup = stage["rps"] / baseline[stage["users"]] if baseline.get(stage["users"]) else 0
+            print(f"{result['mode']:<22}{stage['users']:>7}{stage['rps']:>10}{speedup:>8.2f}x{weighted('p50_ms'):>8}"
+                  f"{weighted('p95_ms'):>8}{weighted('p99_ms'):>8}{stage['errors']:>8}"
+                  f"{memory['rss_mb'] or '-':>9}{memory['pss_mb'] or '-':>9}", file=sys.stderr)
+
+def print_endpoint_comparison(results):
+    """Per-endpoint req/s and p95 of every mode, side by side, for each user count"""
+    modes = [result["mode"] for result in results]
+    for users in sorted({stage["users"] for result in results for stage in result["stages"]}):
+        stages = [next((stage for stage in result["stages"] if stage["users"] == users), None) for result in results]
+        labels = sorted({label for stage in stages if stage for label in stage["endpoints"]})
+        print(f"\nusers={users}: req/s (p95 ms) per endpoint", file=sys.stderr)
+        print(f"  {'endpoint':<52}" + "".join(f"{mode:>22}" for mode in modes), file=sys.stderr)
+        for label in labels:
+            cells = []
+            for stage in stages:
+                row = stage["endpoints"].get(label) if stage else None
+                cells.append(f"{row['rps']} ({row['p95_ms']})" if row else "-")
+            print(f"  {label:<52}" + "".join(f"{cell:>22}" for cell in cells), file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare single-process uvicorn with the gunicorn production setup")
+    parser.add_argument("--rows", type=int, default=100000, help="fire_news rows to seed")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0],
+                        help="gunicorn worker counts to run (0 = gunicorn.conf.py default for this machine)")
+    parser.add_argument("--users", type=int, nargs="+", default=[50], help="Concurrent virtual users, one stage each")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per stage")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before each stage")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between a user's actions (0 = closed loop)")
+    parser.add_argument("--database", choices=["sqlite", "mysql"], default="sqlite",
+                        help="mysql uses BENCHMARK_MYSQL_URL or MYSQL_* with database firenews_bench; SQLite serializes "
+                             "the toggle writes across workers, so prefer mysql for absolute numbers")
+    parser.add_argument("--sqlite-path", help="Seeded SQLite file (default: benchmarks/results/load-<rows>.db, shared with load.py)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/serving-<timestamp>.json)")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+    if args.database == "mysql":
+        url = mysql_url()
+        error = scratch_database_error(url)
+        if error:
+            parser.error(error)
+    else:
+        path = os.path.abspath(args.sqlite_path or os.path.join(RESULTS_DIR, f"load-{args.rows}.db"))
+        url = f"sqlite:///{path}"
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    # Seeding and token signing import the app, whose engine is built from this
+    os.environ["DATABASE_URL"] = url
+    engine = create_engine(url)
+    seed_database(engine, args.rows, max(args.users), args.seed, log=lambda line: print(line, file=sys.stderr))
+    tokens = access_tokens(engine, max(args.users))
+    engine.dispose()
+
+    cores = os.cpu_count() or 1
+    if cores < 2:
+        # The load generator and every worker share one core, so more workers can't add throughput
+        print(f"warning: {cores} CPU core; the multi-worker comparison is only meaningful on 2 or more",
+              file=sys.stderr)
+
+    results = [run_mode(args, "uvicorn", None, url, tokens)]
+    for workers in args.workers:
+        results.append(run_mode(args, "gunicorn", workers or None, url, tokens))
+    print_comparison(results)
+    print_endpoint_comparison(results)
+
+    output = write_report("serving", {
+        "environment": environment(database=engine.dialect.name),
+        "parameters": {"rows": args.rows, "duration": args.duration, "warmup": args.warmup,
+                       "think_time": args.think_time, "seed": args.seed},
+        "results": results,
+    }, args.output)
+    print(f"\nResults written to {output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
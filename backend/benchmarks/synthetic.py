@@ -0,0 +1,227 @@
+"""
+Reproducible synthetic fire-news and 911 sheets for benchmarks.
+
+Rows are generated from a seeded RNG, so the same (kind, rows, seed) always
+yields the same sheet. Dates use the mix of formats seen in real uploads
+(scraper ISO timestamps, spreadsheet US dates, RSS dates, unix timestamps and
+the occasional unparseable value), which matters because parse_datetime tries
+its formats in order.
+"""
+
+import random
+from bisect import bisect
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+# (weight, strftime format); None means a unix timestamp, '' an unparseable value
+DATE_FORMATS = [
+    (35, "%Y-%m-%dT%H:%M:%SZ"),
+    (25, "%Y-%m-%d %H:%M:%S"),
+    (15, "%m/%d/%Y"),
+    (10, "%a, %d %b %Y %H:%M:%S +0000"),
+    (5, "%d %b %Y %H:%M:%S"),
+    (5, None),
+    (5, ''),
+]
+
+REPORTERS = ["Tweet", "Web", "Scraper", "Manual"]
+# (state, weight, [(county, city, latitude, longitude)]); weights follow where fire
+# news actually comes from, so California dominates and the tail stays thin
+GEOGRAPHY = [
+    ("California", 30, [("Shasta", "Redding", 40.59, -122.39), ("Butte", "Chico", 39.73, -121.84),
+                        ("Los Angeles", "Pasadena", 34.15, -118.14), ("Sonoma", "Santa Rosa", 38.44, -122.71),
+                        ("San Diego", "Escondido", 33.12, -117.09), ("Fresno", "Fresno", 36.74, -119.79)]),
+    ("Oregon", 10, [("Lane", "Eugene", 44.05, -123.09), ("Deschutes", "Bend", 44.06, -121.32),
+                    ("Jackson", "Medford", 42.33, -122.87)]),
+    ("Washington", 9, [("Chelan", "Wenatchee", 47.42, -120.31), ("Spokane", "Spokane", 47.66, -117.43),
+                       ("Yakima", "Yakima", 46.60, -120.51)]),
+    ("Texas", 9, [("Travis", "Austin", 30.27, -97.74), ("Harris", "Houston", 29.76, -95.37),
+                  ("Bexar", "San Antonio", 29.42, -98.49)]),
+    ("Colorado", 8, [("Larimer", "Fort Collins", 40.59, -105.08), ("Boulder", "Boulder", 40.01, -105.27),
+                     ("El Paso", "Colorado Springs", 38.83, -104.82)]),
+    ("Arizona", 8, [("Maricopa", "Phoenix", 33.45, -112.07), ("Coconino", "Flagstaff", 35.20, -111.65),
+                    ("Pima", "Tucson", 32.22, -110.97)]),
+    ("Montana", 5, [("Missoula", "Missoula", 46.87, -113.99), ("Gallatin", "Bozeman", 45.68, -111.04)]),
+    ("Idaho", 5, [("Ada", "Boise", 43.62, -116.21), ("Kootenai", "Coeur d'Alene", 47.68, -116.78)]),
+    ("Nevada", 4, [("Washoe", "Reno", 39.53, -119.81), ("Clark", "Las Vegas", 36.17, -115.14)]),
+    ("New Mexico", 4, [("Santa Fe", "Santa Fe", 35.69, -105.94), ("Bernalillo", "Albuquerque", 35.08, -106.65)]),
+    ("Utah", 4, [("Salt Lake", "Salt Lake City", 40.76, -111.89), ("Utah", "Provo", 40.23, -111.66)]),
+    ("Florida", 4, [("Collier", "Naples", 26.14, -81.79), ("Polk", "Lakeland", 28.04, -81.95)]),
+]
+STATES = {state: [(county, city) for county, city, _, _ in places] for state, _, places in GEOGRAPHY}
+
+HEADLINES = [
+    "Wildfire forces evacuations near {city}",
+    "Firefighters contain brush fire in {county} County",
+    "House fire displaces family in {city}",
+    "Red flag warning issued for {county} County",
+    "Crews battle blaze outside {city}",
+    "Structure fire damages warehouse in {city}",
+    "Grass fire burns acres along highway near {city}",
+]
+TAGS = ["wildfire", "evacuation", "structure-fire", "brush-fire", "red-flag", "smoke", "containment"]
+CONTEXTS = [
+    "Caller reports smoke visible from the roadway",
+    "Residential fire alarm, occupants evacuated",
+    "Vehicle fire on the shoulder, no injuries reported",
+    "Outdoor burn out of control spreading to fence line",
+    "Electrical fire in commercial kitchen",
+]
+UNPARSEABLE = ["unknown", "TBD", "N/A", ""]
+
+def _format_date(rng: random.Random, when: datetime) -> str:
+    total = sum(weight for weight, _ in DATE_FORMATS)
+    pick = rng.uniform(0, total)
+    for weight, fmt in DATE_FORMATS:
+        pick -= weight
+        if pick <= 0:
+            break
+    if fmt is None:
+        return str(int(when.timestamp()))
+    if fmt == '':
+        return rng.choice(UNPARSEABLE)
+    return when.strftime(fmt)
+
+def _place(rng: random.Random):
+    state = rng.choice(list(STATES))
+    county, city = rng.choice(STATES[state])
+    return state, county, city
+
+def fire_news_rows(rows: int, seed: int = 42, start: datetime = datetime(2024, 1, 1)) -> List[Dict]:
+    """Fire-news sheet rows with the columns process-excel and bulk-upload accept"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(rows):
+        state, county, city = _place(rng)
+        when = start + timedelta(minutes=rng.randrange(0, 365 * 24 * 60))
+        headline = rng.choice(HEADLINES).format(city=city, county=county)
+        items.append({
+            "title": f"{headline} #{i}",
+            "content": f"{headline}. Crews from {county} County responded; residents are urged to follow local guidance. " * rng.randint(1, 4),
+            "published_date": _format_date(rng, when),
+            "url": f"https://news.example.com/{state.lower()}/{i}",
+            "source": f"{city} Daily",
+            "fire_related_score": round(rng.uniform(0.5, 1.0), 2),
+            "verification_result": rng.choice(["yes", "yes", "yes", "pending"]),
+            "state": state,
+            "county": county,
+            "city": city,
+            "country": "USA",
+            "latitude": round(rng.uniform(30.0, 48.0), 5),
+            "longitude": round(rng.uniform(-123.0, -95.0), 5),
+            "tags": ",".join(rng.sample(TAGS, rng.randint(0, 3))) or None,
+            "reporter_name": rng.choice(REPORTERS),
+        })
+    return items
+
+def emergency_911_rows(rows: int, seed: int = 42, start: datetime = datetime(2024, 1, 1)) -> List[Dict]:
+    """911 sheet rows using the column headers process-excel expects for reporter '911'"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(rows):
+        _, county, city = _place(rng)
+        when = start + timedelta(minutes=rng.randrange(0, 365 * 24 * 60))
+        address = f"{rng.randint(100, 9999)} {rng.choice(['Oak', 'Pine', 'Main', 'Cedar', 'Ridge'])} St"
+        items.append({
+            # Station plus row number keeps (station, date) unique within a sheet
+            "Station Name": f"{city} Station {i % 50} / {i}",
+            "Date": _format_date(rng, when),
+            "City": city,
+            "County": county,
+            "Address": address,
+            "Context": rng.choice(CONTEXTS),
+            "Verified Address": f"{address}, {city}",
+            "Lat": round(rng.uniform(30.0, 48.0), 5),
+            "Long": round(rng.uniform(-123.0, -95.0), 5),
+            "Address Accuracy Score": round(rng.uniform(0.6, 1.0), 2),
+        })
+    return items
+
+# (weight, reporter_name) for stored rows: the dashboard tabs' big two, 911 feeds,
+# a Zipf-shaped tail of scrapers and a few rows without a reporter (Others tab)
+STORED_REPORTERS = [(38, "Tweet"), (30, "Web"), (10, "911"), (4, "")] + [
+    (round(4.5 / rank, 3), f"Scraper {rank:02d}") for rank in range(1, 31)
+]
+# (name, category, color); earlier tags are attached more often
+TAG_CATALOG = [
+    ("wildfire", "fire_type", "#d9480f"), ("structure-fire", "fire_type", "#c92a2a"),
+    ("brush-fire", "fire_type", "#e67700"), ("vehicle-fire", "fire_type", "#a61e4d"),
+    ("evacuation", "impact", "#1971c2"), ("injuries", "impact", "#862e9c"),
+    ("fatalities", "impact", "#212529"), ("road-closure", "impact", "#5f3dc4"),
+    ("red-flag", "weather", "#f08c00"), ("smoke", "weather", "#868e96"),
+    ("high-wind", "weather", "#1098ad"), ("containment", "status", "#2b8a3e"),
+    ("arson", "cause", "#e03131"), ("lightning", "cause", "#fab005"),
+    ("power-lines", "cause", "#364fc7"), ("fireworks", "cause", "#d6336c"),
+]
+FIRE_NEWS_COLUMNS = (
+    "id", "data_type", "title", "content", "published_date", "incident_date", "url", "source",
+    "fire_related_score", "verification_result", "state", "county", "city", "country", "latitude",
+    "longitude", "tags", "reporter_name", "is_verified", "is_hidden", "station_name", "address",
+    "context", "created_at",
+)
+STREETS = ["Oak", "Pine", "Main", "Cedar", "Ridge", "Canyon", "Mill", "Lake"]
+
+def _cumulative(weights) -> List[float]:
+    total, running = 0.0, []
+    for weight in weights:
+        total += weight
+        running.append(total)
+    return running
+
+def _weighted(rng: random.Random, items, cumulative):
+    return items[bisect(cumulative, rng.random() * cumulative[-1])]
+
+def _timestamps(start: datetime, days: int) -> List[str]:
+    """'YYYY-MM-DD ' prefix of every day in the range; formatting the time part by hand is far cheaper than strftime"""
+    return [f"{start + timedelta(days=day):%Y-%m-%d} " for day in range(days + 1)]
+
+def fire_news_tuples(count: int, seed: int = 42, first_id: int = 1,
+                     start: datetime = datetime(2024, 1, 1), days: int = 365) -> Iterator[Tuple[tuple, List[int]]]:
+    """Stored fire_news rows in FIRE_NEWS_COLUMNS order, with the TAG_CATALOG indexes attached to each.
+
+    Built for bulk loading millions of rows: plain tuples, dates already
+    formatted as 'YYYY-MM-DD HH:MM:SS', booleans as 0/1, and weighted picks by
+    bisect on precomputed cumulative weights.
+    """
+    rng = random.Random(seed)
+    random_ = rng.random
+    places = [(state, county, city, lat, lon) for state, _, counties in GEOGRAPHY for county, city, lat, lon in counties]
+    place_weights = _cumulative(weight / len(counties) for _, weight, counties in GEOGRAPHY for _ in counties)
+    reporters = [name for _, name in STORED_REPORTERS]
+    reporter_weights = _cumulative(weight for weight, _ in STORED_REPORTERS)
+    tag_indexes = range(len(TAG_CATALOG))
+    tag_weights = _cumulative(1 / rank for rank in range(1, len(TAG_CATALOG) + 1))
+    tag_counts = _cumulative([40, 35, 20, 5])
+    # Every headline pre-rendered for every place
+    headlines = [[headline.format(city=city, county=county) for _, county, city, _, _ in places] for headline in HEADLINES]
+    day_prefixes = _timestamps(start, days)
+    span_seconds = days * 86400
+    for news_id in range(first_id, first_id + count):
+        place = bisect(place_weights, random_() * place_weights[-1])
+        state, county, city, lat, lon = places[place]
+        reporter = _weighted(rng, reporters, reporter_weights)
+        offset = int(random_() * span_seconds)
+        day, second = divmod(offset, 86400)
+        when = f"{day_prefixes[day]}{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+        day, second = divmod(offset + 60 + int(random_() * 21600), 86400)
+        created_at = f"{day_prefixes[day]}{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+        tag_ids = sorted({_weighted(rng, tag_indexes, tag_weights) for _ in range(bisect(tag_counts, random_() * 100))})
+        tags = ",".join(TAG_CATALOG[index][0] for index in tag_ids) or None
+        latitude = round(lat + random_() / 2 - 0.25, 5)
+        longitude = round(lon + random_() / 2 - 0.25, 5)
+        is_verified = int(random_() < 0.3)
+        is_hidden = int(random_() < 0.03)
+        if reporter == "911":
+            station = f"{city} Station {news_id % 40}"
+            row = (news_id, "emergency_911", f"911 Emergency - {station} - {when[:16]}",
+                   CONTEXTS[news_id % len(CONTEXTS)], None, when, None, None, None, None, state, county, city, "USA",
+                   latitude, longitude, tags, reporter, is_verified, is_hidden, station,
+                   f"{100 + news_id % 9900} {STREETS[news_id % len(STREETS)]} St", CONTEXTS[news_id % len(CONTEXTS)], created_at)
+        else:
+            headline = headlines[int(random_() * len(headlines))][place]
+            row = (news_id, "fire_news", f"{headline} #{news_id}",
+                   f"{headline}. Crews from {county} County responded; residents are urged to follow local guidance.",
+                   when, None, f"https://news.example.com/{news_id}", f"{city} Daily",
+                   round(0.5 + random_() / 2, 2), "yes", state, county, city, "USA", latitude, longitude,
+                   tags, reporter, is_verified, is_hidden, None, None, None, created_at)
+        yield row, tag_ids
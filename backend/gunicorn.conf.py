@@ -0,0 +1,82 @@
+"""
+Gunicorn settings for production serving (SERVER_MODE=production in start.sh).
+
+Runs the app in several uvicorn worker processes (uvloop and httptools from
+uvicorn[standard]). The app is imported once in the master and forked, so
+workers share its memory copy-on-write. Workers are recycled after
+MAX_REQUESTS requests or once their RSS passes WORKER_MAX_RSS_MB, and on
+SIGTERM they get GRACEFUL_TIMEOUT seconds to finish in-flight requests.
+
+Workers keep metrics, request profiles and the slow query log in memory and
+publish them to SHARED_STATE_DIR (one fresh directory per master, removed on
+exit), so /metrics, /api/admin/profiles and /api/admin/slow-queries answer
+for the whole server whichever worker a request lands on.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+
+import os
+import gc
+import shutil
+import tempfile
+import multiprocessing
+
+# Set before the app is imported (preload happens right after this file is read)
+_own_state_dir = not os.getenv('SHARED_STATE_DIR')
+if _own_state_dir:
+    os.environ['SHARED_STATE_DIR'] = tempfile.mkdtemp(prefix='firenews-workers-')
+
+def _default_workers() -> int:
+    # Endpoints are sync and run on each worker's threadpool, so a worker
+    # process is worth roughly one core; a second per core covers I/O waits
+    cores = multiprocessing.cpu_count()
+    return max(2, min(cores * int(os.getenv('WORKERS_PER_CORE', 2)), int(os.getenv('MAX_WORKERS', 16))))
+
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', '9500')}")
+workers = int(os.getenv('WEB_CONCURRENCY', 0)) or _default_workers()
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = os.getenv('PRELOAD_APP', 'true').lower() in ('1', 'true', 'yes')
+
+# Recycling: the jitter keeps workers from all restarting at the same moment
+max_requests = int(os.getenv('MAX_REQUESTS', 5000))
+max_requests_jitter = int(os.getenv('MAX_REQUESTS_JITTER', max_requests // 10))
+
+# Excel processing can hold a request for a long time; the heartbeat comes
+# from the event loop, which keeps running while the threadpool parses
+timeout = int(os.getenv('WORKER_TIMEOUT', 120))
+graceful_timeout = int(os.getenv('GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('KEEPALIVE', 5))
+
+accesslog = os.getenv('ACCESS_LOG') or None
+errorlog = "-"
+loglevel = os.getenv('LOG_LEVEL', 'info')
+
+def when_ready(server):
+    server.log.info(f"Serving with {workers} workers (preload={preload_app}, max_requests={max_requests})")
+    if preload_app:
+        # Objects created while importing the app never change again; moving them
+        # out of the collector's reach stops gc passes in the workers from
+        # touching (and so copying) the shared pages
+        gc.freeze()
+
+def post_fork(server, worker):
+    if preload_app:
+        # Connections opened while preloading belong to the master; drop them
+        # from the child's pool without closing the master's sockets
+        from app.core.db import engine
+        engine.dispose(close=False)
+
+def child_exit(server, worker):
+    # Keep an exited worker's counters and slow queries; its gauges and files go
+    from app.core.metrics import mark_process_dead
+    from app.core.slow_queries import slow_query_log
+    mark_process_dead(worker.pid)
+    slow_query_log.archive_worker(worker.pid)
+
+def on_exit(server):
+    if _own_state_dir:
+        shutil.rmtree(os.environ['SHARED_STATE_DIR'], ignore_errors=True)
+
+def post_worker_init(worker):
+    from app.core.worker_watchdog import RssWatchdog
+    RssWatchdog().start()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Explicit database migration step.
+
+The app no longer migrates on boot; it only checks that the schema is at the
+migration head (SCHEMA_CHECK). Run this once per deploy, before starting the
+new version. When the database is already current it returns without
+importing alembic.
+
+    python migrate.py              # upgrade to head if needed
+    python migrate.py --check      # exit 1 when the database is behind
+    python migrate.py --wait 120   # wait up to 120s for the database first
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from app.core.db import DATABASE_URL
+from app.core.schema import schema_status
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def wait_for_database(engine, timeout: float):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with engine.connect():
+                return
+        except OperationalError as e:
+            if time.monotonic() >= deadline:
+                raise
+            print(f"Waiting for the database ({e.orig})...")
+            time.sleep(2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or apply database migrations")
+    parser.add_argument("--check", action="store_true", help="Only report; exit 1 when the schema is not at head")
+    parser.add_argument("--wait", type=float, default=0, help="Seconds to wait for the database to accept connections")
+    args = parser.parse_args()
+
+    engine = create_engine(DATABASE_URL)
+    if args.wait:
+        wait_for_database(engine, args.wait)
+    status = schema_status(engine)
+    print(status.describe())
+    if status.up_to_date:
+        return
+    if args.check:
+        sys.exit(1)
+
+    from alembic import command
+    from alembic.config import Config
+    started = time.perf_counter()
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    command.upgrade(config, "head")
+    status = schema_status(engine)
+    print(f"{status.describe()} (migrated in {time.perf_counter() - started:.1f}s)")
+    if not status.up_to_date:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,26 @@ while ! nc -z mysql 3306; do
 done
 echo "MySQL is ready!"
 
-# Run database migrations
-echo "Running database migrations..."
-alembic upgrade head
+# Migrations are an explicit deploy step in production (python migrate.py, see
+# deploy.sh); development applies them here. Either way the app checks the
+# schema version at startup and refuses to serve a stale schema.
+if [ "$SERVER_MODE" = "production" ]; then
+  MIGRATE_ON_START="${MIGRATE_ON_START:-false}"
+else
+  MIGRATE_ON_START="${MIGRATE_ON_START:-true}"
+fi
+if [ "$MIGRATE_ON_START" = "true" ]; then
+  echo "Applying database migrations..."
+  python migrate.py || exit 1
+fi
 
 # Start the application
-echo "Starting FastAPI application..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 9500 --reload 
\ No newline at end of file
+PORT="${PORT:-9500}"
+if [ "$SERVER_MODE" = "production" ]; then
+  # Multi-worker gunicorn; see gunicorn.conf.py for worker count and recycling
+  echo "Starting FastAPI application (production, gunicorn)..."
+  exec gunicorn -c gunicorn.conf.py app.main:app
+else
+  echo "Starting FastAPI application (development, reload)..."
+  exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --reload
+fi
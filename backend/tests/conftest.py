@@ -0,0 +1,180 @@
+"""
+Fixtures for the per-endpoint query-count and latency budget suite.
+
+Every test module gets its own in-memory SQLite database seeded with
+benchmarks.dataset and the real FastAPI app with get_db bound to it. The
+budget fixture sends one request, records every SQL statement it ran, and
+fails with the full statement list when the request goes over its statement
+or latency budget.
+
+Latency budgets are loose on purpose; scale them on slow machines with
+BUDGET_LATENCY_FACTOR (0 turns them off).
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import List, Optional
+
+# Settings read at import time by the app; set before anything imports it
+os.environ.setdefault('MYSQL_PORT', '3306')
+os.environ.setdefault('SLOW_QUERY_EXPLAIN', 'false')
+os.environ.setdefault('TRACE_EXPORTER', 'none')
+os.environ.setdefault('BCRYPT_ROUNDS', '4')
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from fastapi.testclient import TestClient
+
+BUDGET_LATENCY_FACTOR = float(os.getenv('BUDGET_LATENCY_FACTOR', 1))
+
+# Seeded dataset size; listing budgets must hold at any size, so keep it small and fast
+SEED_ROWS = 1000
+# generate() makes every 50th user an admin and every 10th a reporter
+SEED_USERS = 50
+ADMIN_ID, REPORTER_ID, USER_ID = 50, 10, 1
+
+class StatementRecorder:
+    """SQL statements executed on one engine between start() and stop()"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self.recording = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.recording:
+            self.statements.append(statement)
+
+    def start(self):
+        self.statements = []
+        self.recording = True
+
+    def stop(self) -> List[str]:
+        self.recording = False
+        return self.statements
+
+class BudgetResult:
+    def __init__(self, response, statements: List[str], elapsed_ms: float):
+        self.response = response
+        self.statements = statements
+        self.elapsed_ms = elapsed_ms
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+def format_statements(statements: List[str]) -> str:
+    from app.core.query_stats import normalize_sql
+    from collections import Counter
+    lines = [f"{len(statements)} statements:"]
+    lines += [f"  {i}. {' '.join(statement.split())[:400]}" for i, statement in enumerate(statements, 1)]
+    repeated = [(shape, count) for shape, count in Counter(map(normalize_sql, statements)).most_common() if count > 1]
+    if repeated:
+        lines.append("Repeated shapes:")
+        lines += [f"  {count}x {shape[:300]}" for shape, count in repeated]
+    return "\n".join(lines)
+
+def reset_caches():
+    """Budgets are for the cold path, so every in-process cache starts empty"""
+    from app.services.bookmark_service import _bookmark_index_cache
+    from app.services.auto_tagger import invalidate_auto_tagger
+    from app.routers.users import _stats_cache
+    _bookmark_index_cache.invalidate()
+    _stats_cache.invalidate()
+    invalidate_auto_tagger()
+
+@pytest.fixture(scope="module")
+def engine():
+    from benchmarks.dataset import DatasetGenerator
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    # generate() creates the tables on SQLite
+    DatasetGenerator(engine, seed=7, end=datetime(2025, 1, 1), days=366, log=lambda message: None).generate(
+        SEED_ROWS, users=SEED_USERS, bookmarks_per_user=20, activity_logs=500
+    )
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(scope="module")
+def recorder(engine):
+    recorder = StatementRecorder()
+    event.listen(engine, 'before_cursor_execute', recorder)
+    yield recorder
+    event.remove(engine, 'before_cursor_execute', recorder)
+
+@pytest.fixture(scope="module")
+def client(engine, recorder):
+    from app.main import app
+    from app.core.db import get_db
+
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_test_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    # Not entered as a context manager, so the audit sink stays off and
+    # activity logs are written inside the request that creates them
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+@pytest.fixture(scope="module")
+def auth_headers(engine):
+    """Authorization headers by role: "admin", "reporter" and "user" """
+    from app.models import User
+    from app.services.auth_service import AuthService
+    auth = AuthService()
+    with Session(engine) as db:
+        return {
+            role: {"Authorization": f"Bearer {auth.create_token(db.get(User, user_id))['access_token']}"}
+            for role, user_id in (("admin", ADMIN_ID), ("reporter", REPORTER_ID), ("user", USER_ID))
+        }
+
+@pytest.fixture
+def budget(client, recorder):
+    """budget(method, url, max_statements, max_ms, status=200, **request_kwargs) -> BudgetResult
+
+    GET requests are sent once untimed first, so import and schema warm-up
+    don't count against the latency budget; caches are reset afterwards.
+    """
+    def check(method: str, url: str, max_statements: int, max_ms: float, status: Optional[int] = 200, **kwargs) -> BudgetResult:
+        if method == "GET":
+            client.request(method, url, **kwargs)
+        reset_caches()
+        recorder.start()
+        started = time.perf_counter()
+        try:
+            response = client.request(method, url, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            statements = recorder.stop()
+        result = BudgetResult(response, statements, elapsed_ms)
+
+        problems = []
+        if status is not None and response.status_code != status:
+            problems.append(f"expected status {status}, got {response.status_code}: {response.text[:500]}")
+        if result.count > max_statements:
+            problems.append(f"{result.count} SQL statements, budget is {max_statements}")
+        if BUDGET_LATENCY_FACTOR and elapsed_ms > max_ms * BUDGET_LATENCY_FACTOR:
+            problems.append(f"took {elapsed_ms:.0f} ms, budget is {max_ms * BUDGET_LATENCY_FACTOR:.0f} ms")
+        if problems:
+            pytest.fail(f"{method} {url}: " + "; ".join(problems) + "\n" + format_statements(statements), pytrace=False)
+        return result
+
+    return check
+
+@pytest.fixture
+def fire_news_id(engine):
+    """Id of a fresh fire_news row, for tests that modify or delete one"""
+    from app.models import FireNews
+    with Session(engine) as db:
+        news = FireNews(title=f"Budget fixture {time.perf_counter_ns()}", content="Structure fire", reporter_name="Tweet",
+                        data_type="fire_news", published_date=datetime(2024, 6, 1), state="California", county="Kern")
+        db.add(news)
+        db.commit()
+        return news.id
@@ -0,0 +1,31 @@
+"""Statement and latency budgets for the admin endpoints (app/routers/admin.py)"""
+
+import pytest
+from tests.conftest import USER_ID
+
+@pytest.mark.parametrize("page_size", [1, 100])
+def test_activity_logs(budget, auth_headers, page_size):
+    budget("GET", "/api/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+           params={"page_size": page_size})
+
+def test_activity_logs_next_page(budget, auth_headers):
+    first = budget("GET", "/api/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+                   params={"page_size": 20, "action_type": "news_uploaded"})
+    budget("GET", "/api/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+           params={"page_size": 20, "action_type": "news_uploaded", "cursor": first.response.headers["X-Next-Cursor"]})
+
+@pytest.mark.parametrize("limit", [1, 100])
+def test_user_activity_logs(budget, auth_headers, limit):
+    budget("GET", f"/api/admin/activity-logs/user/{USER_ID}", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+           params={"limit": limit})
+
+def test_ingestion_stats(budget, auth_headers):
+    budget("GET", "/api/admin/activity-logs/ingestion-stats", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+           params={"start_date": "2024-01-01", "end_date": "2024-12-31"})
+
+def test_slow_queries(budget, auth_headers):
+    budget("GET", "/api/admin/slow-queries", max_statements=1, max_ms=250, headers=auth_headers["admin"])
+    budget("DELETE", "/api/admin/slow-queries", max_statements=1, max_ms=250, headers=auth_headers["admin"])
+
+def test_profiles(budget, auth_headers):
+    budget("GET", "/api/admin/profiles", max_statements=1, max_ms=250, headers=auth_headers["admin"])
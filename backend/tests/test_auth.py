@@ -0,0 +1,20 @@
+"""Statement and latency budgets for the auth endpoints (app/routers/auth.py)
+
+Password hashing is part of register and login, so BCRYPT_ROUNDS is kept at
+its minimum here and the latency budgets cover the database work only.
+"""
+
+def test_register(budget):
+    budget("POST", "/auth/register", max_statements=6, max_ms=250,
+           json={"email": "budget-register@example.com", "password": "password", "username": "budgetregister"})
+
+def test_login_refresh_logout(budget):
+    login = budget("POST", "/auth/login", max_statements=7, max_ms=250,
+                   json={"email": "loadgen-1@example.com", "password": "password"})
+    refreshed = budget("POST", "/auth/refresh", max_statements=5, max_ms=250,
+                       json={"refresh_token": login.response.json()["refresh_token"]})
+    budget("POST", "/auth/logout", max_statements=6, max_ms=250,
+           json={"refresh_token": refreshed.response.json()["refresh_token"]})
+
+def test_me(budget, auth_headers):
+    budget("GET", "/auth/me", max_statements=1, max_ms=250, headers=auth_headers["user"])
@@ -0,0 +1,53 @@
+"""Statement and latency budgets for the bookmark endpoints (app/routers/bookmarks.py)"""
+
+import pytest
+from tests.conftest import USER_ID
+
+@pytest.mark.parametrize("limit", [1, 20, 200])
+def test_list_bookmarks(budget, auth_headers, limit):
+    budget("GET", "/api/bookmarks/", max_statements=1, max_ms=250, headers=auth_headers["user"], params={"limit": limit})
+
+def test_list_bookmarks_next_page(budget, auth_headers):
+    first = budget("GET", "/api/bookmarks/", max_statements=1, max_ms=250, headers=auth_headers["user"],
+                   params={"limit": 5, "data_type": "fire_news"})
+    cursor = first.response.headers["X-Next-Cursor"]
+    budget("GET", "/api/bookmarks/", max_statements=1, max_ms=250, headers=auth_headers["user"],
+           params={"limit": 5, "data_type": "fire_news", "cursor": cursor})
+
+@pytest.mark.parametrize("count", [1, 500])
+def test_check_many(budget, auth_headers, count):
+    budget("POST", "/api/bookmarks/check", max_statements=1, max_ms=250, headers=auth_headers["user"],
+           json={"news_ids": list(range(1, count + 1)), "data_type": "fire_news"})
+
+def test_check_one(budget, auth_headers):
+    budget("GET", "/api/bookmarks/check/1", max_statements=1, max_ms=250, headers=auth_headers["user"],
+           params={"data_type": "fire_news"})
+
+def test_add_and_remove(budget, auth_headers, fire_news_id):
+    headers = auth_headers["user"]
+    created = budget("POST", "/api/bookmarks/", max_statements=5, max_ms=250, headers=headers,
+                     json={"news_id": fire_news_id, "data_type": "fire_news"})
+    assert created.response.json()["user_id"] == USER_ID
+    budget("DELETE", f"/api/bookmarks/{created.response.json()['id']}", max_statements=4, max_ms=250, headers=headers)
+
+def test_remove_by_news(budget, auth_headers, fire_news_id):
+    headers = auth_headers["user"]
+    budget("POST", "/api/bookmarks/", max_statements=5, max_ms=250, headers=headers,
+           json={"news_id": fire_news_id, "data_type": "fire_news"})
+    budget("DELETE", f"/api/bookmarks/news/{fire_news_id}", max_statements=4, max_ms=250, headers=headers,
+           params={"data_type": "fire_news"})
+
+# Fields frontend/components/DataTable.tsx, Emergency911Table.tsx and pages/bookmarks.tsx read from `news`
+FRONTEND_NEWS_KEYS = {
+    "id", "title", "content", "url", "source", "published_date", "incident_date", "fire_related_score",
+    "address_accuracy_score", "state", "county", "city", "tags", "reporter_name", "address", "context",
+    "is_verified", "is_hidden", "created_at",
+}
+
+@pytest.mark.parametrize("data_type", ["fire_news", "emergency_911"])
+def test_list_bookmarks_has_fields_the_tables_read(client, auth_headers, data_type):
+    response = client.get("/api/bookmarks/", headers=auth_headers["user"], params={"limit": 1, "data_type": data_type})
+    assert response.status_code == 200 and response.json(), f"no seeded {data_type} bookmarks to check"
+    for bookmark in response.json():
+        assert set(bookmark) >= {"id", "user_id", "news_id", "data_type", "created_at", "news"}
+        assert set(bookmark["news"]) >= FRONTEND_NEWS_KEYS
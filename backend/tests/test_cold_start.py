@@ -0,0 +1,24 @@
+"""Startup cost guards: what importing the app may pull in"""
+
+import os
+import sys
+import json
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_app_import_leaves_heavy_modules_lazy():
+    from benchmarks.import_time import LAZY_MODULES
+    probe = "import sys, json, app.main; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", probe], cwd=BACKEND_DIR, env={**os.environ, "MYSQL_PORT": "3306"},
+                            capture_output=True, text=True, check=True)
+    modules = set(json.loads(result.stdout.strip().splitlines()[-1]))
+    assert not modules & set(LAZY_MODULES), f"imported by app.main: {sorted(modules & set(LAZY_MODULES))}"
+
+def test_expected_heads_match_alembic():
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    from app.core.schema import expected_heads
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    assert expected_heads() == set(ScriptDirectory.from_config(config).get_heads())
@@ -0,0 +1,141 @@
+"""Response compression (app/middleware/compression.py): negotiation, thresholds, streaming and metrics"""
+
+import zlib
+import asyncio
+import pytest
+
+from app.middleware.compression import (
+    CompressionMiddleware, choose_encoding, COMPRESSED_RESPONSES, COMPRESSION_INPUT_BYTES, COMPRESSION_OUTPUT_BYTES,
+    COMPRESSION_SECONDS, UNCOMPRESSED_RESPONSES,
+)
+
+@pytest.mark.parametrize("accept, available, expected", [
+    ("gzip, deflate, br", ["br", "gzip"], "br"),
+    ("gzip, deflate, br", ["gzip"], "gzip"),
+    ("gzip;q=1.0, br;q=0.5", ["br", "gzip"], "gzip"),
+    ("br;q=0, *", ["br", "gzip"], "gzip"),
+    ("*;q=0.1", ["gzip"], "gzip"),
+    ("identity", ["br", "gzip"], None),
+    ("gzip;q=0", ["gzip"], None),
+    ("GZIP ; Q=0.8", ["gzip"], "gzip"),
+    ("gzip;q=oops", ["gzip"], None),
+    ("", ["br", "gzip"], None),
+])
+def test_choose_encoding(accept, available, expected):
+    assert choose_encoding(accept, available) == expected
+
+def run(app, headers=((b"accept-encoding", b"gzip"),), minimum_size=100):
+    """Messages the middleware sends for one GET request"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/export", "headers": list(headers)}
+    asyncio.run(CompressionMiddleware(app, minimum_size=minimum_size, encodings=["gzip"])(scope, receive, send))
+    return messages[0], [m for m in messages[1:] if m["type"] == "http.response.body"]
+
+def body_app(body, content_type=b"application/json", extra_headers=()):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode()), *extra_headers]})
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+def streaming_app(chunks, observed):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/csv")]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            observed.append(chunk)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+    return app
+
+def test_large_body_is_compressed():
+    body = b'{"items":[' + b",".join(b'{"id":%d,"title":"Brush fire"}' % i for i in range(200)) + b"]}"
+    start, bodies = run(body_app(body))
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert int(headers[b"content-length"]) == len(bodies[0]["body"]) < len(body)
+    assert zlib.decompress(bodies[0]["body"], 31) == body
+
+@pytest.mark.parametrize("headers, body, content_type, extra", [
+    ([(b"accept-encoding", b"gzip")], b'{"ok":true}', b"application/json", ()),
+    ([(b"accept-encoding", b"identity")], b"x" * 1000, b"application/json", ()),
+    ([(b"accept-encoding", b"gzip")], b"\x89PNG" * 1000, b"image/png", ()),
+    ([(b"accept-encoding", b"gzip")], b"x" * 1000, b"text/plain", ((b"content-encoding", b"gzip"),)),
+], ids=["below-minimum-size", "not-accepted", "not-compressible", "already-encoded"])
+def test_passes_through(headers, body, content_type, extra):
+    start, bodies = run(body_app(body, content_type, extra), headers=headers)
+    sent_headers = dict(start["headers"])
+    assert sent_headers.get(b"content-encoding") in (None, b"gzip" if extra else None)
+    assert b"".join(m["body"] for m in bodies) == body
+    assert int(sent_headers[b"content-length"]) == len(body)
+
+def test_streaming_body_is_compressed_as_it_arrives():
+    chunks = [b"id,title\n"] + [b"%d,Structure fire on Main St\n" % i for i in range(200)]
+    observed = []
+    start, bodies = run(streaming_app(chunks, observed))
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    # Chunks are held back only until the threshold; after that each sent chunk decodes on its own arrival
+    assert len(bodies) > len(chunks) // 2
+    decoder = zlib.decompressobj(31)
+    received = b""
+    for message in bodies[:-1]:
+        received += decoder.decompress(message["body"])
+        assert message["more_body"]
+    assert received.endswith(chunks[-1])
+    received += decoder.decompress(bodies[-1]["body"]) + decoder.flush()
+    assert received == b"".join(chunks)
+    assert decoder.eof
+
+def test_short_stream_goes_out_uncompressed():
+    chunks = [b"id,title\n", b"1,Fire\n"]
+    start, bodies = run(streaming_app(chunks, []))
+    assert b"content-encoding" not in dict(start["headers"])
+    assert b"".join(m["body"] for m in bodies) == b"".join(chunks)
+
+def test_listing_is_negotiated_and_measured(client):
+    route = "/api/fire-news"
+    responses = COMPRESSED_RESPONSES.value(route=route, encoding="gzip")
+    output_bytes = COMPRESSION_OUTPUT_BYTES.value(route=route, encoding="gzip")
+    timings = COMPRESSION_SECONDS.count(route=route, encoding="gzip")
+    skipped = UNCOMPRESSED_RESPONSES.value(route=route, reason="not_accepted")
+
+    compressed = client.get(route, params={"page_size": 100}, headers={"Accept-Encoding": "gzip"})
+    plain = client.get(route, params={"page_size": 100}, headers={"Accept-Encoding": "identity"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["vary"] == plain.headers["vary"] == "Accept-Encoding"
+    assert compressed.content == plain.content
+
+    sent = COMPRESSION_OUTPUT_BYTES.value(route=route, encoding="gzip") - output_bytes
+    assert COMPRESSED_RESPONSES.value(route=route, encoding="gzip") == responses + 1
+    assert 0 < sent < len(plain.content) / 2
+    assert COMPRESSION_INPUT_BYTES.value(route=route, encoding="gzip") >= len(plain.content)
+    assert COMPRESSION_SECONDS.count(route=route, encoding="gzip") == timings + 1
+    assert UNCOMPRESSED_RESPONSES.value(route=route, reason="not_accepted") == skipped + 1
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert UNCOMPRESSED_RESPONSES.value(route="/health", reason="below_minimum_size") >= 1
+
+def test_brotli_when_installed():
+    brotli = pytest.importorskip("brotli")
+    body = b"Wildfire near the ridge. " * 200
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip, br")]}
+    asyncio.run(CompressionMiddleware(body_app(body, b"text/plain"), encodings=["br", "gzip"])(scope, None, send))
+    assert dict(messages[0]["headers"])[b"content-encoding"] == b"br"
+    assert brotli.decompress(messages[1]["body"]) == body
@@ -0,0 +1,96 @@
+"""Statement and latency budgets for the fire news endpoints (app/routers/excel_uploads.py)"""
+
+import io
+import pytest
+
+LISTINGS = ["/api/fire-news", "/api/fire-news/all-leads", "/api/fire-news/tweet", "/api/fire-news/web",
+            "/api/fire-news/hidden", "/api/fire-news/others", "/api/fire-news/911"]
+FILTERS = {"state": "California", "search": "fire", "start_date": "2024-03-01", "end_date": "2024-09-30", "is_verified": "false"}
+
+@pytest.mark.parametrize("page_size", [10, 100])
+@pytest.mark.parametrize("path", LISTINGS)
+def test_listing(budget, path, page_size):
+    budget("GET", path, max_statements=2, max_ms=250, params={"page_size": page_size})
+
+@pytest.mark.parametrize("path", LISTINGS)
+def test_listing_filtered_deep_page(budget, path):
+    budget("GET", path, max_statements=2, max_ms=250, params={"page_size": 100, "page": 3, **FILTERS})
+
+@pytest.mark.parametrize("path", LISTINGS)
+def test_listing_statements_do_not_grow_with_page_size(budget, path):
+    small = budget("GET", path, max_statements=2, max_ms=250, params={"page_size": 1})
+    large = budget("GET", path, max_statements=2, max_ms=250, params={"page_size": 100})
+    assert large.count == small.count
+
+@pytest.mark.parametrize("page_size", [10, 100])
+def test_search(budget, page_size):
+    budget("GET", "/api/fire-news/search", max_statements=2, max_ms=250, params={"title": "fire", "page_size": page_size})
+
+def test_reporters(budget):
+    budget("GET", "/api/fire-news/reporters", max_statements=1, max_ms=250)
+
+def test_others_count(budget):
+    budget("GET", "/api/fire-news/others-count", max_statements=1, max_ms=250)
+
+def test_update(budget, auth_headers, fire_news_id):
+    budget("PUT", f"/api/fire-news/{fire_news_id}", max_statements=4, max_ms=250,
+           headers=auth_headers["reporter"], json={"status": "completed"})
+
+def test_toggle_verified(budget, fire_news_id):
+    budget("PUT", f"/api/fire-news/{fire_news_id}/toggle-verified", max_statements=3, max_ms=250)
+
+def test_toggle_hidden(budget, fire_news_id):
+    budget("PUT", f"/api/fire-news/{fire_news_id}/toggle-hidden", max_statements=3, max_ms=250)
+
+def test_delete(budget, fire_news_id):
+    budget("DELETE", f"/api/fire-news/{fire_news_id}", max_statements=3, max_ms=250)
+
+def test_excel_upload_record(budget, auth_headers):
+    budget("POST", "/api/excel-uploads", max_statements=7, max_ms=250, headers=auth_headers["user"],
+           files={"file": ("budget.xlsx", b"not parsed here", "application/octet-stream")})
+
+# Ingestion dedups against stored rows with one lookup and inserts with one
+# multi-row statement, so the statement count doesn't depend on the batch size
+
+def _items(count, prefix):
+    return [{"title": f"{prefix} {i}", "content": "Brush fire near the highway", "published_date": "2024-07-01 12:00:00",
+             "reporter_name": "Web", "state": "Nevada", "county": "Clark", "tags": "wildfire"} for i in range(count)]
+
+def test_bulk_upload_statements_do_not_grow_with_rows(budget):
+    small = budget("POST", "/api/fire-news/bulk-upload", max_statements=9, max_ms=250,
+                   json={"items": _items(1, "Bulk budget 1")})
+    large = budget("POST", "/api/fire-news/bulk-upload", max_statements=9, max_ms=500,
+                   json={"items": _items(50, "Bulk budget 50")})
+    assert large.count == small.count
+    assert large.response.json()["inserted"] == 50
+
+def test_bulk_upload_skips_duplicates(client):
+    items = _items(3, "Bulk duplicate")
+    client.post("/api/fire-news/bulk-upload", json={"items": items[:1]})
+    response = client.post("/api/fire-news/bulk-upload", json={"items": items + items[1:2]})
+    assert (response.json()["inserted"], response.json()["skipped"]) == (2, 2)
+
+def test_test_upload(budget):
+    budget("POST", "/api/fire-news/test-upload", max_statements=9, max_ms=250, json=_items(1, "Single budget")[0])
+
+def _csv(rows):
+    header = "title,content,published_date,state,county,tags\n"
+    body = "".join(f"Excel budget {rows} {i},Structure fire,2024-08-0{i % 9 + 1} 09:30:00,Texas,Harris,wildfire\n"
+                   for i in range(rows))
+    return {"file": ("budget.csv", io.BytesIO((header + body).encode()), "text/csv")}
+
+def test_process_excel_statements_do_not_grow_with_rows(budget):
+    # pandas loads lazily on the first upload; keep that one-off import out of the budget
+    import pandas  # noqa: F401
+    small = budget("POST", "/api/fire-news/process-excel", max_statements=9, max_ms=250,
+                   data={"reporter_name": "Web"}, files=_csv(1))
+    large = budget("POST", "/api/fire-news/process-excel", max_statements=9, max_ms=500,
+                   data={"reporter_name": "Web"}, files=_csv(50))
+    assert large.count == small.count
+
+def test_add_911_reporter(budget):
+    budget("POST", "/api/fire-news/add-911-reporter", max_statements=3, max_ms=250)
+
+def test_delete_all(budget):
+    # Last in the module: empties fire_news for the tests after it
+    budget("DELETE", "/api/fire-news/delete-all", max_statements=1, max_ms=500)
@@ -0,0 +1,154 @@
+"""
+Golden tests for the listing fast path (app/core/row_encoders.py, TracedJSONResponse).
+
+Each listing response is compared byte for byte with what the endpoints
+rendered before: ORM objects turned into dicts field by field, isoformat()
+on every datetime, serialized by Starlette's JSONResponse.
+"""
+
+import json
+from datetime import datetime
+import pytest
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+from app.core.responses import TracedJSONResponse
+from app.models.fire_news import FireNews
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+def legacy_fire_news_item(n):
+    return {
+        "id": n.id,
+        "title": n.title,
+        "content": n.content,
+        "published_date": _iso(n.published_date),
+        "url": n.url,
+        "source": n.source,
+        "fire_related_score": n.fire_related_score,
+        "verification_result": n.verification_result,
+        "verified_at": _iso(n.verified_at),
+        "state": n.state,
+        "county": n.county,
+        "city": n.city,
+        "province": n.province,
+        "country": n.country,
+        "latitude": n.latitude,
+        "longitude": n.longitude,
+        "image_url": n.image_url,
+        "tags": n.tags,
+        "reporter_name": n.reporter_name,
+        "is_verified": getattr(n, 'is_verified', False),
+        "is_hidden": getattr(n, 'is_hidden', False),
+        "created_at": _iso(n.created_at),
+        "updated_at": _iso(n.updated_at),
+    }
+
+def legacy_911_item(n):
+    return {
+        "id": n.id,
+        "title": n.title,
+        "incident_date": _iso(n.incident_date),
+        "station_name": n.station_name,
+        "city": n.city,
+        "county": n.county,
+        "address": n.address,
+        "context": n.context,
+        "verified_address": n.verified_address,
+        "latitude": n.latitude,
+        "longitude": n.longitude,
+        "address_accuracy_score": n.address_accuracy_score,
+        "reporter_name": n.reporter_name,
+        "incident_type": n.incident_type,
+        "priority_level": n.priority_level,
+        "response_time": n.response_time,
+        "units_dispatched": n.units_dispatched,
+        "status": n.status,
+        "notes": n.notes,
+        "is_verified": getattr(n, 'is_verified', False),
+        "is_hidden": getattr(n, 'is_hidden', False),
+        "created_at": _iso(n.created_at),
+        "updated_at": _iso(n.updated_at),
+    }
+
+def legacy_body(engine, payload, item):
+    """The old rendering of a listing page holding the same rows as payload"""
+    ids = [row["id"] for row in payload["items"]]
+    with Session(engine) as db:
+        news = {n.id: n for n in db.query(FireNews).filter(FireNews.id.in_(ids))}
+        items = [item(news[news_id]) for news_id in ids]
+    return JSONResponse({"total": payload["total"], "page": payload["page"],
+                         "page_size": payload["page_size"], "items": items}).body
+
+def assert_golden(client, engine, path, params, item=legacy_fire_news_item):
+    response = client.get(path, params=params)
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["items"], f"{path} {params} returned no rows to compare"
+    assert response.content == legacy_body(engine, payload, item)
+    assert response.headers["content-type"] == "application/json"
+
+# The seeded dataset has no Twitter bot rows; /tweet is covered by test_unusual_values_match_legacy_rendering
+LISTINGS = ["/api/fire-news", "/api/fire-news/all-leads", "/api/fire-news/web", "/api/fire-news/hidden", "/api/fire-news/others"]
+
+@pytest.mark.parametrize("params", [
+    {"page_size": 100},
+    {"page_size": 10, "page": 2, "sort_by": "title", "sort_order": "asc"},
+    {"page_size": 100, "state": "California", "start_date": "2024-03-01", "end_date": "2024-09-30"},
+], ids=["first-page", "sorted-page-2", "filtered"])
+@pytest.mark.parametrize("path", LISTINGS)
+def test_listing_matches_legacy_rendering(client, engine, path, params):
+    assert_golden(client, engine, path, params)
+
+@pytest.mark.parametrize("params", [
+    {"page_size": 100},
+    {"page_size": 50, "sort_by": "published_date", "sort_order": "asc"},
+], ids=["first-page", "by-published-date"])
+def test_911_listing_matches_legacy_rendering(client, engine, params):
+    assert_golden(client, engine, "/api/fire-news/911", params, legacy_911_item)
+
+def test_search_matches_legacy_rendering(client, engine):
+    assert_golden(client, engine, "/api/fire-news/search", {"title": "fire", "page_size": 100})
+
+@pytest.fixture
+def unusual_rows(engine):
+    """A fire news row and a 911 row with nulls, non-ASCII text and sub-second timestamps"""
+    marker = f"Golden {datetime.now().timestamp()}"
+    with Session(engine) as db:
+        rows = [
+            FireNews(title=f"{marker} été — \U0001F525 \"quoted\" </script>", content="line\nbreak\ttab \\ \u0000",
+                     data_type="fire_news", published_date=datetime(2024, 2, 29, 23, 59, 59, 123456),
+                     verified_at=datetime(2024, 3, 1, 0, 0, 0, 1), fire_related_score=0.1, latitude=37.7749,
+                     longitude=-122.4194, reporter_name="Twitter Fire Detection Bot", country=None, is_verified=True),
+            FireNews(title=f"{marker} 911", data_type="emergency_911", incident_date=datetime(2024, 5, 5, 5, 5, 5, 500000),
+                     station_name="Station № 7", response_time=0, address_accuracy_score=1.0, priority_level="high"),
+        ]
+        db.add_all(rows)
+        db.commit()
+        yield marker
+        for row in rows:
+            db.delete(row)
+        db.commit()
+
+def test_unusual_values_match_legacy_rendering(client, engine, unusual_rows):
+    assert_golden(client, engine, "/api/fire-news/search", {"title": unusual_rows})
+    assert_golden(client, engine, "/api/fire-news/tweet", {"search": unusual_rows})
+    assert_golden(client, engine, "/api/fire-news/911", {"search": unusual_rows}, legacy_911_item)
+
+def test_renderer_matches_starlette():
+    content = {"message": "café \U0001F525", "counts": {1: 2, "a": [True, False, None]}, "score": 0.8,
+               "nested": [{"id": 10, "ratio": 12.5, "neg": -3}], "empty": {}, "when": "2024-01-01T00:00:00"}
+    starlette_content = {**content, "counts": {"1": 2, "a": [True, False, None]}}
+    assert TracedJSONResponse(content).body == JSONResponse(starlette_content).body
+
+def test_renderer_exponent_floats_keep_their_value():
+    # The one documented difference: orjson writes exponents without '+' or leading zeros
+    content = {"values": [1e-05, 1e16, 2.5e-10]}
+    body = TracedJSONResponse(content).body
+    assert body == b'{"values":[0.00001,1e16,2.5e-10]}'
+    assert json.loads(body) == content
+
+def test_renderer_writes_datetimes_like_isoformat():
+    values = [datetime(2024, 1, 2, 3, 4, 5), datetime(2024, 1, 2, 3, 4, 5, 6)]
+    assert TracedJSONResponse(values).body == JSONResponse([value.isoformat() for value in values]).body
@@ -0,0 +1,123 @@
+"""Per-worker state shared through SHARED_STATE_DIR under gunicorn (app/core/shared_state.py)"""
+
+import os
+import json
+import pytest
+
+from app.core import metrics, shared_state
+from app.core.metrics import Registry, registry, render_metrics, mark_process_dead, write_worker_metrics
+from app.core.profiler import ProfileStore, RequestProfile
+from app.core.slow_queries import SlowQueryLog
+
+OTHER_PID = 999999
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_state, "SHARED_STATE_DIR", str(tmp_path))
+    return tmp_path
+
+def other_worker(state_dir, build):
+    """Publish the metrics of a fake second worker"""
+    other = Registry()
+    build(other)
+    os.makedirs(state_dir / "metrics", exist_ok=True)
+    with open(state_dir / "metrics" / f"{OTHER_PID}.json", "w") as f:
+        json.dump({"pid": OTHER_PID, "metrics": other.snapshot()}, f)
+
+def sample(text, line_prefix):
+    return [line for line in text.splitlines() if line.startswith(line_prefix)]
+
+def test_scrape_sums_all_workers(state_dir):
+    counter = registry.counter("test_shared_requests_total", "Test requests", ["route"])
+    histogram = registry.histogram("test_shared_seconds", "Test latency", ["route"], buckets=(0.1, 1.0))
+    gauge = registry.gauge("test_shared_in_flight", "Test in flight")
+    before = counter.value(route="/a")
+    counter.inc(2, route="/a")
+    histogram.observe(0.05, route="/a")
+
+    def build(other):
+        other.counter("test_shared_requests_total", "Test requests", ["route"]).inc(3, route="/a")
+        other.counter("test_shared_requests_total", "Test requests", ["route"]).inc(1, route="/b")
+        other.histogram("test_shared_seconds", "Test latency", ["route"], buckets=(0.1, 1.0)).observe(0.5, route="/a")
+        other.gauge("test_shared_in_flight", "Test in flight").set(4)
+    other_worker(state_dir, build)
+    gauge.set(1)
+
+    text = render_metrics()
+    assert f'test_shared_requests_total{{route="/a"}} {int(before) + 5}' in text
+    assert 'test_shared_requests_total{route="/b"} 1' in text
+    assert sample(text, 'test_shared_seconds_count{route="/a"}')[0].endswith(" 2")
+    assert 'test_shared_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert "test_shared_in_flight 5" in text
+    # The scrape published this worker too
+    assert (state_dir / "metrics" / f"{os.getpid()}.json").exists()
+
+def test_metrics_need_a_token_or_an_allowed_host(client, monkeypatch):
+    # The test client connects as "testclient", which isn't in METRICS_ALLOWED_HOSTS
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "")
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 403
+    monkeypatch.setattr(metrics, "METRICS_ALLOWED_HOSTS", {"testclient"})
+    assert client.get("/metrics").status_code == 200
+
+def test_exited_worker_keeps_counters_and_drops_gauges(state_dir):
+    registry.counter("test_exited_total", "Test")
+    registry.gauge("test_exited_gauge", "Test")
+    write_worker_metrics()
+
+    def build(other):
+        other.counter("test_exited_total", "Test").inc(7)
+        other.gauge("test_exited_gauge", "Test").set(3)
+    other_worker(state_dir, build)
+    mark_process_dead(OTHER_PID)
+
+    assert not (state_dir / "metrics" / f"{OTHER_PID}.json").exists()
+    text = render_metrics()
+    assert "test_exited_total 7" in text
+    assert not sample(text, "test_exited_gauge ")
+    # Folding is idempotent once the worker's file is gone
+    mark_process_dead(OTHER_PID)
+    assert "test_exited_total 7" in render_metrics()
+
+def test_profiles_are_visible_to_every_worker(state_dir):
+    recording, serving = ProfileStore(size=2), ProfileStore(size=2)
+    profiles = []
+    for index in range(3):
+        profile = RequestProfile(f"GET /api/fire-news/{index}")
+        profile.stacks["python;app/main.py:root"] += 3
+        profile.categories["python"] += 3
+        profile.duration_ms = 12.5
+        recording.add(profile)
+        os.utime(state_dir / "profiles" / f"{profile.id}.json", (index, index))
+        profiles.append(profile)
+
+    fetched = serving.get(profiles[-1].id)
+    assert fetched.folded() == profiles[-1].folded()
+    assert fetched.summary() == profiles[-1].summary()
+    # The oldest is pruned past the store size
+    assert serving.get(profiles[0].id) is None
+    assert [summary["id"] for summary in serving.summaries()] == [profiles[2].id, profiles[1].id]
+    assert serving.get("../metrics/archive") is None
+
+def test_slow_queries_merge_across_workers_and_clear_everywhere(state_dir):
+    log = SlowQueryLog(explain=False)
+    log.record(None, "SELECT 1", "SELECT ?", (1,), False, 0.5, "GET /a")
+    # The statement hook only queues the publish; this worker's entries are read from memory
+    os.makedirs(state_dir / "slow-queries", exist_ok=True)
+    with open(state_dir / "slow-queries" / f"{OTHER_PID}.json", "w") as f:
+        json.dump([{"id": 1, "worker": OTHER_PID, "recorded_at": "2000-01-01T00:00:00", "duration_ms": 900.0,
+                    "statement": "SELECT ?", "parameters": ["int"], "endpoint": "GET /b",
+                    "explain": None, "explain_error": None}], f)
+
+    entries = log.entries()
+    assert [entry["endpoint"] for entry in entries] == ["GET /a", "GET /b"]
+    assert entries[0]["worker"] == os.getpid()
+
+    log.archive_worker(OTHER_PID)
+    assert [entry["endpoint"] for entry in log.entries()] == ["GET /a", "GET /b"]
+
+    log.clear()
+    assert log.entries() == []
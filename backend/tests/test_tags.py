@@ -0,0 +1,53 @@
+"""Statement and latency budgets for the tag endpoints (app/routers/tags.py)"""
+
+import pytest
+
+@pytest.mark.parametrize("page_size", [1, 10, 100])
+def test_list_tags(budget, auth_headers, page_size):
+    budget("GET", "/api/tags", max_statements=3, max_ms=250, headers=auth_headers["user"], params={"page_size": page_size})
+
+def test_list_tags_filtered(budget, auth_headers):
+    budget("GET", "/api/tags", max_statements=3, max_ms=250, headers=auth_headers["user"],
+           params={"search": "fire", "category": "Fire Type", "is_active": "true", "page_size": 100})
+
+@pytest.mark.parametrize("limit", [1, 50])
+def test_search_tags(budget, auth_headers, limit):
+    budget("GET", "/api/tags/search", max_statements=2, max_ms=250, headers=auth_headers["user"], params={"q": "fire", "limit": limit})
+
+def test_categories(budget, auth_headers):
+    budget("GET", "/api/tags/categories", max_statements=2, max_ms=250, headers=auth_headers["user"])
+
+def test_create_update_delete_tag(budget, auth_headers):
+    headers = auth_headers["admin"]
+    created = budget("POST", "/api/tags", max_statements=4, max_ms=250, headers=headers,
+                     json={"name": "Budget Tag", "category": "Budget", "color": "#123456"})
+    tag_id = created.response.json()["id"]
+    budget("PUT", f"/api/tags/{tag_id}", max_statements=4, max_ms=250, headers=headers, json={"color": "#654321"})
+    budget("DELETE", f"/api/tags/{tag_id}", max_statements=3, max_ms=250, headers=headers)
+
+def test_fire_news_tags(budget):
+    budget("GET", "/api/fire-news/1/tags", max_statements=2, max_ms=250)
+
+@pytest.mark.parametrize("count", [1, 10])
+def test_assign_tags(budget, auth_headers, fire_news_id, count):
+    # One INSERT per link, the ORM adds them one by one
+    tag_ids = list(range(1, count + 1))
+    budget("POST", f"/api/fire-news/{fire_news_id}/tags", max_statements=4 + count, max_ms=250,
+           headers=auth_headers["reporter"], json=tag_ids)
+
+def test_remove_tags(budget, auth_headers, fire_news_id):
+    budget("DELETE", f"/api/fire-news/{fire_news_id}/tags", max_statements=2, max_ms=250, headers=auth_headers["reporter"])
+
+def test_portable_insert_ignore_skips_existing_names(engine):
+    # Dialects without an upsert clause (not MySQL, SQLite or PostgreSQL) take this path in insert_ignore
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import Session
+    from app.core.db import _insert_each_ignoring_conflicts
+    from app.models import Tag
+    with Session(engine) as db:
+        existing = db.scalar(select(Tag.name).limit(1))
+        before = db.scalar(select(func.count()).select_from(Tag))
+        _insert_each_ignoring_conflicts(db, Tag.__table__, [{"name": existing, "is_active": True},
+                                                             {"name": "portable insert ignore", "is_active": True}])
+        db.commit()
+        assert db.scalar(select(func.count()).select_from(Tag)) == before + 1
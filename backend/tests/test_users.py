@@ -0,0 +1,38 @@
+"""Statement and latency budgets for the user administration endpoints (app/routers/users.py)"""
+
+import pytest
+from sqlalchemy.orm import Session
+from tests.conftest import SEED_USERS
+
+@pytest.mark.parametrize("limit", [1, 100])
+def test_list_users(budget, auth_headers, limit):
+    budget("GET", "/admin/users", max_statements=2, max_ms=250, headers=auth_headers["admin"], params={"limit": limit})
+
+def test_user_stats(budget, auth_headers):
+    budget("GET", "/admin/users/stats", max_statements=2, max_ms=250, headers=auth_headers["admin"])
+
+def test_update_role(budget, auth_headers):
+    budget("PUT", f"/admin/users/{SEED_USERS - 1}/role", max_statements=5, max_ms=250, headers=auth_headers["admin"],
+           json={"role": "reporter"})
+
+def test_delete_user(budget, auth_headers, engine):
+    from app.models import User
+    with Session(engine) as db:
+        user = User(email="budget-delete@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+    budget("DELETE", f"/admin/users/{user_id}", max_statements=6, max_ms=250, headers=auth_headers["admin"])
+
+@pytest.mark.parametrize("limit", [1, 100])
+def test_activity_logs(budget, auth_headers, limit):
+    budget("GET", "/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"], params={"limit": limit})
+
+def test_activity_logs_filtered_next_page(budget, auth_headers):
+    params = {"limit": 10, "action_type": "news_uploaded", "start_date": "2024-01-01", "end_date": "2024-12-31"}
+    first = budget("GET", "/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"], params=params)
+    budget("GET", "/admin/activity-logs", max_statements=2, max_ms=250, headers=auth_headers["admin"],
+           params={**params, "cursor": first.response.headers["X-Next-Cursor"]})
+
+def test_activity_stats(budget, auth_headers):
+    budget("GET", "/admin/activity-logs/stats", max_statements=3, max_ms=250, headers=auth_headers["admin"])
@@ -8,6 +8,7 @@ if "%1"=="" goto usage
 
 if "%1"=="local" goto start_local
 if "%1"=="prod" goto start_prod
+if "%1"=="migrate-prod" goto migrate_prod
 if "%1"=="stop-local" goto stop_local
 if "%1"=="stop-prod" goto stop_prod
 if "%1"=="logs-local" goto logs_local
@@ -16,11 +17,12 @@ if "%1"=="status" goto status
 goto usage
 
 :usage
-echo Usage: %0 [local^|prod^|stop-local^|stop-prod^|logs-local^|logs-prod^|status]
+echo Usage: %0 [local^|prod^|migrate-prod^|stop-local^|stop-prod^|logs-local^|logs-prod^|status]
 echo.
 echo Commands:
 echo   local       - Start local development environment (ports 8000, 3000)
 echo   prod        - Start production environment (ports 9500, 3500)
+echo   migrate-prod - Apply database migrations to the production database
 echo   stop-local  - Stop local environment
 echo   stop-prod   - Stop production environment
 echo   logs-local  - Show local environment logs
@@ -41,14 +43,26 @@ goto end
 
 :start_prod
 echo 🚀 Starting production environment...
+docker-compose -f docker-compose.prod.yml build
 docker-compose -f docker-compose.prod.yml down
-docker-compose -f docker-compose.prod.yml up --build -d
+call :apply_migrations || goto end
+docker-compose -f docker-compose.prod.yml up -d
 echo ✅ Production environment started!
 echo 📱 Frontend: http://localhost:3500
 echo 🔧 Backend:  http://localhost:9500
 echo 🗄️  Database: localhost:33306
 goto end
 
+:migrate_prod
+call :apply_migrations
+goto end
+
+:apply_migrations
+echo 🗃️  Applying database migrations...
+docker-compose -f docker-compose.prod.yml up -d mysql
+docker-compose -f docker-compose.prod.yml run --rm --no-deps backend python migrate.py --wait 120
+exit /b %errorlevel%
+
 :stop_local
 echo 🛑 Stopping local environment...
 docker-compose down
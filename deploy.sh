@@ -14,6 +14,7 @@ show_usage() {
     echo "Commands:"
     echo "  local       - Start local development environment (ports 8000, 3000)"
     echo "  prod        - Start production environment (ports 9500, 3500)"
+    echo "  migrate-prod - Apply database migrations to the production database"
     echo "  stop-local  - Stop local environment"
     echo "  stop-prod   - Stop production environment"
     echo "  logs-local  - Show local environment logs"
@@ -46,14 +47,25 @@ start_local() {
 start_prod() {
     echo "🚀 Starting production environment..."
     check_docker
+    docker-compose -f docker-compose.prod.yml build
     docker-compose -f docker-compose.prod.yml down
-    docker-compose -f docker-compose.prod.yml up --build -d
+    migrate_prod
+    docker-compose -f docker-compose.prod.yml up -d
     echo "✅ Production environment started!"
     echo "📱 Frontend: http://localhost:3500"
     echo "🔧 Backend:  http://localhost:9500"
     echo "🗄️  Database: localhost:33306"
 }
 
+# Function to apply database migrations; the backend checks the schema at startup
+# but no longer migrates by itself in production
+migrate_prod() {
+    echo "🗃️  Applying database migrations..."
+    check_docker
+    docker-compose -f docker-compose.prod.yml up -d mysql
+    docker-compose -f docker-compose.prod.yml run --rm --no-deps backend python migrate.py --wait 120
+}
+
 # Function to stop local environment
 stop_local() {
     echo "🛑 Stopping local environment..."
@@ -99,6 +111,9 @@ case "$1" in
     "prod")
         start_prod
         ;;
+    "migrate-prod")
+        migrate_prod
+        ;;
     "stop-local")
         stop_local
         ;;
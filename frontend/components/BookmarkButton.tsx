@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { BookmarkIcon, BookmarkSlashIcon } from '@heroicons/react/24/outline';
 import api from '../lib/axios';
+import { getBookmarkStatus } from '../lib/bookmarkStatus';
 
 interface BookmarkButtonProps {
   newsId: number;
@@ -24,9 +25,9 @@ export default function BookmarkButton({
 
   const checkBookmarkStatus = async () => {
     try {
-      const response = await api.get(`/api/bookmarks/check/${newsId}?data_type=${dataType}`);
-      setIsBookmarked(response.data.is_bookmarked);
-      onBookmarkChange?.(response.data.is_bookmarked);
+      const bookmarked = (await getBookmarkStatus(newsId, dataType)) !== null;
+      setIsBookmarked(bookmarked);
+      onBookmarkChange?.(bookmarked);
     } catch (error) {
       console.error('Error checking bookmark status:', error);
     }
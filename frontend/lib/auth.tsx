@@ -29,6 +29,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
         .catch(() => {
           console.log('Auth failed, clearing token and user');
           localStorage.removeItem('token');
+          localStorage.removeItem('refresh_token');
           setUser(null);
         })
         .finally(() => setLoading(false));
@@ -42,18 +43,27 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
   const login = async (email: string, password: string) => {
     const res = await api.post('/auth/login', { email, password });
     localStorage.setItem('token', res.data.access_token);
+    localStorage.setItem('refresh_token', res.data.refresh_token);
     const me = await api.get('/auth/me');
     setUser(me.data);
   };
 
   const logout = () => {
+    const refreshToken = localStorage.getItem('refresh_token');
     localStorage.removeItem('token');
+    localStorage.removeItem('refresh_token');
     setUser(null);
-    // Redirect to landing page after logout
-    if (typeof window !== 'undefined') {
-      // Use window.location for a full page reload to ensure clean state
-      window.location.href = '/';
-    }
+    // End the server-side session before leaving the page; redirect even if that fails
+    const ended = refreshToken
+      ? api.post('/auth/logout', { refresh_token: refreshToken }).catch(() => {})
+      : Promise.resolve();
+    ended.finally(() => {
+      // Redirect to landing page after logout
+      if (typeof window !== 'undefined') {
+        // Use window.location for a full page reload to ensure clean state
+        window.location.href = '/';
+      }
+    });
   };
 
   return (
@@ -1,4 +1,4 @@
-import axios from 'axios';
+import axios, { AxiosError, InternalAxiosRequestConfig } from 'axios';
 
 const api = axios.create({
   baseURL: process.env.NEXT_PUBLIC_API_URL || 'http://localhost:9500',
@@ -15,4 +15,63 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
-export default api; 
\ No newline at end of file
+// One refresh at a time: concurrent 401s wait on the same request, since a
+// refresh token is single-use and rotated on every exchange.
+let refreshing: Promise<string | null> | null = null;
+
+export const refreshAccessToken = (): Promise<string | null> => {
+  if (!refreshing) {
+    const refreshToken = typeof window !== 'undefined' ? localStorage.getItem('refresh_token') : null;
+    refreshing = (refreshToken
+      ? axios
+          .post(`${api.defaults.baseURL}/auth/refresh`, { refresh_token: refreshToken })
+          .then((res) => {
+            localStorage.setItem('token', res.data.access_token);
+            localStorage.setItem('refresh_token', res.data.refresh_token);
+            return res.data.access_token as string;
+          })
+          .catch(() => {
+            // Another tab sharing this localStorage may have rotated the pair
+            // first; its replay of our old token is rejected, but the new pair
+            // it stored is good. Only a token that is still ours ends the session.
+            const stored = localStorage.getItem('refresh_token');
+            if (stored && stored !== refreshToken) {
+              return localStorage.getItem('token');
+            }
+            localStorage.removeItem('token');
+            localStorage.removeItem('refresh_token');
+            return null;
+          })
+      : Promise.resolve(null)
+    ).finally(() => {
+      refreshing = null;
+    });
+  }
+  return refreshing;
+};
+
+api.interceptors.response.use(
+  (response) => response,
+  async (error: AxiosError) => {
+    const config = error.config as (InternalAxiosRequestConfig & { _retried?: boolean }) | undefined;
+    const url = config?.url || '';
+    if (
+      error.response?.status !== 401 ||
+      !config ||
+      config._retried ||
+      url.includes('/auth/login') ||
+      url.includes('/auth/refresh')
+    ) {
+      return Promise.reject(error);
+    }
+    const token = await refreshAccessToken();
+    if (!token) {
+      return Promise.reject(error);
+    }
+    config._retried = true;
+    config.headers['Authorization'] = `Bearer ${token}`;
+    return api(config);
+  }
+);
+
+export default api;
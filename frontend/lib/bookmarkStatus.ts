@@ -0,0 +1,39 @@
+import api from './axios';
+
+// Bookmark checks requested during the same tick (one per rendered card) are
+// coalesced into a single POST /api/bookmarks/check per data type.
+type Pending = { resolve: (bookmarkId: number | null) => void; reject: (error: unknown) => void };
+
+const queues = new Map<string, Map<number, Pending[]>>();
+
+async function flush(dataType: string) {
+  const queue = queues.get(dataType);
+  queues.delete(dataType);
+  if (!queue) return;
+
+  const newsIds = Array.from(queue.keys());
+  try {
+    const response = await api.post('/api/bookmarks/check', { news_ids: newsIds, data_type: dataType });
+    const bookmarks: Record<string, number> = response.data.bookmarks || {};
+    queue.forEach((waiters, newsId) => {
+      const bookmarkId = bookmarks[newsId] ?? null;
+      waiters.forEach(w => w.resolve(bookmarkId));
+    });
+  } catch (error) {
+    queue.forEach(waiters => waiters.forEach(w => w.reject(error)));
+  }
+}
+
+export function getBookmarkStatus(newsId: number, dataType: string): Promise<number | null> {
+  return new Promise((resolve, reject) => {
+    let queue = queues.get(dataType);
+    if (!queue) {
+      queue = new Map();
+      queues.set(dataType, queue);
+      setTimeout(() => flush(dataType), 0);
+    }
+    const waiters = queue.get(newsId) || [];
+    waiters.push({ resolve, reject });
+    queue.set(newsId, waiters);
+  });
+}
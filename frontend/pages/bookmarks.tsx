@@ -43,6 +43,9 @@ import SearchFilters from '../components/SearchFilters';
 import DateFilters from '../components/DateFilters';
 import TagFilter from '../components/TagFilter';
 
+// Bookmarks fetched per request; the rest follow X-Next-Cursor when the user asks for more
+const BOOKMARK_PAGE_SIZE = 50;
+
 interface Tag {
   id: number;
   name: string;
@@ -369,16 +372,22 @@ export default function BookmarksPage() {
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc');
   const [currentPage, setCurrentPage] = useState(1);
   const [pageSize] = useState(20);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchBookmarks();
   }, [activeTab]);
 
+  // The API pages by cursor: the first page loads with the tab, later pages only on "Load more"
   const fetchBookmarks = async () => {
     try {
       setLoading(true);
-      const response = await api.get(`/api/bookmarks/?data_type=${activeTab}`);
+      const response = await api.get('/api/bookmarks/', {
+        params: { data_type: activeTab, limit: BOOKMARK_PAGE_SIZE }
+      });
       setBookmarks(response.data);
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching bookmarks:', error);
     } finally {
@@ -386,6 +395,31 @@ export default function BookmarksPage() {
     }
   };
 
+  const loadMoreBookmarks = async () => {
+    if (!nextCursor || loadingMore) return;
+    try {
+      setLoadingMore(true);
+      const response = await api.get('/api/bookmarks/', {
+        params: { data_type: activeTab, limit: BOOKMARK_PAGE_SIZE, cursor: nextCursor }
+      });
+      setBookmarks(prev => [...prev, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (error) {
+      console.error('Error loading more bookmarks:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // Updates below edit the loaded pages in place rather than refetching, which would drop every page after the first
+  const removeBookmarks = (ids: number[]) => {
+    setBookmarks(prev => prev.filter(b => !ids.includes(b.id)));
+  };
+
+  const updateBookmarkNews = (id: number, changes: any) => {
+    setBookmarks(prev => prev.map(b => (b.id === id ? { ...b, news: { ...b.news, ...changes } } : b)));
+  };
+
   const handleTabChange = (tab: string) => {
     setActiveTab(tab);
     setSelectedIds([]);
@@ -436,7 +470,7 @@ export default function BookmarksPage() {
     if (entryToDelete) {
       try {
         await api.delete(`/api/bookmarks/${entryToDelete}`);
-        await fetchBookmarks();
+        removeBookmarks([entryToDelete]);
         setSelectedIds(prev => prev.filter(id => id !== entryToDelete));
       } catch (error) {
         console.error('Error deleting bookmark:', error);
@@ -454,7 +488,7 @@ export default function BookmarksPage() {
           ...bookmark.news,
           is_verified: !bookmark.news.is_verified
         });
-        await fetchBookmarks();
+        updateBookmarkNews(id, { is_verified: !bookmark.news.is_verified });
       }
     } catch (error) {
       console.error('Error toggling verification:', error);
@@ -469,7 +503,7 @@ export default function BookmarksPage() {
           ...bookmark.news,
           is_hidden: !bookmark.news.is_hidden
         });
-        await fetchBookmarks();
+        updateBookmarkNews(id, { is_hidden: !bookmark.news.is_hidden });
       }
     } catch (error) {
       console.error('Error toggling hidden status:', error);
@@ -477,14 +511,17 @@ export default function BookmarksPage() {
   };
 
   const handleBulkDelete = async () => {
+    const deleted: number[] = [];
     try {
       for (const id of selectedIds) {
         await api.delete(`/api/bookmarks/${id}`);
+        deleted.push(id);
       }
-      await fetchBookmarks();
       setSelectedIds([]);
     } catch (error) {
       console.error('Error bulk deleting bookmarks:', error);
+    } finally {
+      removeBookmarks(deleted);
     }
   };
 
@@ -675,6 +712,19 @@ export default function BookmarksPage() {
                   />
                 </div>
               )}
+
+              {nextCursor && (
+                <div className="mt-6 flex justify-center">
+                  <button
+                    onClick={loadMoreBookmarks}
+                    disabled={loadingMore}
+                    className="px-4 py-2 rounded-lg border border-theme-border bg-theme-card text-theme-primary hover:bg-theme-background transition-colors flex items-center gap-2 disabled:opacity-50"
+                  >
+                    <FiRotateCw className={`h-4 w-4 ${loadingMore ? 'animate-spin' : ''}`} />
+                    {loadingMore ? 'Loading...' : 'Load more bookmarks'}
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>